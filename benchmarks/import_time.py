@@ -0,0 +1,58 @@
+"""
+Cold-start guard: import each entry point in a fresh interpreter and fail when it
+exceeds its time budget or pulls in modules it should only load lazily.
+
+Usage: python benchmarks/import_time.py [--runs N]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+
+# module -> (budget in seconds, modules that must not be imported eagerly)
+IMPORT_BUDGETS = {
+    'cv_maker_tool': (0.5, ['reportlab', 'langchain_openai', 'langgraph']),
+    'health_check': (1.0, ['reportlab', 'langchain_openai', 'langgraph', 'chainlit']),
+    'chatbot': (5.0, ['reportlab', 'langchain_openai', 'langgraph', 'langchain_community']),
+}
+
+PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - started
+print(json.dumps({{"elapsed": elapsed, "loaded": [name for name in {forbidden!r} if name in sys.modules]}}))
+"""
+
+
+def measure(module: str, forbidden: list) -> dict:
+    result = subprocess.run(
+        [sys.executable, '-c', PROBE.format(module=module, forbidden=forbidden)],
+        cwd=SRC_DIR, capture_output=True, text=True, check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=3, help='Fresh interpreters per module; the fastest run counts')
+    args = parser.parse_args()
+
+    failed = False
+    for module, (budget, forbidden) in IMPORT_BUDGETS.items():
+        runs = [measure(module, forbidden) for _ in range(args.runs)]
+        best = min(run['elapsed'] for run in runs)
+        loaded = sorted(set(name for run in runs for name in run['loaded']))
+        ok = best <= budget and not loaded
+        failed = failed or not ok
+        status = 'ok' if ok else 'FAIL'
+        print(f"{status:4} {module:15} {best * 1000:7.0f} ms (budget {budget * 1000:.0f} ms)"
+              + (f", eagerly imports {', '.join(loaded)}" if loaded else ''))
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,85 @@
+"""
+Cost of re-rendering a resume after a one-bullet edit, with and without the
+section layout cache. The cached path follows a chat session: the edit is diffed
+against the previous version and only the changed sections are recorded again.
+
+Usage: python benchmarks/incremental_render.py [--repeat N]
+"""
+import argparse
+import os
+import sys
+import time
+
+from synthetic_resume import ResumeProfile, synthetic_resume
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+
+PROFILES = {
+    'typical': ResumeProfile(companies=4, positions=2, bullets=4, skills=5, projects=2),
+    'huge': ResumeProfile(companies=20, positions=3, bullets=8, skills=16, projects=10, text_length=2.0),
+}
+
+
+def edit_bullet(resume_data, version: int):
+    """Copy of the resume with the last bullet of the first company reworded."""
+    experience = [company.model_copy(deep=True) for company in resume_data.experience]
+    experience[0].description[-1] = f"Reworded achievement, revision {version}."
+    return resume_data.model_copy(update={'experience': experience})
+
+
+def clear_memos() -> None:
+    from rendering.paragraphs import parsed_paragraphs, wrapped_paragraphs
+    from rendering.section_cache import clear_layout_cache
+
+    clear_layout_cache()
+    parsed_paragraphs.clear()
+    wrapped_paragraphs.clear()
+
+
+def time_edits(resume_data, repeat: int, cached: bool, render: bool) -> float:
+    from rendering.document import build_resume_table, render_resume_bytes
+    from rendering.resume_diff import diff_resume
+    from sections.fragments import refresh_fragments
+
+    previous = resume_data
+    fragments = refresh_fragments(resume_data, None, ())
+    build_resume_table(resume_data, fragments=fragments)
+    best = float('inf')
+    for version in range(repeat):
+        edited = edit_bullet(resume_data, version)
+        if not cached:
+            clear_memos()
+        started = time.perf_counter()
+        if cached:
+            fragments = refresh_fragments(edited, fragments, diff_resume(previous, edited).changed)
+        else:
+            fragments = None
+        if render:
+            render_resume_bytes(edited, fragments=fragments)
+        else:
+            build_resume_table(edited, fragments=fragments)
+        best = min(best, time.perf_counter() - started)
+        previous = edited
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=20, help='Edits per measurement; the fastest counts')
+    args = parser.parse_args()
+
+    os.chdir(SRC_DIR)
+    sys.path.insert(0, SRC_DIR)
+
+    print(f"{'profile':8} {'table cold ms':>13} {'table cached ms':>15} {'render cold ms':>14} {'render cached ms':>16}")
+    for name, profile in PROFILES.items():
+        resume_data = synthetic_resume(profile)
+        timings = [
+            time_edits(resume_data, args.repeat, cached, render) * 1000
+            for render in (False, True) for cached in (False, True)
+        ]
+        print(f"{name:8} {timings[0]:>13.2f} {timings[1]:>15.2f} {timings[2]:>14.1f} {timings[3]:>16.1f}")
+
+
+if __name__ == '__main__':
+    main()
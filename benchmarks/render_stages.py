@@ -0,0 +1,181 @@
+"""
+Per-stage render benchmark with stored baselines.
+
+Times the stages of create_resume_pdf separately for synthetic resumes of
+increasing size: validation, adapter/table build, TableStyle (Table + setStyle),
+PDF build and file write. Every run starts with empty paragraph and section
+layout memos, so the timings are those of a resume the process has not seen
+before. Peak traced memory is measured on a separate, untimed pass. Results
+are compared with benchmarks/baselines/render_stages.json: a profile whose
+throughput drops, stage slows down or peak memory grows by more than the
+tolerance is reported as a regression and the script exits with 1.
+
+Baselines are machine-specific; record new ones with --update-baseline after
+an intentional change or on a new benchmark machine.
+
+Usage: python benchmarks/render_stages.py [--repeat N] [--profile NAME] [--tolerance 0.25] [--update-baseline]
+"""
+import argparse
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from synthetic_resume import ResumeProfile, synthetic_resume_dict
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baselines', 'render_stages.json')
+
+PROFILES = {
+    'small': ResumeProfile(companies=2, positions=1, bullets=3, skills=3),
+    'typical': ResumeProfile(companies=4, positions=2, bullets=4, skills=5, projects=2),
+    'large': ResumeProfile(companies=8, positions=3, bullets=6, skills=8, projects=4, text_length=1.5),
+    'huge': ResumeProfile(companies=20, positions=3, bullets=8, skills=16, projects=10, text_length=2.0),
+}
+STAGES = ('validation', 'table_build', 'table_style', 'pdf_build', 'file_write')
+# Stage slowdowns below this many milliseconds are treated as noise
+NOISE_FLOOR_MS = 0.5
+
+
+def clear_memos() -> None:
+    """Forget parsed and wrapped paragraphs and laid-out sections from earlier runs."""
+    from rendering.paragraphs import parsed_paragraphs, wrapped_paragraphs
+    from rendering.section_cache import clear_layout_cache
+
+    clear_layout_cache()
+    parsed_paragraphs.clear()
+    wrapped_paragraphs.clear()
+
+
+def run_pipeline(data: dict, output_dir: str, timings: dict = None) -> None:
+    """One create_resume_pdf equivalent, split into stages; appends seconds per stage to `timings`."""
+    from reportlab.lib.pagesizes import A4
+    from reportlab.platypus import SimpleDocTemplate
+    from models.resume_models import ResumeData
+    from rendering.document import PAGE_MARGINS, build_resume_table, make_resume_table
+
+    def mark(stage: str, started: float) -> float:
+        now = time.perf_counter()
+        if timings is not None:
+            timings[stage].append(now - started)
+        return now
+
+    started = time.perf_counter()
+    resume_data = ResumeData(**data)
+    started = mark('validation', started)
+    rows, commands = build_resume_table(resume_data)
+    started = mark('table_build', started)
+    table = make_resume_table(rows, commands)
+    started = mark('table_style', started)
+    buffer = io.BytesIO()
+    author = resume_data.header.name
+    SimpleDocTemplate(buffer, pagesize=A4, title=f"Resume of {author}", author=author, invariant=1, **PAGE_MARGINS).build([table])
+    started = mark('pdf_build', started)
+    name = resume_data.get_output_filename()
+    with open(os.path.join(output_dir, f'{name}.json'), 'w') as f:
+        f.write(resume_data.model_dump_json(indent=4))
+    with open(os.path.join(output_dir, f'{name}.pdf'), 'wb') as f:
+        f.write(buffer.getvalue())
+    mark('file_write', started)
+
+
+def benchmark_profile(profile: ResumeProfile, repeat: int, output_dir: str) -> dict:
+    """Fastest milliseconds per stage, throughput and peak memory of one profile."""
+    data = synthetic_resume_dict(profile)
+    # Warm-up: fonts, style sheets and module imports are one-off costs
+    run_pipeline(data, output_dir)
+
+    timings = {stage: [] for stage in STAGES}
+    for _ in range(repeat):
+        clear_memos()
+        run_pipeline(data, output_dir, timings)
+
+    clear_memos()
+    tracemalloc.start()
+    run_pipeline(data, output_dir)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    stages = {stage: min(values) * 1000 for stage, values in timings.items()}
+    total = sum(stages.values())
+    return {
+        'stages_ms': {stage: round(value, 3) for stage, value in stages.items()},
+        'total_ms': round(total, 3),
+        'renders_per_second': round(1000 / total, 2),
+        'peak_kib': round(peak / 1024, 1),
+    }
+
+
+def compare(name: str, result: dict, baseline: dict, tolerance: float) -> list:
+    """Regressions of `result` against `baseline`, as printable strings."""
+    regressions = []
+    if result['renders_per_second'] < baseline['renders_per_second'] * (1 - tolerance):
+        regressions.append(f"{name}: throughput {result['renders_per_second']}/s, baseline {baseline['renders_per_second']}/s")
+    for stage, value in result['stages_ms'].items():
+        before = baseline['stages_ms'].get(stage)
+        if before is not None and value > before * (1 + tolerance) and value - before > NOISE_FLOOR_MS:
+            regressions.append(f"{name}: {stage} {value:.1f} ms, baseline {before:.1f} ms")
+    if result['peak_kib'] > baseline['peak_kib'] * (1 + tolerance):
+        regressions.append(f"{name}: peak memory {result['peak_kib']:.0f} KiB, baseline {baseline['peak_kib']:.0f} KiB")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=10, help='Timed runs per profile; the fastest run of each stage counts')
+    parser.add_argument('--profile', action='append', choices=sorted(PROFILES), help='Profiles to run (default: all)')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='Allowed relative slowdown before flagging a regression')
+    parser.add_argument('--baseline', default=BASELINE_PATH, help='Baseline file to compare with or update')
+    parser.add_argument('--update-baseline', action='store_true', help='Store these results as the new baseline')
+    args = parser.parse_args()
+
+    os.chdir(SRC_DIR)
+    sys.path.insert(0, SRC_DIR)
+
+    names = args.profile or list(PROFILES)
+    results = {}
+    print(f"{'profile':8} " + ' '.join(f'{stage:>11}' for stage in STAGES) + f" {'total ms':>9} {'renders/s':>9} {'peak KiB':>9}")
+    with tempfile.TemporaryDirectory() as output_dir:
+        for name in names:
+            result = benchmark_profile(PROFILES[name], args.repeat, output_dir)
+            results[name] = result
+            print(f"{name:8} " + ' '.join(f"{result['stages_ms'][stage]:>11.2f}" for stage in STAGES)
+                  + f" {result['total_ms']:>9.2f} {result['renders_per_second']:>9.1f} {result['peak_kib']:>9.0f}")
+
+    if args.update_baseline:
+        stored = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as f:
+                stored = json.load(f)
+        stored.setdefault('profiles', {}).update(results)
+        stored['machine'] = f"{platform.machine()} {platform.processor() or ''} Python {platform.python_version()}".replace('  ', ' ')
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, 'w') as f:
+            json.dump(stored, f, indent=4)
+            f.write('\n')
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("No baseline to compare with; run with --update-baseline to record one")
+        return 0
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions = [
+        regression
+        for name, result in results.items() if name in baseline.get('profiles', {})
+        for regression in compare(name, result, baseline['profiles'][name], args.tolerance)
+    ]
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if not regressions:
+        print(f"No regressions against the baseline (tolerance {args.tolerance:.0%}, recorded on {baseline.get('machine', 'unknown')})")
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
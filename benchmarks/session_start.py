@@ -0,0 +1,66 @@
+"""
+Session-start latency and memory per session: compiling a ReAct agent for every
+chat (the previous start()) versus reusing the shared compiled agent.
+
+Runs offline: the chat model is constructed with placeholder Azure settings and
+never called.
+
+Usage: python benchmarks/session_start.py [--sessions N]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+
+
+def start_sessions(start_session, sessions: int) -> tuple[list, int]:
+    """Start `sessions` sessions, keeping them alive; return per-start seconds and retained bytes."""
+    alive = []
+    timings = []
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    for _ in range(sessions):
+        started = time.perf_counter()
+        alive.append(start_session())
+        timings.append(time.perf_counter() - started)
+    retained = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    return timings, retained
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sessions', type=int, default=20, help='Sessions to start per variant')
+    args = parser.parse_args()
+
+    os.environ.setdefault('AZURE_OPENAI_API_KEY', 'benchmark')
+    os.environ.setdefault('AZURE_OPENAI_ENDPOINT', 'https://benchmark.openai.azure.com/')
+    os.environ.setdefault('AZURE_OPENAI_API_VERSION', '2025-01-01-preview')
+    os.chdir(SRC_DIR)
+    sys.path.insert(0, SRC_DIR)
+    from langgraph.checkpoint.memory import MemorySaver
+    from langgraph.prebuilt import create_react_agent
+    import chatbot
+
+    # Warm the model and imports so neither variant pays for them
+    chatbot.get_model()
+
+    def per_session_agent():
+        return create_react_agent(
+            chatbot.get_model(), tools=chatbot.AGENT_TOOLS, checkpointer=MemorySaver(), prompt=chatbot.AGENT_PROMPT
+        )
+
+    variants = {'per-session compile': per_session_agent, 'shared agent': chatbot.get_agent}
+    print(f"{'variant':<20} {'first ms':>9} {'median ms':>10} {'KiB/session':>12}")
+    for name, start_session in variants.items():
+        timings, retained = start_sessions(start_session, args.sessions)
+        print(f"{name:<20} {timings[0] * 1000:>9.1f} {statistics.median(timings) * 1000:>10.2f} "
+              f"{retained / args.sessions / 1024:>12.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+"""
+Deterministic synthetic resumes for benchmarks.
+
+Every size knob (companies, positions per company, bullets per company, skill
+groups, projects) and the text length scale independently; the same arguments
+and seed always produce the same resume.
+
+Usage: python benchmarks/synthetic_resume.py --companies 8 --bullets 6 > resume.json
+"""
+import argparse
+import json
+import random
+from dataclasses import asdict, dataclass
+
+WORDS = (
+    "designed built led migrated reduced improved automated delivered scaled launched owned mentored "
+    "platform pipeline service latency throughput reliability customers revenue costs team roadmap "
+    "analytics infrastructure deployment monitoring search payments onboarding checkout api data "
+    "distributed realtime batch internal external cross-functional quarterly annual global regional "
+    "python kubernetes postgres kafka terraform react typescript airflow spark aws azure gcp"
+).split()
+SKILL_WORDS = (
+    "Python Go Rust Java TypeScript SQL Kubernetes Docker Terraform Kafka Spark Airflow PostgreSQL "
+    "Redis React GraphQL gRPC AWS Azure GCP Linux Prometheus Grafana Pandas PyTorch"
+).split()
+# Words per bullet and per project description at text_length=1.0
+BULLET_WORDS = 22
+PROJECT_WORDS = 30
+
+
+@dataclass(frozen=True)
+class ResumeProfile:
+    """Size of a synthetic resume."""
+    companies: int = 3
+    positions: int = 1
+    bullets: int = 3
+    skills: int = 4
+    skill_elements: int = 6
+    projects: int = 0
+    education: int = 1
+    text_length: float = 1.0
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    text = " ".join(rng.choice(WORDS) for _ in range(max(1, words)))
+    return f"{text[0].upper()}{text[1:]} by {rng.randint(5, 95)}%."
+
+
+def synthetic_resume_dict(profile: ResumeProfile = ResumeProfile(), seed: int = 0) -> dict:
+    """Build resume data shaped like ResumeData.model_dump() for `profile`."""
+    rng = random.Random(seed)
+    bullet_words = round(BULLET_WORDS * profile.text_length)
+    year = 2024
+    experience = []
+    for company in range(profile.companies):
+        positions = []
+        for position in range(profile.positions):
+            start = year - rng.randint(1, 3)
+            positions.append({"title": f"Senior Engineer {company}.{position}", "start_date": str(start), "end_date": str(year)})
+            year = start
+        experience.append({
+            "company": f"Company {company} {rng.choice(WORDS).title()}",
+            "location": f"City {rng.randint(1, 50)}",
+            "description": [_sentence(rng, bullet_words) for _ in range(profile.bullets)],
+            "positions": positions,
+        })
+    return {
+        "header": {
+            "name": "Synthetic Candidate",
+            "email": "candidate@example.com",
+            "phone": "+1 555 0100",
+            "address": "1 Example Street, Springfield",
+            "linkedin": "linkedin.com/in/synthetic",
+        },
+        "education": [
+            {
+                "institution": f"University {index}",
+                "course": f"MSc {rng.choice(WORDS).title()} Engineering",
+                "location": f"City {rng.randint(1, 50)}",
+                "start_date": str(year - 4 * (index + 1)),
+                "end_date": str(year - 4 * index),
+            }
+            for index in range(profile.education)
+        ],
+        "experience": experience,
+        "projects": [
+            {
+                "title": f"Project {index}",
+                "description": _sentence(rng, round(PROJECT_WORDS * profile.text_length)),
+                "link": f"https://example.com/project-{index}",
+            }
+            for index in range(profile.projects)
+        ],
+        "skills": [
+            {"title": f"Skills {index}", "elements": rng.sample(SKILL_WORDS, min(profile.skill_elements, len(SKILL_WORDS)))}
+            for index in range(profile.skills)
+        ],
+    }
+
+
+def synthetic_resume(profile: ResumeProfile = ResumeProfile(), seed: int = 0):
+    """Validated ResumeData for `profile`; requires src/ on sys.path."""
+    from models.resume_models import ResumeData
+    return ResumeData(**synthetic_resume_dict(profile, seed))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    defaults = ResumeProfile()
+    for name, value in asdict(defaults).items():
+        parser.add_argument(f"--{name.replace('_', '-')}", type=type(value), default=value)
+    parser.add_argument('--seed', type=int, default=0)
+    args = vars(parser.parse_args())
+    seed = args.pop('seed')
+    print(json.dumps(synthetic_resume_dict(ResumeProfile(**args), seed), indent=4))
+
+
+if __name__ == '__main__':
+    main()
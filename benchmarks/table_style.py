@@ -0,0 +1,61 @@
+"""
+Compare per-row and coalesced TableStyle command lists as the resume grows.
+
+Usage: python benchmarks/table_style.py [--repeat N]
+"""
+import argparse
+import os
+import sys
+import time
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+EXAMPLE_PATH = os.path.join(os.path.dirname(SRC_DIR), 'examples', 'tarrant_hightopp_cv.json')
+
+
+def scaled_resume(resume_data, factor: int):
+    """Repeat the example's experience and skills `factor` times."""
+    return resume_data.model_copy(update={
+        'experience': resume_data.experience * factor,
+        'skills': resume_data.skills * factor,
+    })
+
+
+def time_table(rows: list, commands: list, repeat: int) -> float:
+    from reportlab.platypus import Table, TableStyle
+    from constants import FULL_COLUMN_WIDTH
+
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        table = Table(rows, colWidths=[FULL_COLUMN_WIDTH * 0.7, FULL_COLUMN_WIDTH * 0.3])
+        table.setStyle(TableStyle(commands))
+        table.wrap(FULL_COLUMN_WIDTH, 10 ** 6)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=5, help='Timed repetitions per size; the fastest counts')
+    args = parser.parse_args()
+
+    os.chdir(SRC_DIR)
+    sys.path.insert(0, SRC_DIR)
+    from models.resume_models import ResumeData
+    from rendering.document import build_resume_table
+    from constants.table_style import TableStyleBuilder
+
+    example = ResumeData.from_file(EXAMPLE_PATH)
+    print(f"{'factor':>6} {'rows':>6} {'per-row cmds':>12} {'coalesced':>10} {'per-row ms':>11} {'coalesced ms':>13}")
+    for factor in (1, 4, 16, 64):
+        builder = TableStyleBuilder()
+        rows, _ = build_resume_table(scaled_resume(example, factor), style_builder=builder)
+        raw = builder.build(coalesce=False)
+        merged = builder.build()
+        raw_time = time_table(rows, raw, args.repeat)
+        merged_time = time_table(rows, merged, args.repeat)
+        print(f"{factor:>6} {len(rows):>6} {len(raw):>12} {len(merged):>10} {raw_time * 1000:>11.1f} {merged_time * 1000:>13.1f}")
+
+
+if __name__ == '__main__':
+    main()
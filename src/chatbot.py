@@ -1,29 +1,125 @@
+import asyncio
+import json
+import logging
 import os
 import textwrap
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
 
 import chainlit as cl
 from dotenv import load_dotenv
-from langchain_community.document_loaders import PyMuPDFLoader, TextLoader
 
+from langchain_core.messages import HumanMessage
+from langchain_core.runnables import RunnableConfig
 from langchain_core.tools import tool
-from langchain_openai import AzureChatOpenAI
-from langgraph.checkpoint.memory import MemorySaver
-from langgraph.graph.state import CompiledStateGraph
-from langgraph.prebuilt import create_react_agent
-from langchain.schema.runnable.config import RunnableConfig
 # from langgraph.types import StateSnapshot
 
-from cv_maker_tool import create_resume_pdf
+from cv_maker_tool import fit_resume_pdf, measure_resume, save_resume_files
+from ingestion import CondensedContext, get_document_ingestor, load_token_encoding, new_condensed_context
+from llm import ModelOverloaded, current_cache_partition, current_client
 from models.resume_models import ResumeData
+from models.resume_patch import PatchOperation, ResumePatchError, apply_resume_patch
+from rendering import diff_resume, get_render_client, render_affinity
+from sections.fragments import refresh_fragments
+from storage import safe_name, start_output_gc
+from tailoring import TAILORING_TAG, JobTarget
+from telemetry import bind_log_context, configure_logging, log_event, record_span, span
+
+if TYPE_CHECKING:
+    from langchain_openai import AzureChatOpenAI
+    from langgraph.graph.state import CompiledStateGraph
 
 load_dotenv("../dev.env")
+configure_logging()
+
+
+@lru_cache(maxsize=1)
+def get_model() -> "AzureChatOpenAI":
+    """Create the shared chat model on first use so importing this module stays cheap."""
+    from langchain_openai import AzureChatOpenAI
+    from llm import get_response_cache, scheduled_chat_model
+
+    # Calls are admitted by the process-wide scheduler, which also owns retries and backoff
+    return scheduled_chat_model(AzureChatOpenAI)(
+        azure_deployment=os.getenv("AZURE_OPENAI_MODEL", "gpt-4o"),
+        azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT"),
+        api_version=os.getenv("AZURE_OPENAI_API_VERSION"),
+        max_retries=0,
+        # Identical requests (same conversation, tools and deployment) are answered locally
+        cache=get_response_cache(),
+    )
+
 
-model = AzureChatOpenAI(
-    azure_deployment=os.getenv("AZURE_OPENAI_MODEL", "gpt-4o"),
-    azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT"),
-    api_version=os.getenv("AZURE_OPENAI_API_VERSION")
-)
+# Model calls are queued fairly per "session" or per "user"
+LLM_FAIR_SHARE = os.getenv("LLM_FAIR_SHARE", "session").lower()
 
+# Cached model responses are kept per user (per session without login) unless sharing them is enabled
+LLM_CACHE_SHARED = os.getenv("LLM_CACHE_SHARED", "false").lower() in ("1", "true", "yes")
+
+# Write generated resumes to ../output/ as well as keeping them in memory
+PERSIST_OUTPUT = os.getenv("PERSIST_OUTPUT", "false").lower() in ("1", "true", "yes")
+# PDFs kept in memory per session for download_link; the least recently stored are dropped first
+SESSION_PDFS = int(os.getenv("SESSION_PDFS", 8))
+
+
+async def render_fitted_pdf(resume_data: ResumeData, fragments: Optional[dict] = None) -> tuple[bytes, str]:
+    """
+    Render the resume scaled to one page, on the render service when RENDER_SERVICE_URL is set; returns the PDF and the fit summary.
+
+    `fragments` are the section recordings kept by publish_resume; the render service records its own.
+    """
+    client = get_render_client()
+    if client is not None:
+        rendered = await client.render(resume_data, fit_one_page=True)
+        return rendered.pdf_bytes, rendered.fit_summary
+    pdf_bytes, fit = await fit_resume_pdf(resume_data, fragments)
+    return pdf_bytes, fit.describe()
+
+async def store_pdf(resume_data: ResumeData, pdf_bytes: bytes, name: Optional[str] = None) -> str:
+    """Keep a rendered PDF in the session (and in the output store when PERSIST_OUTPUT is set) and return its path."""
+    if PERSIST_OUTPUT:
+        # Saved under the session's own directory with a content-hash name, so sessions never overwrite each other
+        filepath = await cl.make_async(save_resume_files)(resume_data, pdf_bytes, name, scope=cl.context.session.id)
+    else:
+        filepath = f"{name or resume_data.get_output_filename()}.pdf"
+    # Keep the latest rendered bytes in the session so download_link can attach them directly
+    generated_pdfs: OrderedDict = cl.user_session.get("generated_pdfs") or OrderedDict()
+    filename = os.path.basename(filepath)
+    generated_pdfs.pop(filename, None)
+    generated_pdfs[filename] = pdf_bytes
+    while len(generated_pdfs) > max(SESSION_PDFS, 1):
+        generated_pdfs.popitem(last=False)
+    cl.user_session.set("generated_pdfs", generated_pdfs)
+    return filepath
+
+async def publish_resume(resume_data: ResumeData) -> str:
+    """Render the resume PDF, keep it in the session for download_link and describe the result."""
+    # Only the sections the edit touched are recorded again; the rest keep their fragments,
+    # and the session's render worker (see render_affinity) still has their layouts cached
+    previous, fragments = cl.user_session.get("last_render") or (None, None)
+    changes = diff_resume(previous, resume_data)
+    fragments = refresh_fragments(resume_data, fragments, changes.changed)
+    cl.user_session.set("last_render", (resume_data, fragments))
+    log_event("resume_changed", sections=list(changes.changed))
+    # Scale the layout to one page where possible and tell the agent if content still overflows
+    pdf_bytes, fit_summary = await render_fitted_pdf(resume_data, fragments)
+    filepath = await store_pdf(resume_data, pdf_bytes)
+    return f"Resume successfully created and saved to: {filepath}. {fit_summary}"
+
+async def show_preview(resume_data: ResumeData) -> None:
+    """Post the plain-text preview of the resume with its HTML version attached."""
+    # Imported on first use; it builds from the models alone and needs no ReportLab styles
+    from rendering.preview import render_resume_html, render_resume_text
+
+    text = render_resume_text(resume_data)
+    html_preview = cl.File(
+        name=f"{resume_data.get_output_filename()}_preview.html",
+        content=render_resume_html(resume_data).encode("utf-8"),
+        mime="text/html",
+    )
+    await cl.Message(content=f"```text\n{text}```", elements=[html_preview]).send()
 
 @tool
 async def generate_resume(resume_data: ResumeData) -> str:
@@ -34,14 +130,134 @@ async def generate_resume(resume_data: ResumeData) -> str:
         resume_data (ResumeData): An object containing the data required to populate the resume, such as personal details, work experience, education, and skills.        
     
     Returns:
-        A string message confirming the resume creation and location of the PDF file.
+        A string message confirming the resume creation, location of the PDF file and whether it fits on one page.
     """
+    # Later revisions are applied to this copy with edit_resume
+    cl.user_session.set("current_resume", resume_data)
     try:
-        filepath = await create_resume_pdf(resume_data)
-        return f"Resume successfully created and saved to: {filepath}"
+        return await publish_resume(resume_data)
     except Exception as e:
         return f"Error creating resume: {str(e)}"
 
+@tool
+async def preview_resume(resume_data: ResumeData) -> str:
+    """
+    Show the user a quick plain-text preview of the resume without building the PDF.
+    Use it while iterating on the content; generate the PDF only when the user asks for the final file.
+
+    Args:
+        resume_data (ResumeData): The resume to preview.
+
+    Returns:
+        A confirmation that the preview was shown.
+    """
+    cl.user_session.set("current_resume", resume_data)
+    try:
+        await show_preview(resume_data)
+        return "The preview was shown to the user."
+    except Exception as e:
+        return f"Error previewing resume: {str(e)}"
+
+@tool
+async def edit_resume(operations: list[PatchOperation], preview: bool = False) -> str:
+    """
+    Change the current resume (the last one sent to generate_resume or preview_resume) with JSON Patch
+    operations and render it again. Prefer this to resending the whole resume for revisions.
+
+    Args:
+        operations (list[PatchOperation]): Edits applied in order, all or nothing. Paths are JSON Pointers
+            into the resume and list indices count from 0 in the current version, e.g.
+            {"op": "replace", "path": "/experience/0/description/1", "value": "New bullet"},
+            {"op": "move", "from": "/experience/2", "path": "/experience/0"},
+            {"op": "remove", "path": "/skills/1/elements/3"},
+            {"op": "add", "path": "/skills/0/elements/-", "value": "Kubernetes"}.
+        preview (bool): Show the plain-text preview instead of generating the PDF.
+
+    Returns:
+        The sections that changed and the result of the render, or why the edit was rejected.
+    """
+    current = cl.user_session.get("current_resume")
+    if current is None:
+        return "There is no resume to edit yet; send the full resume to preview_resume or generate_resume first."
+    try:
+        resume_data = apply_resume_patch(current, operations)
+    except ResumePatchError as e:
+        return f"Edit rejected, the resume is unchanged. {e}"
+    changed = diff_resume(current, resume_data).changed
+    log_event("resume_patched", operations=len(operations), sections=list(changed))
+    cl.user_session.set("current_resume", resume_data)
+    summary = f"Changed sections: {', '.join(changed) or 'none'}."
+    try:
+        if preview:
+            await show_preview(resume_data)
+            return f"{summary} The preview was shown to the user."
+        return f"{summary} {await publish_resume(resume_data)}"
+    except Exception as e:
+        return f"{summary} Error rendering the edited resume: {str(e)}"
+
+@lru_cache(maxsize=1)
+def get_tailoring_graph() -> "CompiledStateGraph":
+    """Compile the multi-posting tailoring graph once per process; it shares the chat model and renderer."""
+    from tailoring import build_tailoring_graph
+
+    return build_tailoring_graph(get_model(), render_fitted_pdf)
+
+@tool
+async def tailor_resumes_for_jobs(base_resume: ResumeData, jobs: list[JobTarget]) -> str:
+    """
+    Tailor one base resume to several job postings at once and generate a PDF for each.
+    Use it when the user applies to more than one role: build the untailored base resume from their
+    documents once and pass every posting here, instead of repeating the conversation per job.
+
+    Args:
+        base_resume (ResumeData): The user's complete resume, not yet tailored to any posting.
+        jobs (list[JobTarget]): The job postings, each with a short title and the job description.
+
+    Returns:
+        One line per posting with its PDF and whether it fits on one page, or why it failed.
+        The PDFs are already attached for download in the chat.
+    """
+    from tailoring import tailor_resumes
+
+    try:
+        results = await tailor_resumes(get_tailoring_graph(), base_resume, jobs)
+    except Exception as e:
+        return f"Error tailoring resumes: {str(e)}"
+
+    lines = []
+    elements = []
+    for result in results:
+        if not result.ok:
+            lines.append(f"{result.target.title}: failed ({result.error})")
+            continue
+        name = f"{result.resume_data.get_output_filename()}_{result.index + 1}_{safe_name(result.target.title).lower()}"
+        filepath = await store_pdf(result.resume_data, result.pdf_bytes, name)
+        filename = os.path.basename(filepath)
+        elements.append(cl.File(name=filename, content=result.pdf_bytes, mime="application/pdf"))
+        lines.append(f"{result.target.title}: {filename}. {result.fit_summary}")
+    summary = "\n".join(lines)
+    await cl.Message(content=f"Tailored resumes:\n{summary}", elements=elements).send()
+    return summary
+
+@tool
+async def check_resume_layout(resume_data: ResumeData) -> str:
+    """
+    Measure how the resume would lay out on A4 pages without generating a PDF.
+    Use it to decide what to shorten before calling generate_resume.
+
+    Args:
+        resume_data (ResumeData): The resume to measure.
+
+    Returns:
+        A JSON string with the estimated page_count, the overflow beyond one page in points,
+        and the height in points of every section, entry and bullet (bullets in input order).
+    """
+    try:
+        metrics = await measure_resume(resume_data)
+        return json.dumps(metrics.to_dict())
+    except Exception as e:
+        return f"Error measuring resume: {str(e)}"
+
 @tool
 async def download_link(filepath: str) -> str:
     """
@@ -51,12 +267,21 @@ async def download_link(filepath: str) -> str:
         filepath (str): The path to the generated PDF file.
 
     Returns:
-        None
+        str: Confirmation, or an error listing the PDFs that can be linked
     """
     
     filename = os.path.basename(filepath)
+    generated_pdfs = cl.user_session.get("generated_pdfs") or {}
+    pdf_bytes = generated_pdfs.get(filename)
+    if pdf_bytes is not None:
+        pdf = cl.Pdf(name=filename, content=pdf_bytes, display="inline", page=1)
+    elif PERSIST_OUTPUT and os.path.isfile(filepath):
+        pdf = cl.Pdf(name=filename, path=filepath, display="inline", page=1)
+    else:
+        available = ", ".join(generated_pdfs) or "none"
+        return f"Error: {filename} is not available in this session. Available PDFs: {available}. Generate the resume again if it is not listed."
     elements = [
-        cl.Pdf(name=filename, path=filepath, display="inline", page=1),
+        pdf,
         # cl.File(name=filename, path=filepath, display="inline"),
     ]
 
@@ -64,91 +289,169 @@ async def download_link(filepath: str) -> str:
         content=f"{filename}:",
         elements=elements
     ).send()
+    return f"Download link for {filename} published."
     
 
 
+AGENT_PROMPT = textwrap.dedent("""\
+    You are a helpful assistant that creates ATS-friendly resumes / CV in PDF format. 
+    Tailor the resume to the job position / role provided by the user. 
+    
+    ### Guidelines:
+    *   Use standard ATS-friendly formatting (no graphics, columns, or tables).
+    *   Make the experiences and skills in the CV **ultra relevant** for the role.
+    *   Keep all the companies the user worked at, don't skip any employment periods.
+    *   Include relevant keywords from the job description.
+    *   Focus on quantifiable achievements where possible.
+    *   Order work experiences in reverse chronological order.
+    *   The resulting PDF resume should be 1 page max.
+    *   Use check_resume_layout to see which sections, entries and bullets overflow the page and trim them in one pass before generating the PDF.
+    *   While iterating on the content, show changes with preview_resume; call generate_resume only when the user asks for the final PDF.
+    *   Once a resume has been previewed or generated, make revisions with edit_resume (a few JSON Patch operations) instead of resending the whole resume.
+    *   When the user gives several job postings, build the untailored base resume once and call tailor_resumes_for_jobs with all of them.
+""")
+
+AGENT_TOOLS = [preview_resume, edit_resume, check_resume_layout, generate_resume, tailor_resumes_for_jobs, download_link]
+
+
+@lru_cache(maxsize=1)
+def get_agent() -> "CompiledStateGraph":
+    """
+    Compile the ReAct agent once per process and share it between chat sessions.
+
+    The graph holds no per-session state: each session is a thread in the shared
+    checkpointer, keyed by the Chainlit session id.
+    """
+    from langgraph.prebuilt import create_react_agent
+    from checkpointing import get_checkpointer
+
+    return create_react_agent(
+        get_model(),
+        tools=AGENT_TOOLS,
+        checkpointer=get_checkpointer(),
+        prompt=AGENT_PROMPT,
+    )
+
+
+@cl.on_app_startup
+async def mount_health_routes():
+    """Serve /health and /metrics from the Chainlit app, ahead of its catch-all UI route, start the output GC and load the tokenizer."""
+    from chainlit.server import app
+    from health_check import app as health_app
+
+    routes = [route for route in health_app.router.routes if getattr(route, "path", None) in ("/health", "/metrics")]
+    app.router.routes[0:0] = routes
+    if PERSIST_OUTPUT:
+        start_output_gc()
+    # The first token count may download the tokenizer; do it now, in a thread, instead of in a request
+    await asyncio.to_thread(load_token_encoding)
+
+
 @cl.on_chat_start
 async def start():
     welcome_message = """Welcome to the ATS-Friendly CV Maker! Give me the job position you want to apply for, and I will help you create a tailored resume in PDF format. You can also upload your existing CV or any relevant documents to help me understand your background better."""
     await cl.Message(content=welcome_message).send()
-    
-    memory = MemorySaver()
-    tools = [generate_resume, download_link]
-    agent : CompiledStateGraph = create_react_agent(
-        model,
-        tools=tools,
-        checkpointer=memory,
-        prompt=textwrap.dedent("""\
-            You are a helpful assistant that creates ATS-friendly resumes / CV in PDF format. 
-            Tailor the resume to the job position / role provided by the user. 
-            
-            ### Guidelines:
-            *   Use standard ATS-friendly formatting (no graphics, columns, or tables).
-            *   Make the experiences and skills in the CV **ultra relevant** for the role.
-            *   Keep all the companies the user worked at, don't skip any employment periods.
-            *   Include relevant keywords from the job description.
-            *   Focus on quantifiable achievements where possible.
-            *   Order work experiences in reverse chronological order.
-            *   The resulting PDF resume should be 1 page max.
-        """),
-    )
-    cl.user_session.set("agent", agent)
+    # Compiles the agent for the first session of this worker; later sessions reuse it
+    get_agent()
+
+
+# Fixed id of the condensed upload context message so new uploads replace it in place
+UPLOADED_CONTEXT_MESSAGE_ID = "uploaded-context"
+
+# Progress text shown while a tool runs
+TOOL_PROGRESS = {
+    "preview_resume": "Preparing preview…",
+    "edit_resume": "Applying edits…",
+    "check_resume_layout": "Measuring resume layout…",
+    "generate_resume": "Rendering PDF…",
+    "tailor_resumes_for_jobs": "Tailoring resumes for each posting…",
+    "download_link": "Publishing download link…",
+}
 
 
 @cl.on_message
 async def handle_message(message: cl.Message):
-    agent: CompiledStateGraph = cl.user_session.get("agent")
+    agent = get_agent()
+    bind_log_context(session=cl.context.session.id, turn=message.id)
 
     if message.elements:
         try:
-            await file_loader(message)            
+            with span("file_loader", files=len(message.elements)):
+                await file_loader(message)
         except Exception as e:
             await cl.Message(author="System", content="An error occurred while reading the file. Please try again.").send()
     
-    result = await agent.ainvoke(
-        {
-            "messages": [("human", message.content)],
-            "recursion_limit": 5,
-        },
-        config=RunnableConfig(
-            configurable={"thread_id": cl.context.session.id}, 
-            callbacks=[cl.AsyncLangchainCallbackHandler()]
-        )
-    )
-    response_content = result["messages"][-1].content
-    await cl.Message(response_content).send()
+    user = cl.user_session.get("user")
+    current_client.set(user.identifier if LLM_FAIR_SHARE == "user" and user else cl.context.session.id)
+    if not LLM_CACHE_SHARED:
+        current_cache_partition.set(user.identifier if user else cl.context.session.id)
+    render_affinity.set(cl.context.session.id)
 
+    started = time.perf_counter()
+    first_token_latency = None
+    answer = cl.Message(content="")
+    tool_steps: dict[str, cl.Step] = {}
+    tool_started: dict[str, float] = {}
+    streamed_runs = set()
+    separate = False
 
-# @cl.on_message
-# async def handle_message_streaming(message: cl.Message):
-    
-#     if message.elements:
-#         try:
-#             await file_loader(message)            
-#         except Exception as e:
-#             await cl.Message(
-#                 author="System",
-#                 content="An error occurred while reading the file. Please try again.",
-#             ).send()
-
-#     # memory: MemorySaver = cl.user_session.get("memory")
-#     # config = {"configurable": {"thread_id": '123'}}
-#     # print('memory.list()', memory.list(config))
-#     # state = memory.get(config) or {"messages": []}
-    
-#     agent: CompiledStateGraph = cl.user_session.get("agent")
+    async def emit(text: str) -> None:
+        nonlocal first_token_latency, separate
+        if first_token_latency is None:
+            first_token_latency = time.perf_counter() - started
+        if separate:
+            # Text from an earlier model call, e.g. before a tool call, ends a paragraph
+            text, separate = "\n\n" + text, False
+        await answer.stream_token(text)
+
+    # Stream model tokens into the answer as they arrive and surface tool calls as steps
+    try:
+        async for event in agent.astream_events(
+            {
+                "messages": [("human", message.content)],
+                "recursion_limit": 5,
+            },
+            config=RunnableConfig(configurable={"thread_id": cl.context.session.id}),
+            version="v2",
+        ):
+            kind = event["event"]
+            if kind.startswith("on_chat_model") and TAILORING_TAG in event.get("tags", ()):
+                # Tailoring branches answer with resume JSON for the tool, not with text for the user
+                continue
+            if kind == "on_chat_model_start":
+                separate = bool(answer.content)
+            elif kind == "on_chat_model_stream":
+                token = event["data"]["chunk"].content
+                if isinstance(token, str) and token:
+                    streamed_runs.add(event["run_id"])
+                    await emit(token)
+            elif kind == "on_chat_model_end" and event["run_id"] not in streamed_runs:
+                # Responses served from the LLM cache arrive whole instead of as tokens
+                content = getattr(event["data"].get("output"), "content", "")
+                if isinstance(content, str) and content:
+                    await emit(content)
+            elif kind == "on_tool_start":
+                tool_started[event["run_id"]] = time.perf_counter()
+                step = cl.Step(name=TOOL_PROGRESS.get(event["name"], event["name"]), type="tool")
+                tool_steps[event["run_id"]] = step
+                await step.send()
+            elif kind in ("on_tool_end", "on_tool_error") and event["run_id"] in tool_steps:
+                elapsed = time.perf_counter() - tool_started.pop(event["run_id"])
+                record_span(f"tool.{event['name']}", elapsed, "ok" if kind == "on_tool_end" else "error")
+                step = tool_steps.pop(event["run_id"])
+                if kind == "on_tool_end":
+                    step.output = str(getattr(event["data"].get("output"), "content", event["data"].get("output", "")))
+                await step.update()
+    except ModelOverloaded as e:
+        # The model queue is full: tell the user instead of letting the turn time out
+        await answer.stream_token(str(e))
 
-#     answer = cl.Message(content="")
-#     await answer.send()
+    await answer.send()
+    total_latency = time.perf_counter() - started
+    if first_token_latency is not None:
+        record_span("turn_first_token", first_token_latency)
+    record_span("turn", total_latency)
 
-#     # cb = cl.AsyncLangchainCallbackHandler() # cb = cl.LangchainCallbackHandler()
-#     # config: RunnableConfig = {"configurable": {"thread_id": cl.context.session.id}}
-#     config: RunnableConfig = {"configurable": {"thread_id": message.thread_id}}
-#     for msg, metadata in agent.stream({"messages": [HumanMessage(content=message.content)]}, stream_mode="messages", config=config):
-#         if isinstance(msg, AIMessageChunk):
-#             answer.content += msg.content  # type: ignore
-#             await answer.update()
-            
 
 @cl.step(type="tool")
 async def file_loader(message: cl.Message):
@@ -156,48 +459,51 @@ async def file_loader(message: cl.Message):
     This function processes the files uploaded by the user for further use by the chat application.
     """
 
-    documents = []
-    for element in message.elements:
-        print("Loading document:", element.path, element.name)
-        if element.name.endswith(".pdf"):
-            loader = PyMuPDFLoader(element.path)
-        else:
-            loader = TextLoader(element.path)
-        docs = await cl.make_async(loader.load)()
-        print("Loaded document:", element.path, docs)
-
-        for doc in docs:
-            doc.metadata["thread_id"] = cl.context.session.id  # message.thread_id
-            doc.metadata["title"] = element.name
-            documents.append(doc)
-
-    # Insert the document's content into the chat history as a "context" field
-    agent: CompiledStateGraph = cl.user_session.get("agent")
-    for single_doc in documents:
-        context_message = ("user", f"context: page_content={single_doc.page_content}, title={single_doc.metadata.get('title', None)}")
-        # result = agent.invoke(
-        #         {
-        #             "messages": [
-        #                 # ("system", f"Adding document context: {doc.metadata['title']}"), 
-        #                 context_message,
-        #             ],
-        #             "recursion_limit": 1,  # Minimum value to prevent actual reasoning
-        #         },
-        #         config={"configurable": {"thread_id": doc.metadata["thread_id"]}}
-        #     )
-        # response_content = result["messages"][-1].content
-        # print("Responsed on Context added:", response_content)
-        
-        # state: StateSnapshot = agent.get_state(config={"configurable": {"thread_id": doc.metadata["thread_id"]}})  
-        # print("STATE 1:", len(state.values.get("messages", [])), "\n".join(map(str, state.values.get("messages", []))), sep="\n")
-        agent.update_state(
-            config={"configurable": {"thread_id": doc.metadata["thread_id"]}},
+    thread_id = cl.context.session.id  # message.thread_id
+    files = [(element.path, element.name) for element in message.elements]
+    results = await get_document_ingestor().extract_many(files)
+
+    # Skip files already added to this conversation, even under another name
+    ingested_hashes = cl.user_session.get("ingested_hashes") or set()
+    uploaded_context: CondensedContext = cl.user_session.get("uploaded_context") or new_condensed_context()
+    added = 0
+    notes = []
+    for (path, name), result in zip(files, results):
+        if isinstance(result, Exception):
+            log_event("document_failed", logging.WARNING, path=path, name=name, error=str(result))
+            notes.append(f"{name}: {result}")
+            continue
+        log_event("document_loaded", path=path, name=name, pages=len(result.pages), cached=result.cached)
+        if result.content_hash in ingested_hashes:
+            notes.append(f"{name}: already added to this conversation")
+            continue
+        ingested_hashes.add(result.content_hash)
+        if result.truncated:
+            notes.append(f"{name}: the file is too long, only its beginning was read")
+        if result.resume is not None:
+            notes.append(f"{name}: read directly as a resume created by this tool ({result.resume_confidence:.0%} confidence)")
+        uploaded_context.add_document(name, result.pages, result.resume)
+        added += 1
+    cl.user_session.set("ingested_hashes", ingested_hashes)
+    cl.user_session.set("uploaded_context", uploaded_context)
+
+    # Keep a single condensed "context" message in the chat history instead of raw pages.
+    # Reusing the message id replaces the previous version when more files are uploaded.
+    agent = get_agent()
+    if added:
+        # Token counting is CPU work; keep it off the event loop
+        content = await cl.make_async(uploaded_context.to_message_content)()
+        context_message = HumanMessage(content=content, id=UPLOADED_CONTEXT_MESSAGE_ID)
+        await agent.aupdate_state(
+            config={"configurable": {"thread_id": thread_id}},
             values={"messages": [context_message]}
         )
-        # state: StateSnapshot = agent.get_state(config={"configurable": {"thread_id": doc.metadata["thread_id"]}})  
-        # print("STATE 2:", len(state.values.get("messages", [])), "\n".join(map(str, state.values.get("messages", []))), sep="\n")
-    cl.user_session.set("agent", agent)
+        log_event("uploaded_context", tokens=uploaded_context.token_count, omitted_facts=uploaded_context.omitted_facts)
+        for name, omitted in uploaded_context.omitted.items():
+            notes.append(f"{name}: {omitted} lines did not fit the context budget and were left out")
 
+    if notes:
+        await cl.Message(author="System", content="\n".join(notes)).send()
     await cl.Message(author="System", content="Done reading and memorizing files.").send()
 
 
@@ -0,0 +1,12 @@
+# This package contains the conversation state checkpointers shared by chat sessions
+from checkpointing.checkpointer import (
+    create_checkpointer,
+    get_checkpointer
+)
+from checkpointing.memory import BoundedMemorySaver
+
+__all__ = [
+    'create_checkpointer',
+    'get_checkpointer',
+    'BoundedMemorySaver'
+]
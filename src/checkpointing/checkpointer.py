@@ -0,0 +1,61 @@
+import os
+from typing import Optional
+
+from langgraph.checkpoint.base import BaseCheckpointSaver
+
+from checkpointing.memory import (
+    DEFAULT_MAX_CHECKPOINTS_PER_THREAD,
+    DEFAULT_MAX_THREAD_BYTES,
+    DEFAULT_MAX_THREADS,
+    DEFAULT_MAX_TOTAL_BYTES,
+    DEFAULT_THREAD_TTL,
+    BoundedMemorySaver,
+)
+from telemetry import register_stats
+
+DEFAULT_SQLITE_PATH = "../output/checkpoints.sqlite"
+
+_checkpointer: Optional[BaseCheckpointSaver] = None
+
+
+def create_checkpointer() -> BaseCheckpointSaver:
+    """
+    Build the checkpointer selected by CHECKPOINT_BACKEND ("memory" or "sqlite").
+
+    The SQLite backend must be created inside the running event loop.
+    """
+    backend = os.getenv("CHECKPOINT_BACKEND", "memory").lower()
+    max_checkpoints = int(os.getenv("CHECKPOINT_MAX_PER_THREAD", DEFAULT_MAX_CHECKPOINTS_PER_THREAD))
+    ttl_seconds = float(os.getenv("CHECKPOINT_TTL", DEFAULT_THREAD_TTL))
+    if backend == "sqlite":
+        try:
+            import aiosqlite
+            from checkpointing.sqlite import BoundedSqliteSaver
+        except ImportError as e:
+            raise RuntimeError(
+                "CHECKPOINT_BACKEND=sqlite requires the langgraph-checkpoint-sqlite package"
+            ) from e
+        path = os.getenv("CHECKPOINT_SQLITE_PATH", DEFAULT_SQLITE_PATH)
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        # The connection is opened lazily by the saver's setup()
+        return BoundedSqliteSaver(aiosqlite.connect(path), max_checkpoints_per_thread=max_checkpoints, ttl_seconds=ttl_seconds)
+    if backend != "memory":
+        raise ValueError(f"Unknown CHECKPOINT_BACKEND: {backend}")
+    return BoundedMemorySaver(
+        max_threads=int(os.getenv("CHECKPOINT_MAX_THREADS", DEFAULT_MAX_THREADS)),
+        ttl_seconds=ttl_seconds,
+        max_checkpoints_per_thread=max_checkpoints,
+        max_thread_bytes=int(os.getenv("CHECKPOINT_MAX_THREAD_BYTES", DEFAULT_MAX_THREAD_BYTES)),
+        max_total_bytes=int(os.getenv("CHECKPOINT_MAX_TOTAL_BYTES", DEFAULT_MAX_TOTAL_BYTES)),
+    )
+
+
+def get_checkpointer() -> BaseCheckpointSaver:
+    """Return the process-wide checkpointer shared by all chat sessions."""
+    global _checkpointer
+    if _checkpointer is None:
+        _checkpointer = create_checkpointer()
+        # The SQLite saver's stats are async and are not exported
+        if isinstance(_checkpointer, BoundedMemorySaver):
+            register_stats("cv_maker_checkpoints", _checkpointer.stats, counters=("evicted_threads", "pruned_checkpoints"))
+    return _checkpointer
@@ -0,0 +1,185 @@
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from typing import Any, Optional, Sequence
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import ChannelVersions, Checkpoint, CheckpointMetadata, CheckpointTuple
+from langgraph.checkpoint.memory import InMemorySaver
+
+DEFAULT_MAX_THREADS = 1000
+DEFAULT_THREAD_TTL = 24 * 60 * 60
+DEFAULT_MAX_CHECKPOINTS_PER_THREAD = 3
+DEFAULT_MAX_THREAD_BYTES = 4 * 1024 * 1024
+DEFAULT_MAX_TOTAL_BYTES = 512 * 1024 * 1024
+
+
+class BoundedMemorySaver(InMemorySaver):
+    """
+    In-process checkpointer with bounded memory use.
+
+    Only the newest `max_checkpoints_per_thread` checkpoints of a thread are kept
+    (older ones are pruned first when a thread grows past `max_thread_bytes`), and
+    whole threads are evicted least recently used first once they are idle for
+    `ttl_seconds` or the saver holds more than `max_threads` threads or
+    `max_total_bytes` of serialized state. The thread being written is never evicted.
+    """
+    def __init__(
+        self,
+        max_threads: int = DEFAULT_MAX_THREADS,
+        ttl_seconds: float = DEFAULT_THREAD_TTL,
+        max_checkpoints_per_thread: int = DEFAULT_MAX_CHECKPOINTS_PER_THREAD,
+        max_thread_bytes: int = DEFAULT_MAX_THREAD_BYTES,
+        max_total_bytes: int = DEFAULT_MAX_TOTAL_BYTES,
+        serde=None,
+    ):
+        super().__init__(serde=serde)
+        self.max_threads = max_threads
+        self.ttl_seconds = ttl_seconds
+        self.max_checkpoints_per_thread = max(1, max_checkpoints_per_thread)
+        self.max_thread_bytes = max_thread_bytes
+        self.max_total_bytes = max_total_bytes
+        self._lock = threading.RLock()
+        # thread id -> last access, least recently used first
+        self._last_access: OrderedDict[str, float] = OrderedDict()
+        self._thread_bytes: dict[str, int] = {}
+        # thread id -> keys of its blobs and writes, so pruning never scans other threads
+        self._blob_keys: defaultdict[str, set] = defaultdict(set)
+        self._write_keys: defaultdict[str, set] = defaultdict(set)
+        self.total_bytes = 0
+        self.evicted_threads = 0
+        self.pruned_checkpoints = 0
+
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        thread_id = config["configurable"]["thread_id"]
+        with self._lock:
+            # Do not let the storage defaultdict recreate evicted threads on lookup
+            if thread_id not in self.storage:
+                return None
+            self._touch(thread_id)
+            return super().get_tuple(config)
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"]["checkpoint_ns"]
+        with self._lock:
+            saved = super().put(config, checkpoint, metadata, new_versions)
+            self._blob_keys[thread_id].update(
+                (thread_id, checkpoint_ns, channel, version) for channel, version in new_versions.items()
+            )
+            self._prune_thread(thread_id, checkpoint_ns)
+            self._touch(thread_id)
+            self._evict(keep=thread_id)
+            return saved
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        configurable = config["configurable"]
+        thread_id = configurable["thread_id"]
+        with self._lock:
+            super().put_writes(config, writes, task_id, task_path)
+            self._write_keys[thread_id].add(
+                (thread_id, configurable.get("checkpoint_ns", ""), configurable["checkpoint_id"])
+            )
+            self._touch(thread_id)
+
+    def delete_thread(self, thread_id: str) -> None:
+        with self._lock:
+            self.storage.pop(thread_id, None)
+            for key in self._write_keys.pop(thread_id, ()):
+                self.writes.pop(key, None)
+            for key in self._blob_keys.pop(thread_id, ()):
+                self.blobs.pop(key, None)
+            self.total_bytes -= self._thread_bytes.pop(thread_id, 0)
+            self._last_access.pop(thread_id, None)
+
+    def stats(self) -> dict:
+        """Thread count, serialized bytes held and eviction counters."""
+        with self._lock:
+            return {
+                "threads": len(self._last_access),
+                "total_bytes": self.total_bytes,
+                "largest_thread_bytes": max(self._thread_bytes.values(), default=0),
+                "evicted_threads": self.evicted_threads,
+                "pruned_checkpoints": self.pruned_checkpoints,
+            }
+
+    def _touch(self, thread_id: str) -> None:
+        self._last_access[thread_id] = time.monotonic()
+        self._last_access.move_to_end(thread_id)
+
+    def _measure_thread(self, thread_id: str) -> int:
+        size = sum(
+            len(checkpoint[1]) + len(metadata[1])
+            for checkpoints in self.storage.get(thread_id, {}).values()
+            for checkpoint, metadata, _ in checkpoints.values()
+        )
+        size += sum(len(self.blobs[key][1]) for key in self._blob_keys[thread_id] if key in self.blobs)
+        size += sum(
+            len(value[1])
+            for key in self._write_keys[thread_id]
+            for _, _, value, _ in self.writes.get(key, {}).values()
+        )
+        return size
+
+    def _prune_thread(self, thread_id: str, checkpoint_ns: str) -> None:
+        """Drop the oldest checkpoints beyond the count limit, then beyond the byte limit."""
+        checkpoints = self.storage[thread_id][checkpoint_ns]
+        # Checkpoint ids are time-ordered, so sorting them orders checkpoints by age
+        ordered = sorted(checkpoints)
+        stale = ordered[:-self.max_checkpoints_per_thread]
+        for checkpoint_id in stale:
+            self._drop_checkpoint(thread_id, checkpoint_ns, checkpoint_id)
+        remaining = ordered[len(stale):]
+        if stale:
+            self._drop_unreferenced_blobs(thread_id, checkpoint_ns)
+
+        size = self._measure_thread(thread_id)
+        # The newest checkpoint always stays: it is the conversation itself
+        while size > self.max_thread_bytes and len(remaining) > 1:
+            self._drop_checkpoint(thread_id, checkpoint_ns, remaining.pop(0))
+            self._drop_unreferenced_blobs(thread_id, checkpoint_ns)
+            size = self._measure_thread(thread_id)
+
+        self.total_bytes += size - self._thread_bytes.get(thread_id, 0)
+        self._thread_bytes[thread_id] = size
+
+    def _drop_checkpoint(self, thread_id: str, checkpoint_ns: str, checkpoint_id: str) -> None:
+        del self.storage[thread_id][checkpoint_ns][checkpoint_id]
+        write_key = (thread_id, checkpoint_ns, checkpoint_id)
+        self.writes.pop(write_key, None)
+        self._write_keys[thread_id].discard(write_key)
+        self.pruned_checkpoints += 1
+
+    def _drop_unreferenced_blobs(self, thread_id: str, checkpoint_ns: str) -> None:
+        live = set()
+        for checkpoint, _, _ in self.storage[thread_id][checkpoint_ns].values():
+            live.update(self.serde.loads_typed(checkpoint)["channel_versions"].items())
+        blob_keys = self._blob_keys[thread_id]
+        for key in [key for key in blob_keys if key[1] == checkpoint_ns and key[2:] not in live]:
+            self.blobs.pop(key, None)
+            blob_keys.discard(key)
+
+    def _evict(self, keep: str) -> None:
+        now = time.monotonic()
+        while self._last_access:
+            thread_id, last_access = next(iter(self._last_access.items()))
+            if thread_id == keep:
+                break
+            expired = self.ttl_seconds > 0 and now - last_access > self.ttl_seconds
+            over_limit = len(self._last_access) > self.max_threads or self.total_bytes > self.max_total_bytes
+            if not (expired or over_limit):
+                break
+            self.delete_thread(thread_id)
+            self.evicted_threads += 1
@@ -0,0 +1,117 @@
+import time
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import ChannelVersions, Checkpoint, CheckpointMetadata
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+
+from checkpointing.memory import DEFAULT_MAX_CHECKPOINTS_PER_THREAD, DEFAULT_THREAD_TTL
+
+# Expired threads are looked for at most this often per process
+DEFAULT_PRUNE_INTERVAL = 60
+
+
+class BoundedSqliteSaver(AsyncSqliteSaver):
+    """
+    SQLite checkpointer that several worker processes can share through one database
+    file, so any worker can continue any session.
+
+    Like BoundedMemorySaver it keeps only the newest `max_checkpoints_per_thread`
+    checkpoints of a thread, and it deletes threads that have not been written for
+    `ttl_seconds`. Last-write times live in the database, so expiry is shared too.
+    """
+    def __init__(
+        self,
+        conn,
+        max_checkpoints_per_thread: int = DEFAULT_MAX_CHECKPOINTS_PER_THREAD,
+        ttl_seconds: float = DEFAULT_THREAD_TTL,
+        prune_interval: float = DEFAULT_PRUNE_INTERVAL,
+        serde=None,
+    ):
+        super().__init__(conn, serde=serde)
+        self.max_checkpoints_per_thread = max(1, max_checkpoints_per_thread)
+        self.ttl_seconds = ttl_seconds
+        self.prune_interval = prune_interval
+        self._activity_ready = False
+        self._last_prune = 0.0
+
+    async def setup(self) -> None:
+        await super().setup()
+        if self._activity_ready:
+            return
+        async with self.lock:
+            await self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS thread_activity (thread_id TEXT PRIMARY KEY, last_write REAL NOT NULL)"
+            )
+            await self.conn.commit()
+            self._activity_ready = True
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        saved = await super().aput(config, checkpoint, metadata, new_versions)
+        thread_id = str(config["configurable"]["thread_id"])
+        checkpoint_ns = config["configurable"]["checkpoint_ns"]
+        now = time.time()
+        # Checkpoint ids are time-ordered; everything past the newest N is stale
+        stale = (
+            "SELECT checkpoint_id FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? "
+            "ORDER BY checkpoint_id DESC LIMIT -1 OFFSET ?"
+        )
+        params = (thread_id, checkpoint_ns, thread_id, checkpoint_ns, self.max_checkpoints_per_thread)
+        async with self.lock, self.conn.cursor() as cur:
+            await cur.execute(
+                "INSERT INTO thread_activity (thread_id, last_write) VALUES (?, ?) "
+                "ON CONFLICT(thread_id) DO UPDATE SET last_write = excluded.last_write",
+                (thread_id, now),
+            )
+            await cur.execute(
+                f"DELETE FROM writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id IN ({stale})", params
+            )
+            await cur.execute(
+                f"DELETE FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id IN ({stale})", params
+            )
+            await self.conn.commit()
+        if self.ttl_seconds > 0 and now - self._last_prune > self.prune_interval:
+            self._last_prune = now
+            await self.prune_expired_threads(keep=thread_id)
+        return saved
+
+    async def prune_expired_threads(self, keep: str = "") -> int:
+        """Delete threads idle for longer than the TTL and return how many were removed."""
+        await self.setup()
+        expired = "SELECT thread_id FROM thread_activity WHERE last_write < ? AND thread_id != ?"
+        params = (time.time() - self.ttl_seconds, keep)
+        async with self.lock, self.conn.cursor() as cur:
+            await cur.execute(expired, params)
+            removed = len(await cur.fetchall())
+            if removed:
+                for table in ("writes", "checkpoints"):
+                    await cur.execute(f"DELETE FROM {table} WHERE thread_id IN ({expired})", params)
+                await cur.execute("DELETE FROM thread_activity WHERE last_write < ? AND thread_id != ?", params)
+                await self.conn.commit()
+        return removed
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        await super().adelete_thread(thread_id)
+        await self.setup()
+        async with self.lock:
+            await self.conn.execute("DELETE FROM thread_activity WHERE thread_id = ?", (str(thread_id),))
+            await self.conn.commit()
+
+    async def stats(self) -> dict:
+        """Thread count and bytes of serialized state in the database."""
+        await self.setup()
+        async with self.lock, self.conn.cursor() as cur:
+            await cur.execute("SELECT COUNT(*) FROM thread_activity")
+            (threads,) = await cur.fetchone()
+            await cur.execute(
+                "SELECT COALESCE(SUM(LENGTH(checkpoint) + LENGTH(metadata)), 0) FROM checkpoints"
+            )
+            (checkpoint_bytes,) = await cur.fetchone()
+            await cur.execute("SELECT COALESCE(SUM(LENGTH(value)), 0) FROM writes")
+            (write_bytes,) = await cur.fetchone()
+        return {"threads": threads, "total_bytes": checkpoint_bytes + write_bytes}
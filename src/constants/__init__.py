@@ -15,6 +15,21 @@ GARAMOND_BOLD = 'Garamond_Bold'
 GARAMOND_SEMIBOLD_FONT_PATH = './fonts/EBGaramond-SemiBold.ttf'
 GARAMOND_SEMIBOLD = 'Garamond_Semibold'
 
-pdfmetrics.registerFont(ttfonts.TTFont(GARAMOND_REGULAR, GARAMOND_REGULAR_FONT_PATH))
-pdfmetrics.registerFont(ttfonts.TTFont(GARAMOND_BOLD, GARAMOND_BOLD_FONT_PATH))
-pdfmetrics.registerFont(ttfonts.TTFont(GARAMOND_SEMIBOLD, GARAMOND_SEMIBOLD_FONT_PATH))
\ No newline at end of file
+GARAMOND_FONTS = {
+    GARAMOND_REGULAR: GARAMOND_REGULAR_FONT_PATH,
+    GARAMOND_BOLD: GARAMOND_BOLD_FONT_PATH,
+    GARAMOND_SEMIBOLD: GARAMOND_SEMIBOLD_FONT_PATH,
+}
+
+# Parsed fonts, kept so each TTF is read at most once per process
+_registered_fonts: dict = {}
+
+def register_fonts() -> None:
+    """Register the Garamond fonts with ReportLab on first use. Later calls are free."""
+    if len(_registered_fonts) == len(GARAMOND_FONTS):
+        return
+    for font_name, font_path in GARAMOND_FONTS.items():
+        if font_name not in _registered_fonts:
+            font = ttfonts.TTFont(font_name, font_path)
+            pdfmetrics.registerFont(font)
+            _registered_fonts[font_name] = font
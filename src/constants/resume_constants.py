@@ -2,12 +2,10 @@ from constants import GARAMOND_REGULAR, GARAMOND_SEMIBOLD
 from reportlab.lib.enums import TA_RIGHT, TA_JUSTIFY, TA_CENTER
 from reportlab.lib.styles import ParagraphStyle
 from reportlab.lib import colors
+from constants.table_style import TableStyleBuilder
 
-RESUME_ELEMENTS_ORDER = [
-    'experience',
-    'education',
-    'skills'
-]
+# Bump whenever styles or layout change so cached renders are invalidated
+LAYOUT_VERSION = 1
 
 JOB_DETAILS_PARAGRAPH_STYLE = ParagraphStyle('job_details_paragraph', leftIndent=12, fontName = GARAMOND_REGULAR, fontSize = 11, leading = 12.5, alignment = TA_JUSTIFY)
 NAME_PARAGRAPH_STYLE = ParagraphStyle('name_paragraph', fontName = GARAMOND_SEMIBOLD, fontSize=16, alignment = TA_CENTER)
@@ -18,7 +16,7 @@ COMPANY_TITLE_PARAGRAPH_STYLE = ParagraphStyle('company_title_paragraph', fontNa
 COMPANY_DURATION_PARAGRAPH_STYLE = ParagraphStyle('company_duration_paragraph', fontName = GARAMOND_REGULAR, fontSize=11, alignment = TA_RIGHT)
 COMPANY_LOCATION_PARAGRAPH_STYLE = ParagraphStyle('company_location_paragraph', fontName = GARAMOND_REGULAR, fontSize=11, alignment = TA_RIGHT)
 
-def appendSectionTableStyle(table_styles : list, running_row_index : list) -> None:
-    table_styles.append(('TOPPADDING', (0, running_row_index[0]), (1, running_row_index[0]), 5))
-    table_styles.append(('BOTTOMPADDING', (0, running_row_index[0]), (1, running_row_index[0]), 5))
-    table_styles.append(('LINEBELOW', (0, running_row_index[0]), (-1, running_row_index[0]), 1, colors.black))
\ No newline at end of file
+def appendSectionTableStyle(style_builder : TableStyleBuilder) -> None:
+    style_builder.set('TOPPADDING', 5)
+    style_builder.set('BOTTOMPADDING', 5)
+    style_builder.set('LINEBELOW', 1, colors.black, end_col=-1)
\ No newline at end of file
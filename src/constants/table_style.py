@@ -0,0 +1,95 @@
+from typing import Any, Optional
+
+# Commands whose effect on a range equals their effect on each row of it. SPAN is
+# excluded because a multi-row SPAN merges the cells vertically.
+COALESCIBLE_COMMANDS = {'TOPPADDING', 'BOTTOMPADDING', 'LEFTPADDING', 'RIGHTPADDING', 'LINEBELOW', 'LINEABOVE', 'ALIGN', 'VALIGN'}
+
+
+class TableStyleBuilder:
+    """
+    Tracks the current table row and the style settings of each row, then emits a
+    compact TableStyle command list where runs of consecutive rows with the same
+    setting are merged into a single range command.
+
+    `padding_scale` multiplies the per-row padding values, which lets the fit engine
+    tighten vertical spacing together with the font size.
+
+    Each finished row is also labelled with the current `context` (e.g. the section
+    and entry it belongs to) so layout metrics can attribute row heights.
+    """
+    def __init__(self, padding_scale: float = 1.0):
+        self.padding_scale = padding_scale
+        self.row = 0
+        self._global_commands: list = []
+        # (command, start_col, end_col) -> {row: values}
+        self._row_settings: dict[tuple, dict[int, tuple]] = {}
+        self._spans: list[tuple[int, int, int]] = []
+        self.raw_command_count = 0
+        self.context: tuple = ()
+        self.row_labels: list[tuple] = []
+
+    def add_global(self, command: str, start: tuple, end: tuple, *values: Any) -> None:
+        """Add a command that already covers a fixed range, e.g. a whole column."""
+        self._global_commands.append((command, start, end, *values))
+        self.raw_command_count += 1
+
+    def set(self, command: str, *values: Any, start_col: int = 0, end_col: int = 1) -> None:
+        """Apply a command to the current row; later settings for the same row win."""
+        self.raw_command_count += 1
+        if command == 'SPAN':
+            self._spans.append((start_col, end_col, self.row))
+            return
+        if command.endswith('PADDING') and self.padding_scale != 1:
+            values = tuple(value * self.padding_scale for value in values)
+        self._row_settings.setdefault((command, start_col, end_col), {})[self.row] = values
+
+    def span(self, start_col: int = 0, end_col: int = 1) -> None:
+        """Span the current row across the given columns."""
+        self.set('SPAN', start_col=start_col, end_col=end_col)
+
+    def next_row(self, label: Optional[str] = None) -> None:
+        """Finish the current row, labelling it with the context and an optional row label."""
+        self.row_labels.append(self.context + (label,) if label else self.context)
+        self.row += 1
+
+    def append(self, fragment: "TableStyleBuilder") -> None:
+        """
+        Append the rows recorded by `fragment`, a builder that started at row 0, after
+        the current row. Only per-row settings, spans and labels are carried over.
+
+        A fragment recorded at padding scale 1 is scaled to this builder's scale, so one
+        fragment serves every scale.
+        """
+        offset = self.row
+        rescale = fragment.padding_scale == 1 and self.padding_scale != 1
+        for key, rows in fragment._row_settings.items():
+            settings = self._row_settings.setdefault(key, {})
+            scale_values = rescale and key[0].endswith('PADDING')
+            for row, values in rows.items():
+                if scale_values:
+                    values = tuple(value * self.padding_scale for value in values)
+                settings[row + offset] = values
+        self._spans.extend((start_col, end_col, row + offset) for start_col, end_col, row in fragment._spans)
+        self.raw_command_count += fragment.raw_command_count
+        self.row_labels.extend(fragment.row_labels)
+        self.row += fragment.row
+
+    def build(self, coalesce: bool = True) -> list:
+        """Return the TableStyle commands, merging consecutive rows unless `coalesce` is False."""
+        commands = list(self._global_commands)
+        for (command, start_col, end_col), rows in self._row_settings.items():
+            ordered = sorted(rows.items())
+            if not coalesce or command not in COALESCIBLE_COMMANDS:
+                commands.extend((command, (start_col, row), (end_col, row), *values) for row, values in ordered)
+                continue
+            first_row, run_values = ordered[0]
+            last_row = first_row
+            for row, values in ordered[1:]:
+                if row == last_row + 1 and values == run_values:
+                    last_row = row
+                    continue
+                commands.append((command, (start_col, first_row), (end_col, last_row), *run_values))
+                first_row, last_row, run_values = row, row, values
+            commands.append((command, (start_col, first_row), (end_col, last_row), *run_values))
+        commands.extend(('SPAN', (start_col, row), (end_col, row)) for start_col, end_col, row in self._spans)
+        return commands
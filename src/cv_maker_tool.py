@@ -1,141 +1,152 @@
 import json
-import sys
+import logging
 import os
 import asyncio
+import argparse
+from typing import TYPE_CHECKING, BinaryIO, Optional
 
-from sections.resume_section import Section
-from constants.resume_constants import RESUME_ELEMENTS_ORDER
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Table, TableStyle
-from constants.resume_constants import NAME_PARAGRAPH_STYLE, CONTACT_PARAGRAPH_STYLE
-from constants import FULL_COLUMN_WIDTH
 from models.resume_models import ResumeData
-from elements import (
-    EducationAdapter,
-    ExperienceAdapter, 
-    ProjectAdapter,
-    SkillAdapter
-)
+from rendering import BatchSummary, get_render_cache, get_render_executor, run_batch
+from storage import get_output_store
+from telemetry import configure_logging, log_event, span
 
+if TYPE_CHECKING:
+    from rendering.fit import FitResult
+    from rendering.layout_metrics import LayoutMetrics
 
-# These functions are no longer needed with the adapter approach
-# We use Pydantic models directly instead of converting between formats
 
-async def generate_resume(output_file_path, author, elements, table_styles) -> None:
-    resume_doc = SimpleDocTemplate(output_file_path, pagesize=A4, showBoundary=0, leftMargin = 0.5 * inch, rightMargin= 0.5 * inch, topMargin = 0.2 * inch, bottomMargin = 0.1 * inch, title = f"Resume of {author}", author = author)
-    table = Table(elements, colWidths=[FULL_COLUMN_WIDTH * 0.7, FULL_COLUMN_WIDTH * 0.3], spaceBefore=0, spaceAfter=0)
-    table.setStyle(TableStyle(table_styles))
-    resume_elements = [table]
-    resume_doc.build(resume_elements)
+def validate_resume_data(data) -> ResumeData:
+    """Return `data` as a ResumeData model, validating it if it is a dict."""
+    if isinstance(data, dict):
+        with span("validation"):
+            return ResumeData(**data)
+    # If already a Pydantic model
+    return data
 
-async def create_resume_pdf(data, output_filename: str = None) -> str:
+async def render_resume_pdf(data, scale: float = 1.0, fragments: Optional[dict] = None) -> bytes:
     """
-    Create a resume PDF from provided data.
+    Render a resume PDF into memory without touching the disk.
+
+    Args:
+        data: Either a dict with resume data or a ResumeData Pydantic model
+        scale: Factor applied to font sizes, leading and row padding
+        fragments: Section name -> SectionFragment kept by a caller that tracks which sections changed
+
+    Returns:
+        bytes: The PDF document
+    """
+    resume_data = validate_resume_data(data)
+    # Reuse an identical earlier render, otherwise build it in the render pool so the event loop stays free
+    executor = get_render_executor()
+    variant = f"scale={scale}" if scale != 1 else ""
+    return await get_render_cache().render(resume_data, lambda: executor.render_bytes(resume_data, scale, fragments), variant)
+
+async def fit_resume_pdf(data, fragments: Optional[dict] = None) -> tuple[bytes, "FitResult"]:
+    """
+    Render a resume PDF scaled down as little as needed to fit on one page.
+
+    The fit is found by measuring the layout, not by building trial PDFs.
+
+    Args:
+        data: Either a dict with resume data or a ResumeData Pydantic model
+        fragments: Section name -> SectionFragment kept by a caller that tracks which sections changed
+
+    Returns:
+        tuple[bytes, FitResult]: The PDF document and the fit that was applied
+    """
+    resume_data = validate_resume_data(data)
+    fit = await get_render_executor().fit(resume_data, fragments)
+    return await render_resume_pdf(resume_data, fit.scale, fragments), fit
+
+async def measure_resume(data) -> "LayoutMetrics":
+    """
+    Lay out a resume without producing a PDF and return its page metrics.
+
+    Returns:
+        LayoutMetrics: Page count, overflow and per-section/entry/bullet heights
+    """
+    resume_data = validate_resume_data(data)
+    return await get_render_executor().measure(resume_data)
+
+async def stream_resume_pdf(data, file_obj: BinaryIO) -> int:
+    """
+    Render a resume PDF and write it to a caller-supplied binary file-like object.
+
+    Returns:
+        int: Number of bytes written
+    """
+    pdf_bytes = await render_resume_pdf(data)
+    file_obj.write(pdf_bytes)
+    return len(pdf_bytes)
+
+def save_resume_files(resume_data: ResumeData, pdf_bytes: bytes, output_filename: str = None, scope: str = None) -> str:
+    """
+    Persist the resume data as JSON and the rendered PDF in the output store (../output/ by default).
+
+    Args:
+        resume_data: The validated resume
+        pdf_bytes: The rendered PDF
+        output_filename: Optional file name stem; the content hash is appended so saves never collide
+        scope: Optional session or user id; its files are kept in their own directory
+
+    Returns:
+        str: Path to the saved PDF file
+    """
+    return get_output_store().save(resume_data, pdf_bytes, scope=scope, name=output_filename).pdf_path
+
+async def create_resume_pdf(data, output_filename: str = None, fit_one_page: bool = False) -> str:
+    """
+    Create a resume PDF from provided data and save it with its JSON to the output store.
     
     Args:
         data: Either a dict with resume data or a ResumeData Pydantic model
         output_filename: Optional filename for the output PDF. If None, will generate one.
+        fit_one_page: Scale the layout down (within limits) so it fits on one page.
         
     Returns:
         str: Path to the generated PDF file, or None if an error occurred
     """
     # Convert raw data to Pydantic model
     try:
-        if isinstance(data, dict):
-            resume_data = ResumeData(**data)
-        else:
-            # If already a Pydantic model
-            resume_data = data
+        resume_data = validate_resume_data(data)
     except Exception as e:
-        print(f"Error validating resume data: {e}")
+        log_event("resume_invalid", logging.WARNING, error=str(e))
         return None
 
-    # Ensure the output directory exists
-    # output_dir = os.path.dirname('../output/')
-    # os.makedirs(output_dir, exist_ok=True)
-
-    # Save the input data object as JSON
-    output_json_path = output_filename if output_filename else resume_data.get_output_filename()
-    output_json_path = f'../output/{output_json_path}.json'
-    with open(output_json_path, 'w') as json_file:
-        json.dump(data if isinstance(data, dict) else data.dict(), json_file, indent=4)
-        
-    # Extract header information from Pydantic model
-    header = resume_data.header
-    author = header.name
-    
-    # Use the helper method to generate the output path
-    output_pdf_path = output_filename if output_filename else resume_data.get_output_filename()
-    output_pdf_path = f'../output/{output_pdf_path}.pdf'
-    
-    # print(f"Processing resume for: {author}")
-    # print(f"Output file: {output_pdf_path}")
-    
-    # Initialize all the data elements
-    resume_sections = {}
-    table = []
-    running_row_index = [0]
-    table_styles = []
-    table_styles.append(('ALIGN', (0, 0), (0, -1), 'LEFT'))
-    table_styles.append(('ALIGN', (1, 0), (1, -1), 'RIGHT'))
-    table_styles.append(('LEFTPADDING', (0, 0), (-1, -1), 0))
-    table_styles.append(('RIGHTPADDING', (0, 0), (-1, -1), 0))
-    table_styles.append(('BOTTOMPADDING', (0, running_row_index[0]), (1, running_row_index[0]), 6))
-    
-    # Create adapters for each Pydantic model
-    education_elements = [EducationAdapter(edu) for edu in resume_data.education]
-    experience_elements = [ExperienceAdapter(exp) for exp in resume_data.experience]
-    project_elements = [ProjectAdapter(proj) for proj in resume_data.projects] if resume_data.projects else []
-    skill_elements = [SkillAdapter(skill) for skill in resume_data.skills]
-    
-    # Create section objects
-    resume_sections['education'] = Section('Education', education_elements)
-    resume_sections['experience'] = Section('Work Experience', experience_elements)
-    if project_elements:
-        resume_sections['projects'] = Section('Projects', project_elements)
-    resume_sections['skills'] = Section('Skills', skill_elements)
-    
-    # Prepare a table
-    # Append the name and contact
-    table.append([
-        Paragraph(author, NAME_PARAGRAPH_STYLE), ""
-    ])
-    # Span the name row across both columns
-    table_styles.append(('SPAN', (0, running_row_index[0]), (1, running_row_index[0])))
-    running_row_index[0] += 1
-    
-    # Build contact info string with LinkedIn if available
-    contact_info = header.format_contact_info()
-    
-    table.append([
-        Paragraph(contact_info, CONTACT_PARAGRAPH_STYLE), ""
-    ])
-    # Span the contact info row across both columns
-    table_styles.append(('SPAN', (0, running_row_index[0]), (1, running_row_index[0])))
-    table_styles.append(('BOTTOMPADDING', (0, running_row_index[0]), (1, running_row_index[0]), 1))
-    running_row_index[0] += 1
-    
-    for element in RESUME_ELEMENTS_ORDER:
-        if element in resume_sections:
-            section_table = resume_sections[element].get_section_table(running_row_index, table_styles)
-            for entry in section_table:
-                table.append(entry)
-    
-    # Build the resume
-    await generate_resume(output_pdf_path, author, table, table_styles)
-    print(f"Resume generated successfully: {output_pdf_path}")
+    if fit_one_page:
+        pdf_bytes, fit = await fit_resume_pdf(resume_data)
+        log_event("resume_fit", scale=fit.scale, fits=fit.fits, overflow=fit.overflow, summary=fit.describe())
+    else:
+        pdf_bytes = await render_resume_pdf(resume_data)
+    output_pdf_path = await asyncio.to_thread(save_resume_files, resume_data, pdf_bytes, output_filename)
+    log_event("resume_generated", path=output_pdf_path, bytes=len(pdf_bytes))
     return output_pdf_path
 
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Render resume PDFs from ResumeData JSON.",
+        epilog="Examples: python cv_maker_tool.py ../data/input.json | "
+               "python cv_maker_tool.py --batch '../data/*.json' --workers 8",
+    )
+    parser.add_argument("input", help="Path to input JSON; with --batch a directory, glob pattern, JSONL file or - for stdin")
+    parser.add_argument("--batch", action="store_true", help="Render many records in parallel and print a throughput summary")
+    parser.add_argument("--output-dir", default="../output", help="Directory for batch output PDFs (default: ../output)")
+    parser.add_argument("--fit-one-page", action="store_true", help="Scale the layout down so the resume fits on one page")
+    parser.add_argument("--workers", type=int, default=None, help="Number of render processes in batch mode (default: all cores)")
+    return parser.parse_args(argv)
+
+def batch_main(args: argparse.Namespace) -> BatchSummary:
+    summary = run_batch(args.input, output_dir=args.output_dir, workers=args.workers)
+    print(summary.format())
+    return summary
+
 async def main():
-    # Check for command line arguments
-    if len(sys.argv) < 2:
-        print("Usage: python cv_maker_tool.py <path_to_input.json>")
-        print("Example: python cv_maker_tool.py ../data/input.json")
-        return
-    
+    args = parse_args()
+    if args.batch:
+        return batch_main(args)
+
     # Get input file path from command line argument
-    file_path = sys.argv[1]
+    file_path = args.input
     
     # Check if file exists
     if not os.path.exists(file_path):
@@ -156,7 +167,9 @@ async def main():
     
     # Create the resume PDF
     try:
-        output_path = await create_resume_pdf(resume_data)
+        output_path = await create_resume_pdf(resume_data, fit_one_page=args.fit_one_page)
+        if output_path:
+            print(f"Resume generated successfully: {output_path}")
         return output_path
     except TypeError as e:
         print(f"TypeError occurred: {e}")
@@ -171,5 +184,7 @@ async def main():
     return None
 
 if __name__ == "__main__":
+    # Stage timings and render events go to stderr as JSON lines; stdout is for the user
+    configure_logging()
     # Run the async main function
     asyncio.run(main())
\ No newline at end of file
@@ -1,46 +1,21 @@
-from reportlab.platypus import Paragraph
-from constants.resume_constants import (
-    COMPANY_HEADING_PARAGRAPH_STYLE,
-    JOB_DETAILS_PARAGRAPH_STYLE
-)
 from models.resume_models import Project
-from elements.base_element import ModelAdapter
+from elements.base_element import BODY, ENTRY, ModelAdapter, ResumeBackend, Text
 
 class ProjectAdapter(ModelAdapter[Project]):
     """Adapter for Project models that implements the resume element interface."""
     
-    def get_table_element(self, running_row_index: list, table_styles: list) -> list:
-        project_table = []
+    def get_label(self) -> str:
+        return self.model.title
+    
+    def write(self, backend: ResumeBackend) -> None:
         model = self.model
         
         # Project title
-        project_table.append([
-            Paragraph(model.title, COMPANY_HEADING_PARAGRAPH_STYLE),
-            ""
-        ])
-        table_styles.append(('TOPPADDING', (0, running_row_index[0]), (1, running_row_index[0]), 5))
-        table_styles.append(('SPAN', (0, running_row_index[0]), (1, running_row_index[0])))
-        running_row_index[0] += 1
+        backend.row(Text(model.title, 'company_heading'), spacing=ENTRY)
         
         # Project description
-        project_table.append([
-            Paragraph(model.description, JOB_DETAILS_PARAGRAPH_STYLE),
-            ""
-        ])
-        table_styles.append(('TOPPADDING', (0, running_row_index[0]), (1, running_row_index[0]), 1))
-        table_styles.append(('BOTTOMPADDING', (0, running_row_index[0]), (1, running_row_index[0]), 0))
-        table_styles.append(('SPAN', (0, running_row_index[0]), (1, running_row_index[0])))
-        running_row_index[0] += 1
+        backend.row(Text(model.description, 'job_details'), spacing=BODY)
         
         # Project link if available
         if model.link:
-            project_table.append([
-                Paragraph(f"Link: {model.link}", JOB_DETAILS_PARAGRAPH_STYLE),
-                ""
-            ])
-            table_styles.append(('TOPPADDING', (0, running_row_index[0]), (1, running_row_index[0]), 1))
-            table_styles.append(('BOTTOMPADDING', (0, running_row_index[0]), (1, running_row_index[0]), 0))
-            table_styles.append(('SPAN', (0, running_row_index[0]), (1, running_row_index[0])))
-            running_row_index[0] += 1
-        
-        return project_table
+            backend.row(Text(f"Link: {model.link}", 'job_details'), spacing=BODY)
@@ -1,25 +1,78 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from pydantic import BaseModel
-from typing import Protocol, TypeVar, Generic, Any
+from typing import Protocol, TypeVar, Generic, Any, Optional
 
 T = TypeVar('T', bound=BaseModel)
 
+# Vertical spacing of a row: the first row of an entry, a following detail row
+# (title, dates) or body text (bullets, descriptions)
+ENTRY = 'entry'
+DETAIL = 'detail'
+BODY = 'body'
+
+
+@dataclass(frozen=True)
+class Text:
+    """A piece of resume text and the style sheet role it is set in."""
+    text: str
+    role: str
+    bullet: Optional[str] = None
+    # Emphasised prefix, e.g. the title of a skill group
+    lead: str = ""
+
+
+class ResumeBackend(Protocol):
+    """Output format the adapters and sections write a resume to (PDF table, plain text, HTML)."""
+    def header(self, name: str, contact: str) -> None:
+        ...
+
+    def section(self, heading: str) -> None:
+        ...
+
+    def entry(self, label: str, index: int) -> None:
+        """Start the `index`-th entry of the current section."""
+        ...
+
+    def row(self, left: Text, right: Optional[Text] = None, spacing: str = DETAIL, label: Optional[str] = None) -> None:
+        """Add a line with an optional right-aligned part; without one it spans the full width."""
+        ...
+
+    def end_section(self) -> None:
+        ...
+
+
 class ResumeElement(Protocol):
     """Protocol defining the interface for all resume elements."""
-    def get_table_element(self, running_row_index: list, table_styles: list) -> list:
-        """Generate a table representation of this element."""
+    def write(self, backend: ResumeBackend) -> None:
+        """Write this element's rows to an output backend."""
+        ...
+
+    def get_label(self) -> str:
+        """Short human-readable name used in layout metrics."""
         ...
 
-class ModelAdapter(Generic[T]):
+class ModelAdapter(ABC, Generic[T]):
     """
     Base adapter class that wraps a Pydantic model and provides
     the interface needed for rendering resume elements.
+
+    Adapters only describe rows to a ResumeBackend; laying them out as a PDF table
+    is the job of rendering.table_backend.TableBackend.
     """
     def __init__(self, model: T):
         self.model = model
-    
+
     def get_model(self) -> T:
         return self.model
-    
+
+    def get_label(self) -> str:
+        return type(self.model).__name__
+
     def model_dict(self) -> dict[str, Any]:
         """Get the model data as a dictionary."""
         return self.model.model_dump()
+
+    @abstractmethod
+    def write(self, backend: ResumeBackend) -> None:
+        """Write the model's rows to an output backend."""
@@ -1,9 +1,64 @@
+import os
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
+
+from cv_maker_tool import fit_resume_pdf, render_resume_pdf
+from models.resume_models import ResumeData
+from rendering import RenderQueueFull, RenderTimeout, get_render_executor
+from storage import safe_name
+from telemetry import configure_logging, log_event, render_metrics
+
+# Size of the response body chunks of a streamed PDF
+STREAM_CHUNK_BYTES = 64 * 1024
+DEFAULT_RETRY_AFTER = 2
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start the render workers with the service so the first requests do not pay for the process spawn."""
+    configure_logging()
+    executor = get_render_executor()
+    log_event("render_pool_ready", workers=await executor.warm())
+    yield
+    executor.shutdown(wait=False)
 
-app = FastAPI()
+
+app = FastAPI(lifespan=lifespan)
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint for Azure App Service"""
     return JSONResponse({"status": "healthy"})
+
+@app.get("/metrics")
+async def metrics():
+    """Stage timings, cache and queue metrics of this process in the Prometheus text format"""
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+def _stream(pdf_bytes: bytes):
+    view = memoryview(pdf_bytes)
+    for start in range(0, len(view), STREAM_CHUNK_BYTES):
+        yield bytes(view[start:start + STREAM_CHUNK_BYTES])
+
+@app.post("/render")
+async def render(resume_data: ResumeData, fit_one_page: bool = False):
+    """Render a resume PDF in the worker pool; 429 when the render queue is full, 504 when the render times out"""
+    headers = {}
+    try:
+        if fit_one_page:
+            pdf_bytes, fit = await fit_resume_pdf(resume_data)
+            headers = {"X-Fit-Scale": f"{fit.scale:.4f}", "X-Fit-Summary": fit.describe()}
+        else:
+            pdf_bytes = await render_resume_pdf(resume_data)
+    except RenderQueueFull as e:
+        retry_after = os.getenv("RENDER_RETRY_AFTER", str(DEFAULT_RETRY_AFTER))
+        return JSONResponse({"detail": str(e)}, status_code=429, headers={"Retry-After": retry_after})
+    except RenderTimeout as e:
+        return JSONResponse({"detail": str(e)}, status_code=504)
+    headers.update({
+        "Content-Length": str(len(pdf_bytes)),
+        "Content-Disposition": f'attachment; filename="{safe_name(resume_data.get_output_filename())}.pdf"',
+    })
+    return StreamingResponse(_stream(pdf_bytes), media_type="application/pdf", headers=headers)
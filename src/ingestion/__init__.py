@@ -0,0 +1,31 @@
+# This package contains the uploaded document ingestion pipeline
+from ingestion.condense import (
+    CondensedContext,
+    DocumentFacts,
+    estimate_tokens,
+    extract_facts,
+    group_facts,
+    load_token_encoding,
+    new_condensed_context
+)
+from ingestion.loader import (
+    DocumentIngestor,
+    ExtractedDocument,
+    UploadTooLarge,
+    get_document_ingestor
+)
+# ingestion.resume_parser is imported on demand: it loads the resume styles and ReportLab
+
+__all__ = [
+    'CondensedContext',
+    'DocumentFacts',
+    'estimate_tokens',
+    'extract_facts',
+    'group_facts',
+    'load_token_encoding',
+    'new_condensed_context',
+    'DocumentIngestor',
+    'ExtractedDocument',
+    'UploadTooLarge',
+    'get_document_ingestor'
+]
@@ -0,0 +1,223 @@
+import json
+import os
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Optional
+
+from pydantic import ValidationError
+
+from models.resume_models import ResumeData
+
+DEFAULT_CONTEXT_TOKEN_BUDGET = 3000
+# Lines shorter than this carry too little information to be worth a fact entry
+MIN_FACT_CHARS = 3
+# Capitalized or colon-terminated lines up to this length are taken as section headings
+MAX_HEADING_CHARS = 40
+SECTION_HEADINGS = {
+    'summary', 'profile', 'about', 'about me', 'objective', 'contact', 'contacts',
+    'experience', 'work experience', 'professional experience', 'employment', 'employment history',
+    'education', 'skills', 'technical skills', 'projects', 'certifications', 'certificates',
+    'languages', 'publications', 'awards', 'volunteering', 'interests',
+}
+OMISSION_NOTE = ("Some document lines were left out to fit the context budget; "
+                 "ask the user about anything that seems to be missing.")
+
+
+@lru_cache(maxsize=1)
+def _get_encoding():
+    try:
+        import tiktoken
+        return tiktoken.get_encoding("o200k_base")
+    except Exception:
+        # tiktoken missing or its BPE file cannot be downloaded
+        return None
+
+
+def load_token_encoding() -> bool:
+    """
+    Load the tokenizer used by estimate_tokens; the first load may download its BPE file.
+
+    Servers call this once at startup, off the event loop, so no request pays for it.
+
+    Returns:
+        bool: Whether tiktoken is available; otherwise tokens are estimated from the length
+    """
+    return _get_encoding() is not None
+
+
+def estimate_tokens(text: str) -> int:
+    """Count tokens with tiktoken when available, otherwise estimate ~4 characters per token."""
+    encoding = _get_encoding()
+    if encoding is None:
+        return (len(text) + 3) // 4
+    return len(encoding.encode(text))
+
+
+def extract_facts(pages: list[str], seen: Optional[set] = None) -> list[str]:
+    """
+    Split page text into whitespace-normalized lines and drop duplicates.
+
+    Lines are compared case-insensitively; `seen` carries the keys of facts kept
+    from earlier documents so the same line is never stored twice.
+    """
+    seen = seen if seen is not None else set()
+    facts = []
+    for page in pages:
+        for line in page.splitlines():
+            fact = re.sub(r"\s+", " ", line).strip(" •-*\t")
+            key = fact.lower()
+            if len(fact) < MIN_FACT_CHARS or key in seen:
+                continue
+            seen.add(key)
+            facts.append(fact)
+    return facts
+
+
+def parse_resume_json(pages: list[str]) -> Optional[ResumeData]:
+    """Return the document as ResumeData when it is a JSON file matching the schema."""
+    try:
+        return ResumeData(**json.loads("\n".join(pages)))
+    except (json.JSONDecodeError, ValidationError, TypeError):
+        return None
+
+
+def group_facts(facts: list[str]) -> list[tuple[Optional[str], list[str]]]:
+    """
+    Group facts under the section headings they follow, e.g. ("Experience", [...]).
+
+    Facts before the first heading are grouped under None. Headings are the usual
+    resume section names, lines in capitals or short lines ending with a colon.
+    """
+    groups = [(None, [])]
+    for fact in facts:
+        heading = fact.rstrip(":").strip()
+        if heading.lower() in SECTION_HEADINGS or (len(fact) <= MAX_HEADING_CHARS and (fact.isupper() or fact.endswith(":"))):
+            groups.append((heading.title() if heading.isupper() else heading, []))
+        else:
+            groups[-1][1].append(fact)
+    return [(heading, lines) for heading, lines in groups if lines]
+
+
+@dataclass
+class DocumentFacts:
+    """Deduplicated lines of one uploaded document, grouped by section heading."""
+    name: str
+    groups: list
+
+    @property
+    def fact_count(self) -> int:
+        return sum(len(lines) for _, lines in self.groups)
+
+
+def _fair_shares(costs: list[int], budget: int) -> list[int]:
+    """Split `budget` so no document gets less than an equal share unless it needs less."""
+    shares = [0] * len(costs)
+    remaining = max(budget, 0)
+    for position, index in enumerate(sorted(range(len(costs)), key=costs.__getitem__)):
+        shares[index] = min(costs[index], remaining // (len(costs) - position))
+        remaining -= shares[index]
+    return shares
+
+
+def _select_facts(costs: list[list[int]], share: int) -> tuple[list[set], int]:
+    """
+    Pick facts within `share` tokens, taking them from each group in turn so every
+    section of the document keeps its first lines.
+
+    Returns:
+        tuple[list[set], int]: Indices kept per group and the tokens they use
+    """
+    kept = [set() for _ in costs]
+    used = 0
+    for depth in range(max(map(len, costs), default=0)):
+        for group, group_costs in enumerate(costs):
+            if depth < len(group_costs) and used + group_costs[depth] <= share:
+                kept[group].add(depth)
+                used += group_costs[depth]
+    return kept, used
+
+
+@dataclass
+class CondensedContext:
+    """
+    Compact stand-in for uploaded documents: a draft resume plus deduplicated facts
+    grouped per document and section, trimmed to a token budget.
+
+    Every document gets a fair share of the budget, so a later upload is never crowded
+    out by an earlier one, and the message says which documents lost lines.
+    """
+    sources: list = field(default_factory=list)
+    draft: Optional[ResumeData] = None
+    documents: list = field(default_factory=list)
+    token_budget: int = DEFAULT_CONTEXT_TOKEN_BUDGET
+    token_count: int = 0
+    omitted: dict = field(default_factory=dict)
+
+    @property
+    def omitted_facts(self) -> int:
+        """Lines left out of the last rendered message."""
+        return sum(self.omitted.values())
+
+    def add_document(self, name: str, pages: list[str], resume: Optional[ResumeData] = None) -> None:
+        """
+        Merge one extracted document into the context. `resume` is the document already
+        parsed into ResumeData (e.g. a PDF generated by this tool); JSON files matching
+        the schema are detected here.
+        """
+        self.sources.append(name)
+        resume = resume or parse_resume_json(pages)
+        if resume is not None:
+            # A ResumeData JSON file is already the most compact form; keep the latest one
+            self.draft = resume
+            return
+        seen = {fact.lower() for document in self.documents for _, lines in document.groups for fact in lines}
+        groups = group_facts(extract_facts(pages, seen))
+        if groups:
+            self.documents.append(DocumentFacts(name, groups))
+
+    def to_message_content(self) -> str:
+        """
+        Render the context as a single message, keeping as many facts of each document
+        as its share of the budget allows. Counts tokens, so run it off the event loop.
+        """
+        header = f"context: condensed from uploaded documents ({', '.join(self.sources)})."
+        parts = [header]
+        if self.draft is not None:
+            parts.append(f"Draft resume (ResumeData JSON): {self.draft.model_dump_json()}")
+        used = estimate_tokens("\n".join(parts))
+
+        # Document and heading lines are always kept so the agent knows what was uploaded
+        costs = [[[estimate_tokens(fact) + 1 for fact in lines] for _, lines in document.groups] for document in self.documents]
+        used += sum(estimate_tokens(f"Facts from {document.name} (000 of 000 lines omitted):") for document in self.documents)
+        used += sum(estimate_tokens(f"{heading}:") for document in self.documents for heading, _ in document.groups if heading)
+        totals = [sum(map(sum, document_costs)) for document_costs in costs]
+        if sum(totals) > self.token_budget - used:
+            used += estimate_tokens(OMISSION_NOTE)
+        shares = _fair_shares(totals, self.token_budget - used)
+
+        self.omitted = {}
+        for document, document_costs, share in zip(self.documents, costs, shares):
+            kept, cost = _select_facts(document_costs, share)
+            used += cost
+            omitted = document.fact_count - sum(map(len, kept))
+            if omitted:
+                self.omitted[document.name] = omitted
+                parts.append(f"Facts from {document.name} ({omitted} of {document.fact_count} lines omitted):")
+            else:
+                parts.append(f"Facts from {document.name}:")
+            for (heading, lines), indices in zip(document.groups, kept):
+                facts = "; ".join(fact for index, fact in enumerate(lines) if index in indices)
+                if heading:
+                    parts.append(f"{heading}: {facts}" if facts else f"{heading}: (omitted)")
+                elif facts:
+                    parts.append(facts)
+
+        if self.omitted:
+            parts.append(OMISSION_NOTE)
+        self.token_count = used
+        return "\n".join(parts)
+
+
+def new_condensed_context() -> CondensedContext:
+    return CondensedContext(token_budget=int(os.getenv("CONTEXT_TOKEN_BUDGET", DEFAULT_CONTEXT_TOKEN_BUDGET)))
@@ -0,0 +1,180 @@
+import asyncio
+import contextvars
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, Iterator, Optional
+
+from telemetry import timed
+
+if TYPE_CHECKING:
+    from models.resume_models import ResumeData
+
+DEFAULT_INGEST_WORKERS = 4
+DEFAULT_MAX_UPLOAD_BYTES = 20 * 1024 * 1024
+DEFAULT_MAX_PAGES = 30
+DEFAULT_MAX_TEXT_CHARS = 200_000
+DEFAULT_EXTRACT_CACHE_SIZE = 128
+# PDFs this tool generated are read straight into ResumeData above this confidence
+DEFAULT_RESUME_PARSE_MIN_CONFIDENCE = 0.9
+
+
+class UploadTooLarge(Exception):
+    """Raised when an uploaded file exceeds the configured byte limit."""
+
+
+@dataclass
+class ExtractedDocument:
+    """Text extracted from one uploaded file."""
+    name: str
+    content_hash: str
+    pages: list = field(default_factory=list)
+    truncated: bool = False
+    cached: bool = False
+    # Set when the file is a resume PDF generated by this tool and was parsed without an LLM
+    resume: Optional["ResumeData"] = None
+    resume_confidence: float = 0.0
+
+
+def hash_file(path: str, chunk_size: int = 1024 * 1024) -> str:
+    """SHA-256 of a file's contents, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def iter_pdf_pages(path: str) -> Iterator[str]:
+    """Yield the text of each PDF page without loading the whole document's text."""
+    try:
+        import pymupdf
+    except ImportError:  # PyMuPDF < 1.24.3 only ships the fitz module name
+        import fitz as pymupdf
+
+    with pymupdf.open(path) as document:
+        for page in document:
+            yield page.get_text()
+
+
+def iter_text_pages(path: str, max_chars: int) -> Iterator[str]:
+    """
+    Yield a plain text file as a single page, reading at most `max_chars` + 1 characters.
+
+    The extra character lets the caller tell a file of exactly `max_chars` from a longer one.
+    """
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        yield f.read(max_chars + 1)
+
+
+class DocumentIngestor:
+    """
+    Extracts text from uploaded files on a thread pool.
+
+    Files are rejected above `max_bytes`, at most `max_pages` pages and `max_chars`
+    characters are read per file (the document is marked truncated beyond that),
+    and extracted text is cached by content hash so the same file uploaded again
+    (in any session) is not parsed twice.
+    """
+    def __init__(self, max_workers: Optional[int] = None, max_bytes: Optional[int] = None, max_pages: Optional[int] = None, max_chars: Optional[int] = None, cache_size: Optional[int] = None):
+        self.max_workers = max_workers or int(os.getenv("INGEST_WORKERS", DEFAULT_INGEST_WORKERS))
+        self.max_bytes = max_bytes or int(os.getenv("MAX_UPLOAD_BYTES", DEFAULT_MAX_UPLOAD_BYTES))
+        self.max_pages = max_pages or int(os.getenv("MAX_UPLOAD_PAGES", DEFAULT_MAX_PAGES))
+        self.max_chars = max_chars or int(os.getenv("MAX_UPLOAD_CHARS", DEFAULT_MAX_TEXT_CHARS))
+        self.cache_size = cache_size or int(os.getenv("EXTRACT_CACHE_SIZE", DEFAULT_EXTRACT_CACHE_SIZE))
+        self.min_resume_confidence = float(os.getenv("RESUME_PARSE_MIN_CONFIDENCE", DEFAULT_RESUME_PARSE_MIN_CONFIDENCE))
+        self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="ingest")
+        self._cache: OrderedDict[str, ExtractedDocument] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _cached(self, content_hash: str) -> Optional[ExtractedDocument]:
+        with self._lock:
+            if content_hash in self._cache:
+                self._cache.move_to_end(content_hash)
+                return self._cache[content_hash]
+        return None
+
+    def _remember(self, document: ExtractedDocument) -> None:
+        content_hash = document.content_hash
+        with self._lock:
+            self._cache[content_hash] = document
+            self._cache.move_to_end(content_hash)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    @timed("file_extract")
+    def extract(self, path: str, name: str) -> ExtractedDocument:
+        """Extract one file synchronously, honouring the size and page limits."""
+        size = os.path.getsize(path)
+        if size > self.max_bytes:
+            raise UploadTooLarge(f"{name} is {size / 1024 / 1024:.1f} MB; the limit is {self.max_bytes / 1024 / 1024:.0f} MB")
+
+        content_hash = hash_file(path)
+        cached = self._cached(content_hash)
+        if cached is not None:
+            return replace(cached, name=name, cached=True)
+
+        is_pdf = name.lower().endswith(".pdf")
+        if is_pdf:
+            page_iter = iter_pdf_pages(path)
+        else:
+            page_iter = iter_text_pages(path, self.max_chars)
+
+        pages, chars, truncated = [], 0, False
+        for page_text in page_iter:
+            if len(pages) == self.max_pages:
+                truncated = True
+                break
+            if chars + len(page_text) > self.max_chars:
+                # Keep the part of the page that fits
+                pages.append(page_text[:self.max_chars - chars])
+                truncated = True
+                break
+            pages.append(page_text)
+            chars += len(page_text)
+        page_iter.close()
+
+        document = ExtractedDocument(name, content_hash, pages, truncated)
+        if is_pdf and not truncated:
+            self._parse_resume(path, document)
+        self._remember(document)
+        return document
+
+    def _parse_resume(self, path: str, document: ExtractedDocument) -> None:
+        """Attach the ResumeData of a PDF generated by this tool when it parses confidently."""
+        # Imported here: the parser loads the resume styles and with them ReportLab
+        from ingestion.resume_parser import parse_resume_pdf
+
+        parsed = parse_resume_pdf(path)
+        document.resume_confidence = parsed.confidence
+        if parsed.resume is not None and parsed.confidence >= self.min_resume_confidence:
+            document.resume = parsed.resume
+
+    async def extract_many(self, files: list[tuple[str, str]]) -> list:
+        """
+        Extract several (path, name) files concurrently.
+
+        Returns:
+            list: An ExtractedDocument or the raised exception per file, in input order.
+        """
+        loop = asyncio.get_running_loop()
+        # Each extraction runs in a copy of the caller's context so its spans carry the session's log fields
+        futures = [
+            loop.run_in_executor(self._pool, contextvars.copy_context().run, self.extract, path, name)
+            for path, name in files
+        ]
+        return await asyncio.gather(*futures, return_exceptions=True)
+
+
+_ingestor: Optional[DocumentIngestor] = None
+
+
+def get_document_ingestor() -> DocumentIngestor:
+    """Return the process-wide document ingestor, creating it on first use."""
+    global _ingestor
+    if _ingestor is None:
+        _ingestor = DocumentIngestor()
+    return _ingestor
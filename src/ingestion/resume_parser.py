@@ -0,0 +1,363 @@
+import os
+import re
+from dataclasses import dataclass, field
+from typing import Optional
+
+from pydantic import ValidationError
+
+from constants import FULL_COLUMN_WIDTH, GARAMOND_REGULAR_FONT_PATH, GARAMOND_SEMIBOLD_FONT_PATH
+from constants.resume_constants import (
+    COMPANY_HEADING_PARAGRAPH_STYLE,
+    CONTACT_PARAGRAPH_STYLE,
+    JOB_DETAILS_PARAGRAPH_STYLE,
+    NAME_PARAGRAPH_STYLE,
+    SECTION_PARAGRAPH_STYLE,
+)
+from models.resume_models import ResumeData
+from telemetry import timed
+
+# Fonts are embedded under the TTF file name, e.g. "EBGaramond-SemiBold"
+REGULAR_FONT = os.path.splitext(os.path.basename(GARAMOND_REGULAR_FONT_PATH))[0]
+SEMIBOLD_FONT = os.path.splitext(os.path.basename(GARAMOND_SEMIBOLD_FONT_PATH))[0]
+
+# Section headings as rendered (uppercase) -> ResumeData field
+SECTION_FIELDS = {
+    'WORK EXPERIENCE': 'experience',
+    'EDUCATION': 'education',
+    'SKILLS': 'skills',
+}
+CONTACT_SEPARATOR = ' • '
+BULLET = '•'
+# Font sizes and positions are compared with these tolerances in points
+SIZE_TOLERANCE = 0.3
+ROW_TOLERANCE = 2.0
+DEFAULT_MAX_PARSE_PAGES = 5
+
+
+@dataclass
+class ParsedResume:
+    """Result of reading a PDF generated by this tool back into ResumeData."""
+    resume: Optional[ResumeData]
+    confidence: float
+    issues: list = field(default_factory=list)
+
+
+@dataclass
+class _Line:
+    page: int
+    x0: float
+    y0: float
+    spans: list
+    kind: str = ''
+
+    @property
+    def text(self) -> str:
+        return _clean(''.join(text for _, _, text in self.spans))
+
+    @property
+    def body(self) -> str:
+        """Text without a leading bullet."""
+        spans = self.spans[1:] if self.kind == 'bullet' else self.spans
+        return _clean(''.join(text for _, _, text in spans))
+
+
+def _clean(text: str) -> str:
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+def _join(first: str, second: str) -> str:
+    return f"{first} {second}".strip()
+
+
+def _read_lines(document, max_pages: int) -> list:
+    lines = []
+    for page_number, page in enumerate(document):
+        if page_number == max_pages:
+            break
+        for block in page.get_text('dict')['blocks']:
+            for line in block.get('lines', []):
+                spans = [(span['font'], span['size'], span['text']) for span in line['spans'] if span['text']]
+                if spans and _clean(''.join(text for _, _, text in spans)):
+                    x0, y0 = line['spans'][0]['bbox'][:2]
+                    lines.append(_Line(page_number, x0, y0, spans))
+    lines.sort(key=lambda line: (line.page, round(line.y0), line.x0))
+
+    # Scaled layouts emit the bullet glyph as a line of its own; attach it to its text
+    merged = []
+    for index, line in enumerate(lines):
+        if _clean(line.text) != BULLET:
+            merged.append(line)
+            continue
+        neighbours = [lines[i] for i in (index - 1, index + 1) if 0 <= i < len(lines)]
+        target = next((other for other in neighbours if other.page == line.page and other.x0 > line.x0
+                       and abs(other.y0 - line.y0) <= ROW_TOLERANCE), None)
+        if target is None:
+            merged.append(line)
+        else:
+            target.spans = line.spans + target.spans
+            target.x0 = line.x0
+    return merged
+
+
+class _Classifier:
+    """Assigns each line the role implied by its font, size and column."""
+    def __init__(self, scale: float, left: float):
+        self.scale = scale
+        self.left = left
+        self.split = left + FULL_COLUMN_WIDTH * 0.7 - ROW_TOLERANCE
+        self.indent = left + JOB_DETAILS_PARAGRAPH_STYLE.leftIndent * scale / 2
+
+    def _is(self, span, font: str, style) -> bool:
+        return span[0] == font and abs(span[1] - style.fontSize * self.scale) <= SIZE_TOLERANCE
+
+    def classify(self, line: _Line) -> str:
+        first = line.spans[0]
+        if first[2].strip() == BULLET:
+            return 'bullet'
+        if self._is(first, SEMIBOLD_FONT, SECTION_PARAGRAPH_STYLE) and line.text.upper() in SECTION_FIELDS:
+            return 'section'
+        if self._is(first, SEMIBOLD_FONT, COMPANY_HEADING_PARAGRAPH_STYLE):
+            return 'heading'
+        if self._is(first, REGULAR_FONT, CONTACT_PARAGRAPH_STYLE):
+            return 'contact'
+        if self._is(first, REGULAR_FONT, JOB_DETAILS_PARAGRAPH_STYLE):
+            if line.x0 >= self.split:
+                return 'right'
+            return 'indent' if line.x0 > self.indent else 'left'
+        return 'unknown'
+
+
+def _group_rows(lines: list) -> list:
+    """Pair left-column lines with the right-column line on the same baseline."""
+    rows = []
+    for line in lines:
+        previous = rows[-1] if rows else None
+        if (line.kind == 'right' and previous and previous[1] is None and previous[0] is not None
+                and previous[0].page == line.page and abs(previous[0].y0 - line.y0) <= ROW_TOLERANCE):
+            rows[-1] = (previous[0], line)
+        elif line.kind == 'right':
+            rows.append((None, line))
+        else:
+            rows.append((line, None))
+    return rows
+
+
+class _ResumeBuilder:
+    """Consumes classified rows section by section and builds the ResumeData fields."""
+    def __init__(self):
+        self.data = {'education': [], 'experience': [], 'skills': []}
+        self.section = None
+        self.last = None  # (entry dict, key) the next continuation line extends
+        self.last_right = None
+        self.issues = []
+        self.placed_chars = 0
+
+    def _place(self, line) -> None:
+        self.placed_chars += len(line.text)
+
+    def _dates(self, text: str) -> tuple[str, str]:
+        parts = text.split(' - ', 1)
+        if len(parts) != 2:
+            self.issues.append(f"unrecognised dates: {text}")
+            return text, ''
+        return parts[0], parts[1]
+
+    def add_row(self, left: Optional[_Line], right: Optional[_Line]) -> None:
+        if left is None:
+            # A wrapped right-column paragraph (long location or dates)
+            if self.last_right is None:
+                self.issues.append(f"unplaced text: {right.text}")
+                return
+            entry, key = self.last_right
+            entry[key] = _join(entry[key], right.text)
+            self._place(right)
+            return
+
+        if left.kind == 'section':
+            self.section = SECTION_FIELDS[left.text.upper()]
+            self.last = self.last_right = None
+            self._place(left)
+            return
+        handler = getattr(self, f"_{self.section}", None) if self.section else None
+        if handler is None or not handler(left, right):
+            self.issues.append(f"unplaced text: {left.text}")
+            return
+        self._place(left)
+        if right is not None:
+            self._place(right)
+
+    def _extend(self, line: _Line) -> bool:
+        if self.last is None:
+            return False
+        entry, key = self.last
+        if isinstance(entry[key], list):
+            entry[key][-1] = _join(entry[key][-1], line.body)
+        else:
+            entry[key] = _join(entry[key], line.body)
+        return True
+
+    def _experience(self, left: _Line, right: Optional[_Line]) -> bool:
+        entries = self.data['experience']
+        if left.kind == 'heading':
+            if right is None and self.last and self.last[1] == 'company':
+                return self._extend(left)
+            entries.append({'company': left.text, 'location': right.text if right else '', 'positions': [], 'description': []})
+            self.last, self.last_right = (entries[-1], 'company'), (entries[-1], 'location')
+            return True
+        if not entries:
+            return False
+        entry = entries[-1]
+        if left.kind == 'left':
+            if right is None:
+                return self.last is not None and self.last[1] == 'title' and self._extend(left)
+            start_date, end_date = self._dates(right.text)
+            entry['positions'].append({'title': left.text, 'start_date': start_date, 'end_date': end_date})
+            self.last = (entry['positions'][-1], 'title')
+            self.last_right = None
+            return True
+        if left.kind == 'bullet':
+            entry['description'].append(left.body)
+            self.last, self.last_right = (entry, 'description'), None
+            return True
+        if left.kind == 'indent':
+            return self.last is not None and self.last[1] == 'description' and self._extend(left)
+        return False
+
+    def _education(self, left: _Line, right: Optional[_Line]) -> bool:
+        entries = self.data['education']
+        if left.kind == 'heading':
+            if right is None and self.last and self.last[1] == 'institution':
+                return self._extend(left)
+            entries.append({'institution': left.text, 'location': right.text if right else '', 'course': '', 'start_date': '', 'end_date': ''})
+            self.last, self.last_right = (entries[-1], 'institution'), (entries[-1], 'location')
+            return True
+        if not entries or left.kind != 'left':
+            return False
+        entry = entries[-1]
+        if right is None:
+            return self.last is not None and self.last[1] == 'course' and self._extend(left)
+        entry['course'] = left.text
+        entry['start_date'], entry['end_date'] = self._dates(right.text)
+        self.last, self.last_right = (entry, 'course'), None
+        return True
+
+    def _skills(self, left: _Line, right: Optional[_Line]) -> bool:
+        entries = self.data['skills']
+        if left.kind == 'bullet':
+            title = _clean(''.join(text for font, _, text in left.spans[1:] if font == SEMIBOLD_FONT))
+            if not title.endswith(':'):
+                return False
+            elements = left.body[len(title):].strip()
+            entries.append({'title': title[:-1], 'elements': elements})
+            self.last = (entries[-1], 'elements')
+            return True
+        if left.kind == 'indent':
+            return self.last is not None and self._extend(left)
+        return False
+
+    def skills(self) -> list:
+        return [{'title': entry['title'], 'elements': _split_elements(entry['elements'])} for entry in self.data['skills']]
+
+
+def _split_elements(text: str) -> list:
+    """Split a skill line on ", " but not inside brackets, e.g. "Fabrics (silk, velvet)"."""
+    elements, depth, start = [], 0, 0
+    for index, char in enumerate(text):
+        if char in '([{':
+            depth += 1
+        elif char in ')]}':
+            depth = max(0, depth - 1)
+        elif depth == 0 and text.startswith(', ', index):
+            elements.append(text[start:index])
+            start = index + 2
+    elements.append(text[start:])
+    return [element for element in elements if element]
+
+
+def _parse_header(lines: list, issues: list) -> tuple[Optional[dict], int]:
+    """Read the name and contact lines; return the header fields and the lines consumed."""
+    name = lines[0].text
+    contact, consumed = '', 1
+    for line in lines[1:]:
+        if line.kind != 'contact':
+            break
+        contact = _join(contact, line.text)
+        consumed += 1
+    parts = contact.split(CONTACT_SEPARATOR)
+    if len(parts) < 3:
+        return None, consumed
+    if len(parts) > 4:
+        issues.append("contact line has extra separators")
+        parts = parts[:2] + [CONTACT_SEPARATOR.join(parts[2:-1]), parts[-1]]
+    header = {'name': name, 'email': parts[0], 'phone': parts[1], 'address': parts[2],
+              'linkedin': parts[3] if len(parts) == 4 else ''}
+    return header, consumed
+
+
+@timed("resume_parse")
+def parse_resume_pdf(path: str, max_pages: int = DEFAULT_MAX_PARSE_PAGES) -> ParsedResume:
+    """
+    Rebuild ResumeData from a PDF rendered by this tool, without an LLM.
+
+    Each text line is classified by the fonts, sizes and columns the resume styles
+    produce, so the original fields are recovered exactly rather than guessed. Other
+    PDFs are rejected quickly with zero confidence. Projects are not part of the
+    rendered layout, so they cannot be recovered.
+
+    Returns:
+        ParsedResume: The resume (None when it could not be rebuilt) and a confidence
+        in [0, 1] that drops with every line left unplaced or structure that looks off.
+    """
+    try:
+        import pymupdf
+    except ImportError:  # PyMuPDF < 1.24.3 only ships the fitz module name
+        import fitz as pymupdf
+
+    with pymupdf.open(path) as document:
+        metadata = document.metadata or {}
+        if 'ReportLab' not in (metadata.get('producer') or ''):
+            return ParsedResume(None, 0.0, ["not produced by ReportLab"])
+        lines = _read_lines(document, max_pages)
+        truncated = document.page_count > max_pages
+
+    if not lines or lines[0].spans[0][0] != SEMIBOLD_FONT:
+        return ParsedResume(None, 0.0, ["no Garamond name line"])
+    # The fit engine may have scaled every font by the same factor
+    scale = lines[0].spans[0][1] / NAME_PARAGRAPH_STYLE.fontSize
+    classifier = _Classifier(scale, min(line.x0 for line in lines))
+    for line in lines:
+        line.kind = classifier.classify(line)
+
+    issues = ["only the first pages were read"] if truncated else []
+    header, consumed = _parse_header(lines, issues)
+    if header is None:
+        return ParsedResume(None, 0.0, ["contact line not recognised"])
+
+    builder = _ResumeBuilder()
+    builder.issues = issues
+    for left, right in _group_rows(lines[consumed:]):
+        builder.add_row(left, right)
+
+    for field_name in ('experience', 'education', 'skills'):
+        if not builder.data[field_name]:
+            issues.append(f"no {field_name} entries")
+    for entry in builder.data['experience']:
+        if not entry['positions']:
+            issues.append(f"no positions under {entry['company']}")
+    if metadata.get('title') != f"Resume of {header['name']}":
+        issues.append("document title does not match the name")
+
+    try:
+        resume = ResumeData(
+            header=header,
+            education=builder.data['education'],
+            experience=builder.data['experience'],
+            skills=builder.skills(),
+        )
+    except ValidationError as e:
+        return ParsedResume(None, 0.0, issues + [f"invalid resume: {e.error_count()} errors"])
+
+    total_chars = sum(len(line.text) for line in lines)
+    placed_chars = sum(len(line.text) for line in lines[:consumed]) + builder.placed_chars
+    confidence = placed_chars / total_chars * 0.9 ** len(issues)
+    return ParsedResume(resume, round(confidence, 3), issues)
@@ -0,0 +1,36 @@
+# This package contains the layers wrapped around the chat model
+from llm.cache import (
+    ResponseCache,
+    current_cache_partition,
+    get_response_cache,
+    normalize_prompt,
+    similarity
+)
+from llm.scheduled_model import (
+    ScheduledChatModelMixin,
+    estimate_request_tokens,
+    scheduled_chat_model
+)
+from llm.scheduler import (
+    AdmissionScheduler,
+    ModelOverloaded,
+    TokenBucket,
+    current_client,
+    get_scheduler
+)
+
+__all__ = [
+    'ResponseCache',
+    'current_cache_partition',
+    'get_response_cache',
+    'normalize_prompt',
+    'similarity',
+    'ScheduledChatModelMixin',
+    'estimate_request_tokens',
+    'scheduled_chat_model',
+    'AdmissionScheduler',
+    'ModelOverloaded',
+    'TokenBucket',
+    'current_client',
+    'get_scheduler'
+]
@@ -0,0 +1,228 @@
+import contextvars
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Optional, Sequence
+
+from langchain_core.caches import BaseCache
+from langchain_core.messages import messages_from_dict, messages_to_dict
+from langchain_core.outputs import ChatGeneration, Generation
+
+from telemetry import register_stats
+
+DEFAULT_LLM_CACHE_PATH = "../output/.llm_cache.sqlite"
+DEFAULT_LLM_CACHE_TTL = 7 * 24 * 60 * 60
+DEFAULT_LLM_CACHE_ENTRIES = 5000
+DEFAULT_SIMILARITY = 0.9
+# Only messages at least this long (job descriptions, not "yes please") are matched approximately
+MIN_NEAR_DUPLICATE_CHARS = 400
+NEAR_DUPLICATE_CANDIDATES = 50
+SHINGLE_SIZE = 3
+
+# Owner (user or session) of the current request's cache entries; entries are only
+# reused within the same partition, "" shares them between everyone
+current_cache_partition: contextvars.ContextVar[str] = contextvars.ContextVar("llm_cache_partition", default="")
+
+# Message fields that change between otherwise identical conversations and are not sent as content
+_VOLATILE_FIELDS = {'id', 'response_metadata', 'usage_metadata', 'additional_kwargs', 'invalid_tool_calls'}
+
+
+def _normalize_text(text: str) -> str:
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+def normalize_prompt(prompt: str) -> list:
+    """
+    Reduce a serialized message list to what the model actually sees.
+
+    Volatile metadata is dropped, whitespace in text content is collapsed and tool
+    call ids are renumbered in order of appearance, so the same conversation
+    replayed in a new session produces the same key.
+    """
+    call_ids: dict[str, str] = {}
+
+    def call_id(value: str) -> str:
+        return call_ids.setdefault(value, f"call_{len(call_ids)}")
+
+    normalized = []
+    for message in json.loads(prompt):
+        fields = message.get('kwargs', message)
+        entry = {key: value for key, value in fields.items() if key not in _VOLATILE_FIELDS}
+        if isinstance(entry.get('content'), str):
+            entry['content'] = _normalize_text(entry['content'])
+        if entry.get('tool_calls'):
+            entry['tool_calls'] = [{**tool_call, 'id': call_id(tool_call.get('id') or '')} for tool_call in entry['tool_calls']]
+        if entry.get('tool_call_id'):
+            entry['tool_call_id'] = call_id(entry['tool_call_id'])
+        normalized.append(entry)
+    return normalized
+
+
+def _digest(*parts: str) -> str:
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def _shingles(text: str) -> set:
+    words = text.lower().split()
+    return {' '.join(words[i:i + SHINGLE_SIZE]) for i in range(max(1, len(words) - SHINGLE_SIZE + 1))}
+
+
+def similarity(first: str, second: str) -> float:
+    """Jaccard similarity of the word 3-gram sets of two texts."""
+    first_shingles, second_shingles = _shingles(first), _shingles(second)
+    if not first_shingles or not second_shingles:
+        return 0.0
+    return len(first_shingles & second_shingles) / len(first_shingles | second_shingles)
+
+
+class ResponseCache(BaseCache):
+    """
+    SQLite-backed LangChain cache for chat model responses.
+
+    Entries are keyed by the normalized messages plus the model's llm_string, which
+    already covers the deployment, sampling parameters and bound tool schemas, and by
+    `current_cache_partition`, so one user's answers are never replayed to another.
+    Entries expire after `ttl_seconds`, and the least recently used ones are dropped
+    beyond `max_entries`.
+
+    With `near_duplicates` on, a miss whose last message is a long human message
+    (typically a pasted job description) may be answered from an entry with the same
+    earlier conversation and a last message at least `similarity_threshold` similar.
+    """
+    def __init__(self, path: str, ttl_seconds: float = DEFAULT_LLM_CACHE_TTL, max_entries: int = DEFAULT_LLM_CACHE_ENTRIES,
+                 near_duplicates: bool = False, similarity_threshold: float = DEFAULT_SIMILARITY):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.near_duplicates = near_duplicates
+        self.similarity_threshold = similarity_threshold
+        self.hits = 0
+        self.near_hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(
+            """
+            PRAGMA journal_mode=WAL;
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                context_key TEXT NOT NULL,
+                last_message TEXT NOT NULL,
+                response TEXT NOT NULL,
+                created REAL NOT NULL,
+                last_used REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS responses_context ON responses (context_key, last_used);
+            CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used);
+            """
+        )
+
+    def _keys(self, prompt: str, llm_string: str) -> tuple[str, str, str]:
+        """Exact key, key of everything but the last message, and the last human message text."""
+        messages = normalize_prompt(prompt)
+        last = messages[-1] if messages else {}
+        last_message = last.get('content') if last.get('type') == 'human' and isinstance(last.get('content'), str) else ''
+        partition = current_cache_partition.get()
+        exact_key = _digest(partition, llm_string, json.dumps(messages, sort_keys=True))
+        context_key = _digest(partition, llm_string, json.dumps(messages[:-1], sort_keys=True))
+        return exact_key, context_key, last_message
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[Sequence[Generation]]:
+        exact_key, context_key, last_message = self._keys(prompt, llm_string)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT key, response FROM responses WHERE key = ? AND created >= ?", (exact_key, now - self.ttl_seconds)
+            ).fetchone()
+            if row is not None:
+                self.hits += 1
+            elif self.near_duplicates and len(last_message) >= MIN_NEAR_DUPLICATE_CHARS:
+                row = self._near_duplicate(context_key, last_message, now)
+                if row is not None:
+                    self.near_hits += 1
+            if row is None:
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE responses SET last_used = ? WHERE key = ?", (now, row[0]))
+            self._conn.commit()
+        return [ChatGeneration(message=message) for message in messages_from_dict(json.loads(row[1]))]
+
+    def _near_duplicate(self, context_key: str, last_message: str, now: float) -> Optional[tuple]:
+        candidates = self._conn.execute(
+            "SELECT key, response, last_message FROM responses WHERE context_key = ? AND created >= ? "
+            "ORDER BY last_used DESC LIMIT ?",
+            (context_key, now - self.ttl_seconds, NEAR_DUPLICATE_CANDIDATES),
+        ).fetchall()
+        best, best_score = None, self.similarity_threshold
+        for key, response, candidate in candidates:
+            if len(candidate) < MIN_NEAR_DUPLICATE_CHARS:
+                continue
+            score = similarity(last_message, candidate)
+            if score >= best_score:
+                best, best_score = (key, response), score
+        return best
+
+    def update(self, prompt: str, llm_string: str, return_val: Sequence[Generation]) -> None:
+        messages = [generation.message for generation in return_val if isinstance(generation, ChatGeneration)]
+        if not messages:
+            return
+        exact_key, context_key, last_message = self._keys(prompt, llm_string)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, context_key, last_message, response, created, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (exact_key, context_key, last_message, json.dumps(messages_to_dict(messages)), now, now),
+            )
+            self._evict(now)
+            self._conn.commit()
+
+    def _evict(self, now: float) -> None:
+        self._conn.execute("DELETE FROM responses WHERE created < ?", (now - self.ttl_seconds,))
+        self._conn.execute(
+            "DELETE FROM responses WHERE key IN (SELECT key FROM responses ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        )
+
+    def clear(self, **kwargs: Any) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+            self.hits = self.near_hits = self.misses = 0
+
+    def stats(self) -> dict:
+        """Entry count and hit/miss counters since start-up; each lookup counts once, as an exact hit, a near hit or a miss."""
+        with self._lock:
+            (entries,) = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()
+        return {"entries": entries, "hits": self.hits, "near_hits": self.near_hits, "misses": self.misses}
+
+
+_response_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """Return the process-wide response cache, or None when LLM_CACHE_PATH is empty."""
+    global _response_cache
+    path = os.getenv("LLM_CACHE_PATH", DEFAULT_LLM_CACHE_PATH)
+    if not path:
+        return None
+    if _response_cache is None:
+        _response_cache = ResponseCache(
+            path,
+            ttl_seconds=float(os.getenv("LLM_CACHE_TTL", DEFAULT_LLM_CACHE_TTL)),
+            max_entries=int(os.getenv("LLM_CACHE_ENTRIES", DEFAULT_LLM_CACHE_ENTRIES)),
+            near_duplicates=os.getenv("LLM_CACHE_NEAR_DUPLICATES", "false").lower() in ("1", "true", "yes"),
+            similarity_threshold=float(os.getenv("LLM_CACHE_SIMILARITY", DEFAULT_SIMILARITY)),
+        )
+        register_stats("cv_maker_llm_cache", _response_cache.stats, counters=("hits", "near_hits", "misses"))
+    return _response_cache
@@ -0,0 +1,110 @@
+import json
+import time
+from functools import lru_cache
+from typing import Any, AsyncIterator, Optional
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import ChatGenerationChunk, ChatResult
+
+from ingestion.condense import estimate_tokens
+from llm.scheduler import Ticket, get_scheduler
+from telemetry import record_span, span
+
+DEFAULT_COMPLETION_TOKENS = 1000
+
+
+def estimate_request_tokens(messages: list[BaseMessage], **kwargs: Any) -> int:
+    """Rough prompt + completion size of a call, used until the actual usage is known."""
+    prompt = sum(estimate_tokens(str(message.content)) for message in messages)
+    # Bound tool schemas are sent with every request
+    prompt += estimate_tokens(json.dumps(kwargs.get("tools", []), default=str))
+    return prompt + int(kwargs.get("max_tokens") or DEFAULT_COMPLETION_TOKENS)
+
+
+def _total_tokens(message: Optional[BaseMessage]) -> Optional[int]:
+    usage = getattr(message, "usage_metadata", None)
+    return usage.get("total_tokens") if usage else None
+
+
+def _record_wait(ticket: Ticket) -> None:
+    record_span("llm_queue_wait", ticket.admitted - ticket.enqueued, client=ticket.client)
+
+
+class ScheduledChatModelMixin:
+    """
+    Routes a chat model's API calls through the process-wide AdmissionScheduler.
+
+    Mix it in before the provider class so cache hits (checked by LangChain before
+    `_agenerate`/`_astream`) skip admission. The scheduler owns retries, so the
+    provider client should be created with max_retries=0.
+    """
+    async def _agenerate(self, messages: list[BaseMessage], stop: Optional[list[str]] = None,
+                         run_manager=None, **kwargs: Any) -> ChatResult:
+        scheduler = get_scheduler()
+        attempt = 0
+        while True:
+            ticket = await scheduler.acquire(estimate_request_tokens(messages, **kwargs))
+            _record_wait(ticket)
+            try:
+                with span("llm_call", attempt=attempt):
+                    result = await super()._agenerate(messages, stop=stop, run_manager=run_manager, **kwargs)
+            except Exception as e:
+                scheduler.release(ticket, used_tokens=0)
+                if not scheduler.should_retry(e, attempt):
+                    raise
+                await scheduler.backoff(attempt, e)
+                attempt += 1
+                continue
+            used = [_total_tokens(generation.message) for generation in result.generations]
+            scheduler.release(ticket, used_tokens=sum(used) if all(used) else None)
+            return result
+
+    async def _astream(self, messages: list[BaseMessage], stop: Optional[list[str]] = None,
+                       run_manager=None, **kwargs: Any) -> AsyncIterator[ChatGenerationChunk]:
+        scheduler = get_scheduler()
+        attempt = 0
+        while True:
+            ticket = await scheduler.acquire(estimate_request_tokens(messages, **kwargs))
+            _record_wait(ticket)
+            started = time.perf_counter()
+            stream = super()._astream(messages, stop=stop, run_manager=run_manager, **kwargs)
+            try:
+                # Failures before the first chunk can be retried; later ones reach the caller
+                first = await stream.__anext__()
+            except StopAsyncIteration:
+                scheduler.release(ticket)
+                return
+            except Exception as e:
+                scheduler.release(ticket, used_tokens=0)
+                record_span("llm_call", time.perf_counter() - started, "error", attempt=attempt)
+                if not scheduler.should_retry(e, attempt):
+                    raise
+                await scheduler.backoff(attempt, e)
+                attempt += 1
+                continue
+            break
+
+        record_span("llm_first_chunk", time.perf_counter() - started, attempt=attempt)
+        used, outcome = None, "ok"
+        try:
+            chunk = first
+            while True:
+                used = _total_tokens(chunk.message) or used
+                yield chunk
+                chunk = await stream.__anext__()
+        except StopAsyncIteration:
+            pass
+        except Exception:
+            outcome = "error"
+            raise
+        finally:
+            await stream.aclose()
+            scheduler.release(ticket, used_tokens=used)
+            record_span("llm_call", time.perf_counter() - started, outcome, attempt=attempt, tokens=used)
+
+
+@lru_cache(maxsize=None)
+def scheduled_chat_model(model_class: type[BaseChatModel]) -> type[BaseChatModel]:
+    """Return a subclass of `model_class` whose calls go through the admission scheduler."""
+    return type(f"Scheduled{model_class.__name__}", (ScheduledChatModelMixin, model_class), {})
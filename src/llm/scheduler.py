@@ -0,0 +1,271 @@
+import asyncio
+import contextvars
+import os
+import random
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Optional
+
+from telemetry import register_stats
+
+DEFAULT_TPM = 30_000
+DEFAULT_RPM = 180
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_MAX_QUEUE = 64
+DEFAULT_QUEUE_TIMEOUT = 30
+DEFAULT_MAX_RETRIES = 4
+DEFAULT_BACKOFF_BASE = 1.0
+DEFAULT_BACKOFF_CAP = 30.0
+DEFAULT_OVERLOAD_MESSAGE = "The assistant is handling a lot of requests right now. Please try again in a minute."
+# HTTP statuses worth retrying: rate limited, overloaded, unavailable
+RETRYABLE_STATUSES = {429, 500, 503}
+
+# Fair-share key (session or user) of the request being scheduled
+current_client: contextvars.ContextVar[str] = contextvars.ContextVar("llm_client", default="default")
+
+
+class ModelOverloaded(Exception):
+    """Raised instead of waiting indefinitely when the model queue is full or too slow."""
+
+
+class TokenBucket:
+    """Continuously refilling budget of `per_minute` units, at most one minute's worth banked."""
+    def __init__(self, per_minute: float):
+        self.capacity = per_minute
+        self.rate = per_minute / 60
+        self.level = per_minute
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until `amount` is available; requests above capacity wait for a full bucket."""
+        self._refill(now)
+        needed = min(amount, self.capacity) - self.level
+        return max(0.0, needed / self.rate)
+
+    def take(self, amount: float, now: float) -> None:
+        self._refill(now)
+        self.level -= amount
+
+    def refund(self, amount: float) -> None:
+        self.level = min(self.capacity, self.level + amount)
+
+
+@dataclass
+class Ticket:
+    """An admitted model call; `tokens` is the estimate charged against the token budget."""
+    client: str
+    tokens: int
+    enqueued: float
+    admitted: float = 0.0
+    future: Optional[asyncio.Future] = field(default=None, repr=False)
+
+
+class AdmissionScheduler:
+    """
+    Admission control for model calls in one process.
+
+    Calls are queued per client (chat session or user) and admitted round robin, so
+    one busy session cannot starve the others. A call is admitted when a concurrency
+    slot is free and the request (RPM) and token (TPM) buckets can cover it; token
+    estimates are corrected with the actual usage when the call finishes.
+
+    The queue is bounded: when it is full, or a call waits longer than
+    `queue_timeout`, ModelOverloaded is raised with `overload_message`. A 429 from
+    the service pauses all admissions for the backoff delay instead of letting every
+    session retry at once.
+    """
+    def __init__(self, tpm: int = DEFAULT_TPM, rpm: int = DEFAULT_RPM, max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                 max_per_client: int = 0, max_queue: int = DEFAULT_MAX_QUEUE, queue_timeout: float = DEFAULT_QUEUE_TIMEOUT,
+                 max_retries: int = DEFAULT_MAX_RETRIES, backoff_base: float = DEFAULT_BACKOFF_BASE,
+                 backoff_cap: float = DEFAULT_BACKOFF_CAP, overload_message: str = DEFAULT_OVERLOAD_MESSAGE):
+        self.tokens = TokenBucket(tpm)
+        self.requests = TokenBucket(rpm)
+        self.max_concurrency = max_concurrency
+        self.max_per_client = max_per_client
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.overload_message = overload_message
+        # client -> waiting tickets; the order of clients is the round-robin order
+        self._queues: OrderedDict[str, deque] = OrderedDict()
+        self._active: dict[str, int] = {}
+        self._paused_until = 0.0
+        self._wakeup: Optional[asyncio.Event] = None
+        self._dispatcher: Optional[asyncio.Task] = None
+        self.admitted = 0
+        self.rejected = 0
+        self.retries = 0
+        self.rate_limited = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(len(queue) for queue in self._queues.values())
+
+    @property
+    def active(self) -> int:
+        return sum(self._active.values())
+
+    def stats(self) -> dict:
+        """Queue depth, in-flight calls and admission counters."""
+        return {
+            "queue_depth": self.queue_depth,
+            "queued_clients": len(self._queues),
+            "active": self.active,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "retries": self.retries,
+            "rate_limited": self.rate_limited,
+            "average_wait": self.total_wait / self.admitted if self.admitted else 0.0,
+            "max_wait": self.max_wait,
+        }
+
+    async def acquire(self, tokens: int, client: Optional[str] = None) -> Ticket:
+        """Wait for admission of a call estimated at `tokens` tokens."""
+        client = client or current_client.get()
+        if self.queue_depth >= self.max_queue:
+            self.rejected += 1
+            raise ModelOverloaded(self.overload_message)
+        ticket = Ticket(client, tokens, time.monotonic(), future=asyncio.get_running_loop().create_future())
+        self._queues.setdefault(client, deque()).append(ticket)
+        self._wake()
+        try:
+            await asyncio.wait_for(asyncio.shield(ticket.future), self.queue_timeout)
+        except asyncio.TimeoutError:
+            if ticket.future.done():
+                return ticket
+            self._withdraw(ticket)
+            self.rejected += 1
+            raise ModelOverloaded(self.overload_message) from None
+        except asyncio.CancelledError:
+            if ticket.future.done():
+                self.release(ticket)
+            else:
+                self._withdraw(ticket)
+            raise
+        return ticket
+
+    def release(self, ticket: Ticket, used_tokens: Optional[int] = None) -> None:
+        """Free the ticket's slot and replace its token estimate with the actual usage."""
+        self._active[ticket.client] -= 1
+        if not self._active[ticket.client]:
+            del self._active[ticket.client]
+        if used_tokens is not None:
+            if used_tokens < ticket.tokens:
+                self.tokens.refund(ticket.tokens - used_tokens)
+            else:
+                self.tokens.take(used_tokens - ticket.tokens, time.monotonic())
+        self._wake()
+
+    def backoff_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Full-jitter exponential backoff, never shorter than the server's Retry-After."""
+        delay = random.uniform(0, min(self.backoff_cap, self.backoff_base * 2 ** attempt))
+        return max(delay, retry_after or 0.0)
+
+    async def backoff(self, attempt: int, error: Exception) -> None:
+        """Sleep before retry `attempt` and, on a 429, hold back every other admission too."""
+        delay = self.backoff_delay(attempt, _retry_after(error))
+        self.retries += 1
+        if _status_code(error) == 429:
+            self.rate_limited += 1
+            self._paused_until = max(self._paused_until, time.monotonic() + delay)
+        await asyncio.sleep(delay)
+
+    def should_retry(self, error: Exception, attempt: int) -> bool:
+        return attempt < self.max_retries and _status_code(error) in RETRYABLE_STATUSES
+
+    def _withdraw(self, ticket: Ticket) -> None:
+        queue = self._queues.get(ticket.client)
+        if queue and ticket in queue:
+            queue.remove(ticket)
+            if not queue:
+                del self._queues[ticket.client]
+        self._wake()
+
+    def _wake(self) -> None:
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+        self._wakeup.set()
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.get_running_loop().create_task(self._dispatch())
+
+    def _next_ticket(self) -> Optional[Ticket]:
+        """Head of the first client queue, in round-robin order, that may run another call."""
+        for client, queue in self._queues.items():
+            if not self.max_per_client or self._active.get(client, 0) < self.max_per_client:
+                return queue[0]
+        return None
+
+    async def _dispatch(self) -> None:
+        while self._queues:
+            self._wakeup.clear()
+            now = time.monotonic()
+            ticket = self._next_ticket() if self.active < self.max_concurrency else None
+            if ticket is None:
+                await self._wakeup.wait()
+                continue
+            wait = max(self._paused_until - now, self.requests.wait_time(1, now), self.tokens.wait_time(ticket.tokens, now))
+            if wait > 0:
+                # A release or a new call may change what can run, so wake early for those
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), wait)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            queue = self._queues.pop(ticket.client)
+            queue.popleft()
+            if queue:
+                # Back of the round-robin order
+                self._queues[ticket.client] = queue
+            self.requests.take(1, now)
+            self.tokens.take(ticket.tokens, now)
+            self._active[ticket.client] = self._active.get(ticket.client, 0) + 1
+            ticket.admitted = now
+            waited = now - ticket.enqueued
+            self.admitted += 1
+            self.total_wait += waited
+            self.max_wait = max(self.max_wait, waited)
+            ticket.future.set_result(ticket)
+
+
+def _status_code(error: Exception) -> Optional[int]:
+    return getattr(error, "status_code", None)
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+_scheduler: Optional[AdmissionScheduler] = None
+
+
+def get_scheduler() -> AdmissionScheduler:
+    """Return the process-wide scheduler, sized from the deployment's limits in the environment."""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = AdmissionScheduler(
+            tpm=int(os.getenv("AZURE_OPENAI_TPM", DEFAULT_TPM)),
+            rpm=int(os.getenv("AZURE_OPENAI_RPM", DEFAULT_RPM)),
+            max_concurrency=int(os.getenv("LLM_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY)),
+            max_per_client=int(os.getenv("LLM_MAX_PER_CLIENT", 0)),
+            max_queue=int(os.getenv("LLM_MAX_QUEUE", DEFAULT_MAX_QUEUE)),
+            queue_timeout=float(os.getenv("LLM_QUEUE_TIMEOUT", DEFAULT_QUEUE_TIMEOUT)),
+            max_retries=int(os.getenv("LLM_MAX_RETRIES", DEFAULT_MAX_RETRIES)),
+            overload_message=os.getenv("LLM_OVERLOAD_MESSAGE", DEFAULT_OVERLOAD_MESSAGE),
+        )
+        register_stats("cv_maker_llm_scheduler", _scheduler.stats, counters=("admitted", "rejected", "retries", "rate_limited"))
+    return _scheduler
@@ -0,0 +1,72 @@
+from typing import Any, List, Literal, Optional
+
+import jsonpatch
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+
+from models.resume_models import ResumeData
+
+
+# Validation errors listed in a rejection message
+MAX_REPORTED_ERRORS = 5
+
+
+class ResumePatchError(ValueError):
+    """Raised when a patch does not apply to a resume or the patched resume is invalid."""
+
+
+class PatchOperation(BaseModel):
+    """
+    One JSON Patch (RFC 6902) operation on the resume JSON.
+
+    Paths are JSON Pointers into the resume, e.g. "/experience/0/description/2" for
+    the third bullet of the first company; "-" appends to a list.
+    """
+    model_config = ConfigDict(populate_by_name=True)
+
+    op: Literal["add", "remove", "replace", "move"]
+    path: str = Field(description="JSON Pointer to the value to change, e.g. /skills/1/elements/0")
+    value: Optional[Any] = Field(default=None, description="New value for add and replace")
+    from_: Optional[str] = Field(default=None, alias="from", description="Source pointer for move, e.g. /experience/2")
+
+
+def apply_resume_patch(resume_data: ResumeData, operations: List[PatchOperation]) -> ResumeData:
+    """
+    Apply patch operations to a resume, all or nothing.
+
+    Error messages name the failing operation and path but never quote the resume,
+    since they are returned to the model.
+
+    Args:
+        resume_data: The current resume; it is left unchanged
+        operations: The edits, applied in order
+
+    Returns:
+        ResumeData: The patched and revalidated resume
+
+    Raises:
+        ResumePatchError: If an operation does not apply or the result is not a valid resume
+    """
+    document = resume_data.model_dump()
+    for index, operation in enumerate(operations):
+        try:
+            jsonpatch.JsonPatch([operation.model_dump(by_alias=True, exclude_unset=True)]).apply(document, in_place=True)
+        except (jsonpatch.JsonPatchException, jsonpatch.JsonPointerException) as e:
+            # The library's messages quote the whole document; name the operation and path instead
+            raise ResumePatchError(f"Operation {index} ({operation.op} {_describe_paths(operation)}) does not apply: {_reason(e)}") from e
+    try:
+        return ResumeData.model_validate(document)
+    except ValidationError as e:
+        errors = "; ".join(f"/{'/'.join(map(str, error['loc']))}: {error['msg']}" for error in e.errors()[:MAX_REPORTED_ERRORS])
+        raise ResumePatchError(f"Patched resume is invalid: {errors}") from e
+
+
+def _describe_paths(operation: PatchOperation) -> str:
+    return f"{operation.from_} -> {operation.path}" if operation.from_ else operation.path
+
+
+def _reason(error: Exception) -> str:
+    if isinstance(error, jsonpatch.InvalidJsonPatch):
+        return "the operation is missing a value or source path"
+    if isinstance(error, jsonpatch.JsonPointerException):
+        return "the path does not exist"
+    return "the path does not exist or the list index is out of range"
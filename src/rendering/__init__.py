@@ -0,0 +1,69 @@
+# This package contains the PDF rendering pipeline
+import importlib
+
+from rendering.cache import RenderCache, get_render_cache, resume_cache_key
+from rendering.batch import BatchSummary, run_batch
+from rendering.resume_diff import ResumeDiff, diff_resume
+from rendering.executor import (
+    RenderExecutor,
+    RenderQueueFull,
+    RenderTimeout,
+    get_render_executor,
+    render_affinity
+)
+
+__all__ = [
+    'build_resume_table',
+    'generate_resume',
+    'render_resume',
+    'render_resume_bytes',
+    'FitResult',
+    'fit_resume',
+    'measure_resume_height',
+    'LayoutMetrics',
+    'measure_resume_layout',
+    'layout_cache_stats',
+    'render_resume_html',
+    'render_resume_text',
+    'RenderServiceClient',
+    'RenderedResume',
+    'get_render_client',
+    'ResumeDiff',
+    'diff_resume',
+    'RenderCache',
+    'get_render_cache',
+    'resume_cache_key',
+    'BatchSummary',
+    'run_batch',
+    'RenderExecutor',
+    'RenderQueueFull',
+    'RenderTimeout',
+    'get_render_executor',
+    'render_affinity'
+]
+
+# ReportLab layout code is only needed where documents are actually built (usually
+# the render workers) and the render service client only when one is configured,
+# so both are imported on first attribute access.
+_LAZY_EXPORTS = {
+    'build_resume_table': 'rendering.document',
+    'generate_resume': 'rendering.document',
+    'render_resume': 'rendering.document',
+    'render_resume_bytes': 'rendering.document',
+    'FitResult': 'rendering.fit',
+    'fit_resume': 'rendering.fit',
+    'measure_resume_height': 'rendering.fit',
+    'LayoutMetrics': 'rendering.layout_metrics',
+    'measure_resume_layout': 'rendering.layout_metrics',
+    'layout_cache_stats': 'rendering.section_cache',
+    'render_resume_html': 'rendering.preview',
+    'render_resume_text': 'rendering.preview',
+    'RenderServiceClient': 'rendering.client',
+    'RenderedResume': 'rendering.client',
+    'get_render_client': 'rendering.client',
+}
+
+def __getattr__(name: str):
+    if name in _LAZY_EXPORTS:
+        return getattr(importlib.import_module(_LAZY_EXPORTS[name]), name)
+    raise AttributeError(f"module 'rendering' has no attribute '{name}'")
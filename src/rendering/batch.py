@@ -0,0 +1,152 @@
+import glob
+import json
+import logging
+import math
+import os
+import sys
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass, field
+from typing import Iterator, Optional
+
+from pydantic import ValidationError
+
+from models.resume_models import ResumeData
+from rendering.executor import _init_worker
+from storage import atomic_path, safe_name
+from telemetry import log_event
+
+
+@dataclass
+class BatchSummary:
+    """Aggregated results of a batch render."""
+    rendered: int = 0
+    failures: list = field(default_factory=list)
+    durations: list = field(default_factory=list)
+    wall_time: float = 0.0
+
+    @property
+    def docs_per_second(self) -> float:
+        return self.rendered / self.wall_time if self.wall_time else 0.0
+
+    def percentile(self, pct: float) -> float:
+        """Nearest-rank percentile of the per-document render time, in seconds."""
+        if not self.durations:
+            return 0.0
+        ordered = sorted(self.durations)
+        rank = max(1, math.ceil(pct / 100 * len(ordered)))
+        return ordered[rank - 1]
+
+    def format(self) -> str:
+        return (
+            f"Rendered {self.rendered} documents, {len(self.failures)} failures in {self.wall_time:.2f}s "
+            f"({self.docs_per_second:.1f} docs/sec, p50 {self.percentile(50) * 1000:.0f} ms, "
+            f"p95 {self.percentile(95) * 1000:.0f} ms per document)"
+        )
+
+
+def iter_resume_records(source: str) -> Iterator[tuple[str, dict | Exception]]:
+    """
+    Stream raw resume records from a directory, glob pattern, JSONL file or stdin ("-").
+
+    Yields:
+        tuple[str, dict | Exception]: A record identifier and either the parsed JSON
+        object or the error raised while reading it.
+    """
+    if source == "-" or source.endswith(".jsonl"):
+        stream = sys.stdin if source == "-" else open(source, 'r')
+        name = "stdin" if source == "-" else os.path.basename(source)
+        try:
+            for line_number, line in enumerate(stream, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    yield f"{name}:{line_number}", json.loads(line)
+                except json.JSONDecodeError as e:
+                    yield f"{name}:{line_number}", e
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+        return
+
+    pattern = os.path.join(source, "*.json") if os.path.isdir(source) else source
+    for path in sorted(glob.glob(pattern)):
+        try:
+            with open(path, 'r') as f:
+                yield path, json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            yield path, e
+
+
+def iter_validated_records(source: str) -> Iterator[tuple[str, ResumeData | Exception]]:
+    """Validate each record as it is read, passing errors through per record."""
+    for record_id, record in iter_resume_records(source):
+        if isinstance(record, Exception):
+            yield record_id, record
+            continue
+        try:
+            yield record_id, ResumeData(**record)
+        except (ValidationError, TypeError) as e:
+            yield record_id, e
+
+
+def _render_batch_job(resume_dict: dict, output_pdf_path: str) -> float:
+    """Worker entry point that reports the time spent rendering one document."""
+    from rendering.document import render_resume
+    started = time.perf_counter()
+    # Render next to the target and rename, so an existing PDF is never left half-written
+    with atomic_path(output_pdf_path) as tmp_path:
+        render_resume(ResumeData(**resume_dict), tmp_path)
+    return time.perf_counter() - started
+
+
+def run_batch(source: str, output_dir: str = '../output', workers: Optional[int] = None) -> BatchSummary:
+    """
+    Render every resume record found in `source` into `output_dir` using all cores.
+
+    Records are read and validated lazily, and at most two jobs per worker are kept
+    in flight so large inputs are never fully materialized.
+    """
+    workers = workers or os.cpu_count() or 1
+    os.makedirs(output_dir, exist_ok=True)
+    summary = BatchSummary()
+    used_names: dict[str, int] = {}
+    in_flight = {}
+    started = time.perf_counter()
+
+    def collect(done) -> None:
+        for future in done:
+            record_id = in_flight.pop(future)
+            try:
+                summary.durations.append(future.result())
+                summary.rendered += 1
+            except Exception as e:
+                summary.failures.append((record_id, e))
+                log_event("batch_render_failed", logging.WARNING, record=record_id, error=str(e))
+
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"), initializer=_init_worker) as pool:
+        for record_id, resume_data in iter_validated_records(source):
+            if isinstance(resume_data, Exception):
+                summary.failures.append((record_id, resume_data))
+                log_event("batch_record_invalid", logging.WARNING, record=record_id, error=str(resume_data))
+                continue
+
+            # Keep names stable but unique when several records share a person's name
+            name = safe_name(resume_data.get_output_filename())
+            used_names[name] = used_names.get(name, 0) + 1
+            if used_names[name] > 1:
+                name = f"{name}_{used_names[name]}"
+            output_pdf_path = os.path.join(output_dir, f"{name}.pdf")
+
+            if len(in_flight) >= workers * 2:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                collect(done)
+            in_flight[pool.submit(_render_batch_job, resume_data.model_dump(), output_pdf_path)] = record_id
+
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            collect(done)
+
+    summary.wall_time = time.perf_counter() - started
+    return summary
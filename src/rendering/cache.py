@@ -0,0 +1,139 @@
+import asyncio
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from typing import Awaitable, Callable, Optional
+
+from models.resume_models import ResumeData
+from storage import atomic_write
+from telemetry import register_stats
+
+DEFAULT_CACHE_DIR = '../output/.render_cache'
+DEFAULT_MEMORY_ENTRIES = 64
+DEFAULT_DISK_BYTES = 256 * 1024 * 1024
+
+
+def resume_cache_key(resume_data: ResumeData, variant: str = "") -> str:
+    """Canonical content hash of a validated resume, the layout version and a render variant (e.g. scale)."""
+    # Imported here to keep ReportLab styles out of the import path of callers
+    from constants.resume_constants import LAYOUT_VERSION
+    canonical = json.dumps(resume_data.model_dump(), sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(f"{LAYOUT_VERSION}:{variant}:{canonical}".encode('utf-8')).hexdigest()
+
+
+class RenderCache:
+    """
+    Two-tier cache of rendered PDF bytes keyed by resume_cache_key().
+
+    The memory tier is an LRU bounded by entry count; the optional disk tier is
+    bounded by total size and evicts the least recently used files first.
+    Concurrent requests for the same key share a single render (single-flight).
+    """
+    def __init__(self, max_entries: Optional[int] = None, cache_dir: Optional[str] = None, max_disk_bytes: Optional[int] = None):
+        self.max_entries = max_entries if max_entries is not None else int(os.getenv("RENDER_CACHE_ENTRIES", DEFAULT_MEMORY_ENTRIES))
+        self.cache_dir = cache_dir if cache_dir is not None else os.getenv("RENDER_CACHE_DIR", DEFAULT_CACHE_DIR)
+        self.max_disk_bytes = max_disk_bytes if max_disk_bytes is not None else int(os.getenv("RENDER_CACHE_DISK_BYTES", DEFAULT_DISK_BYTES))
+        self._memory: OrderedDict[str, bytes] = OrderedDict()
+        self._in_flight: dict[str, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict:
+        """Memory tier size and hit/miss counters since start-up."""
+        return {"entries": len(self._memory), "hits": self.hits, "misses": self.misses}
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.pdf")
+
+    def _remember(self, key: str, pdf_bytes: bytes) -> None:
+        self._memory[key] = pdf_bytes
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _read_disk(self, key: str) -> Optional[bytes]:
+        if not self.cache_dir:
+            return None
+        path = self._disk_path(key)
+        try:
+            with open(path, 'rb') as f:
+                pdf_bytes = f.read()
+        except FileNotFoundError:
+            return None
+        # Refresh the access time so eviction follows recent use
+        os.utime(path)
+        return pdf_bytes
+
+    def _write_disk(self, key: str, pdf_bytes: bytes) -> None:
+        if not self.cache_dir or len(pdf_bytes) > self.max_disk_bytes:
+            return
+        atomic_write(self._disk_path(key), pdf_bytes)
+        self._evict_disk()
+
+    def _evict_disk(self) -> None:
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith('.pdf'):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    async def get_or_render(self, key: str, render: Callable[[], Awaitable[bytes]]) -> bytes:
+        """Return cached bytes for `key`, rendering them at most once if absent."""
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return self._memory[key]
+
+        if key in self._in_flight:
+            self.hits += 1
+            return await asyncio.shield(self._in_flight[key])
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            pdf_bytes = await asyncio.to_thread(self._read_disk, key)
+            if pdf_bytes is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+                pdf_bytes = await render()
+                await asyncio.to_thread(self._write_disk, key, pdf_bytes)
+            self._remember(key, pdf_bytes)
+            future.set_result(pdf_bytes)
+            return pdf_bytes
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Followers observe the failure; keep the loop from logging it as unretrieved
+            future.exception()
+            raise
+        finally:
+            del self._in_flight[key]
+
+    async def render(self, resume_data: ResumeData, render: Callable[[], Awaitable[bytes]], variant: str = "") -> bytes:
+        """Convenience wrapper keyed by the resume's canonical hash."""
+        return await self.get_or_render(resume_cache_key(resume_data, variant), render)
+
+
+_cache: Optional[RenderCache] = None
+
+
+def get_render_cache() -> RenderCache:
+    """Return the process-wide render cache, creating it on first use."""
+    global _cache
+    if _cache is None:
+        _cache = RenderCache()
+        register_stats("cv_maker_render_cache", _cache.stats, counters=("hits", "misses"))
+    return _cache
@@ -0,0 +1,74 @@
+import os
+from dataclasses import dataclass
+from typing import Optional
+
+import httpx
+
+from models.resume_models import ResumeData
+from rendering.executor import RenderQueueFull, RenderTimeout
+
+DEFAULT_SERVICE_TIMEOUT = 120.0
+DEFAULT_SERVICE_CONNECTIONS = 20
+
+
+@dataclass
+class RenderedResume:
+    """A PDF returned by the render service and the one-page fit it applied, if any."""
+    pdf_bytes: bytes
+    fit_scale: Optional[float] = None
+    fit_summary: str = ""
+
+
+class RenderServiceClient:
+    """
+    Client of a render service's POST /render that reuses pooled keep-alive connections.
+
+    The service's backpressure surfaces as the local executor's exceptions, so callers
+    handle both the same way: 429 raises RenderQueueFull and 504 RenderTimeout.
+    """
+    def __init__(self, base_url: str, timeout: Optional[float] = None, max_connections: Optional[int] = None):
+        timeout = timeout or float(os.getenv("RENDER_SERVICE_TIMEOUT", DEFAULT_SERVICE_TIMEOUT))
+        max_connections = max_connections or int(os.getenv("RENDER_SERVICE_CONNECTIONS", DEFAULT_SERVICE_CONNECTIONS))
+        self.base_url = base_url.rstrip('/')
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+        )
+
+    async def render(self, resume_data: ResumeData, fit_one_page: bool = False) -> RenderedResume:
+        """Render a resume on the service, streaming the PDF back."""
+        async with self._client.stream(
+            "POST",
+            "/render",
+            params={"fit_one_page": str(fit_one_page).lower()},
+            content=resume_data.model_dump_json(),
+            headers={"Content-Type": "application/json"},
+        ) as response:
+            if response.status_code == 429:
+                raise RenderQueueFull(f"Render service is busy, retry after {response.headers.get('Retry-After', '?')}s")
+            if response.status_code == 504:
+                raise RenderTimeout("Render service timed out")
+            if response.is_error:
+                await response.aread()
+                response.raise_for_status()
+            pdf_bytes = b''.join([chunk async for chunk in response.aiter_bytes()])
+        scale = response.headers.get("X-Fit-Scale")
+        return RenderedResume(pdf_bytes, float(scale) if scale else None, response.headers.get("X-Fit-Summary", ""))
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+
+_client: Optional[RenderServiceClient] = None
+
+
+def get_render_client() -> Optional[RenderServiceClient]:
+    """Return the process-wide client of the service at RENDER_SERVICE_URL, or None to render in process."""
+    global _client
+    url = os.getenv("RENDER_SERVICE_URL")
+    if not url:
+        return None
+    if _client is None:
+        _client = RenderServiceClient(url)
+    return _client
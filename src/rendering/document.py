@@ -0,0 +1,98 @@
+import io
+
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.units import inch
+from typing import Optional
+
+from reportlab.platypus import SimpleDocTemplate, Table, TableStyle
+
+from constants import FULL_COLUMN_WIDTH, register_fonts
+from models.resume_models import ResumeData
+from rendering.section_cache import layout_section
+from sections.registry import resume_sections
+from rendering.styles import ResumeStyleSheet, get_style_sheet
+from rendering.table_backend import TableBackend
+from constants.table_style import TableStyleBuilder
+from telemetry import span, timed
+
+
+@timed("table_build")
+def build_resume_table(resume_data: ResumeData, styles: Optional[ResumeStyleSheet] = None, style_builder: Optional[TableStyleBuilder] = None, scale: float = 1.0, fragments: Optional[dict] = None) -> tuple[list, list]:
+    """
+    Build the table rows and table style commands for a resume.
+
+    Args:
+        resume_data (ResumeData): Validated resume data.
+        styles (ResumeStyleSheet): Compiled style sheet; defaults to the default template.
+        style_builder (TableStyleBuilder): Builder to record row styles into; a new one by default.
+        scale (float): Factor applied to font sizes, leading and row padding.
+        fragments (dict): Section name -> SectionFragment kept by a caller that tracks which sections changed.
+
+    Returns:
+        tuple[list, list]: The table rows and the matching, coalesced TableStyle commands.
+    """
+    # Fonts are registered lazily so importing the package stays cheap
+    register_fonts()
+    styles = styles or get_style_sheet(scale=scale)
+
+    table = []
+    style_builder = style_builder or TableStyleBuilder(padding_scale=scale)
+    style_builder.add_global('ALIGN', (0, 0), (0, -1), 'LEFT')
+    style_builder.add_global('ALIGN', (1, 0), (1, -1), 'RIGHT')
+    style_builder.add_global('LEFTPADDING', (0, 0), (-1, -1), 0)
+    style_builder.add_global('RIGHTPADDING', (0, 0), (-1, -1), 0)
+    style_builder.set('BOTTOMPADDING', 6)
+
+    # Append the name and contact
+    header = TableBackend(styles, style_builder)
+    header.header(resume_data.header.name, resume_data.header.format_contact_info())
+    table.extend(header.rows)
+
+    fragments = fragments or {}
+    for section in resume_sections(resume_data):
+        # Unchanged sections come from the layout cache; only edited ones are rebuilt
+        table.extend(layout_section(resume_data, section, styles, style_builder, fragments.get(section)))
+
+    # Merge runs of identical per-row settings into range commands
+    return table, style_builder.build()
+
+
+PAGE_MARGINS = {
+    'leftMargin': 0.5 * inch,
+    'rightMargin': 0.5 * inch,
+    'topMargin': 0.2 * inch,
+    'bottomMargin': 0.1 * inch,
+}
+
+
+def make_resume_table(elements, table_styles) -> Table:
+    table = Table(elements, colWidths=[FULL_COLUMN_WIDTH * 0.7, FULL_COLUMN_WIDTH * 0.3], spaceBefore=0, spaceAfter=0)
+    table.setStyle(TableStyle(table_styles))
+    return table
+
+
+def generate_resume(output_file_path, author, elements, table_styles) -> None:
+    resume_doc = SimpleDocTemplate(output_file_path, pagesize=A4, showBoundary=0, title = f"Resume of {author}", author = author, invariant = 1, **PAGE_MARGINS)
+    resume_elements = [make_resume_table(elements, table_styles)]
+    with span("pdf_build"):
+        resume_doc.build(resume_elements)
+
+
+def render_resume_bytes(resume_data: ResumeData, scale: float = 1.0, fragments: Optional[dict] = None) -> bytes:
+    """Lay out and build the resume PDF in memory. Output is byte-reproducible."""
+    table, table_styles = build_resume_table(resume_data, scale=scale, fragments=fragments)
+    buffer = io.BytesIO()
+    generate_resume(buffer, resume_data.header.name, table, table_styles)
+    return buffer.getvalue()
+
+
+def render_resume(resume_data: ResumeData, output_pdf_path: str) -> str:
+    """
+    Lay out and write the resume PDF synchronously.
+
+    Returns:
+        str: Path to the generated PDF file.
+    """
+    table, table_styles = build_resume_table(resume_data)
+    generate_resume(output_pdf_path, resume_data.header.name, table, table_styles)
+    return output_pdf_path
@@ -0,0 +1,197 @@
+import asyncio
+import contextvars
+import multiprocessing
+import os
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional
+
+from models.resume_models import ResumeData
+from telemetry import capture_spans, record_spans, register_stats, span
+
+DEFAULT_RENDER_WORKERS = min(4, os.cpu_count() or 1)
+DEFAULT_RENDER_QUEUE_SIZE = 32
+DEFAULT_RENDER_TIMEOUT = 60.0
+
+# Session key of the current task; its render jobs prefer the same worker while it is idle
+render_affinity: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("render_affinity", default=None)
+
+
+class RenderQueueFull(Exception):
+    """Raised when the render queue has no room for another job."""
+
+
+class RenderTimeout(Exception):
+    """Raised when a render job does not finish within the configured timeout."""
+
+
+def _init_worker() -> None:
+    """Register the fonts and load the layout code once per worker process."""
+    from constants import register_fonts
+    register_fonts()
+    import rendering.document
+
+
+def _warm_job() -> int:
+    """Worker entry point that does nothing; submitting one per worker starts the pool."""
+    return os.getpid()
+
+
+def _timed_job(fn: Callable, *args: Any) -> tuple[Any, list]:
+    """Run a job in the worker and return its result with the spans recorded on the way."""
+    with capture_spans() as spans:
+        result = fn(*args)
+    return result, spans
+
+
+def _render_job(resume_dict: dict, output_pdf_path: str) -> str:
+    """Worker entry point: rebuild the model and render it to disk."""
+    from rendering.document import render_resume
+    return render_resume(ResumeData(**resume_dict), output_pdf_path)
+
+
+def _render_bytes_job(resume_dict: dict, scale: float = 1.0, fragments: Optional[dict] = None) -> bytes:
+    """Worker entry point: rebuild the model and render it in memory."""
+    from rendering.document import render_resume_bytes
+    return render_resume_bytes(ResumeData(**resume_dict), scale, fragments)
+
+
+def _fit_job(resume_dict: dict, fragments: Optional[dict] = None):
+    """Worker entry point: find the one-page scale for a resume."""
+    from rendering.fit import fit_resume
+    return fit_resume(ResumeData(**resume_dict), fragments=fragments)
+
+
+def _layout_job(resume_dict: dict):
+    """Worker entry point: measure the layout of a resume without rendering it."""
+    from rendering.layout_metrics import measure_resume_layout
+    return measure_resume_layout(ResumeData(**resume_dict))
+
+
+class RenderExecutor:
+    """
+    Runs ReportLab rendering in bounded worker processes so the event loop never blocks.
+
+    Each of the `max_workers` workers is its own single-process pool, so a job can be
+    sent to a chosen worker: jobs submitted while `render_affinity` is set go to the
+    session's own worker when it is idle, which keeps that session's section layouts
+    warm in its cache; otherwise, and for other jobs, they go to the least busy worker. At most `max_workers + max_queue` jobs may
+    be running or waiting; anything beyond that is rejected with RenderQueueFull. The
+    timeout applies to the time a job spends in a worker, not to the time spent waiting.
+    """
+    def __init__(self, max_workers: Optional[int] = None, max_queue: Optional[int] = None, timeout: Optional[float] = None):
+        self.max_workers = max_workers or int(os.getenv("RENDER_WORKERS", DEFAULT_RENDER_WORKERS))
+        self.max_queue = max_queue if max_queue is not None else int(os.getenv("RENDER_QUEUE_SIZE", DEFAULT_RENDER_QUEUE_SIZE))
+        self.timeout = timeout or float(os.getenv("RENDER_TIMEOUT", DEFAULT_RENDER_TIMEOUT))
+        self._pools: list[Optional[ProcessPoolExecutor]] = [None] * self.max_workers
+        self._slots: Optional[list[asyncio.Semaphore]] = None
+        self._loads = [0] * self.max_workers
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        """Number of jobs that are running or waiting for a worker."""
+        return self._pending
+
+    def _get_pool(self, worker: int) -> ProcessPoolExecutor:
+        if self._pools[worker] is None:
+            self._pools[worker] = ProcessPoolExecutor(
+                max_workers=1,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+            )
+        return self._pools[worker]
+
+    def _kill_worker(self, worker: int) -> None:
+        """Stop the worker's process, running job included; a fresh one starts with its next job."""
+        pool, self._pools[worker] = self._pools[worker], None
+        if pool is None:
+            return
+        # ProcessPoolExecutor cannot cancel a running job, so its process is killed
+        for process in list((pool._processes or {}).values()):
+            process.kill()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def _choose_worker(self) -> int:
+        key = render_affinity.get()
+        if key is not None:
+            preferred = zlib.crc32(key.encode("utf-8")) % self.max_workers
+            # A warm cache is not worth queueing behind another job while a worker is free
+            if self._loads[preferred] == 0:
+                return preferred
+        return min(range(self.max_workers), key=self._loads.__getitem__)
+
+    async def submit(self, fn: Callable, *args: Any) -> Any:
+        """Run a picklable callable in a worker and await its result."""
+        if self._pending >= self.max_workers + self.max_queue:
+            raise RenderQueueFull(f"Render queue is full ({self._pending} jobs pending)")
+        if self._slots is None:
+            self._slots = [asyncio.Semaphore(1) for _ in range(self.max_workers)]
+
+        worker = self._choose_worker()
+        self._pending += 1
+        self._loads[worker] += 1
+        try:
+            async with self._slots[worker]:
+                future = self._get_pool(worker).submit(_timed_job, fn, *args)
+                try:
+                    with span("render_job", job=fn.__name__.strip("_")):
+                        result, spans = await asyncio.wait_for(asyncio.wrap_future(future), self.timeout)
+                    record_spans(spans)
+                    return result
+                except asyncio.TimeoutError:
+                    # The job would keep the worker busy and the next job would time out behind it
+                    self._kill_worker(worker)
+                    raise RenderTimeout(f"Render job exceeded {self.timeout}s")
+                except BrokenProcessPool:
+                    # The worker died; start a fresh one for its next job
+                    self._pools[worker] = None
+                    raise
+        finally:
+            self._pending -= 1
+            self._loads[worker] -= 1
+
+    async def render(self, resume_data: ResumeData, output_pdf_path: str) -> str:
+        """Render a resume PDF in a worker process and return its path."""
+        return await self.submit(_render_job, resume_data.model_dump(), output_pdf_path)
+
+    async def render_bytes(self, resume_data: ResumeData, scale: float = 1.0, fragments: Optional[dict] = None) -> bytes:
+        """Render a resume PDF in a worker process and return its bytes."""
+        return await self.submit(_render_bytes_job, resume_data.model_dump(), scale, fragments)
+
+    async def fit(self, resume_data: ResumeData, fragments: Optional[dict] = None):
+        """Measure the resume in a worker process and return its one-page FitResult."""
+        return await self.submit(_fit_job, resume_data.model_dump(), fragments)
+
+    async def measure(self, resume_data: ResumeData):
+        """Measure the resume layout in a worker process and return its LayoutMetrics."""
+        return await self.submit(_layout_job, resume_data.model_dump())
+
+    async def warm(self) -> int:
+        """
+        Start every worker process before the first job arrives.
+
+        Returns:
+            int: Number of distinct worker processes that answered
+        """
+        pids = await asyncio.gather(*(asyncio.wrap_future(self._get_pool(worker).submit(_warm_job)) for worker in range(self.max_workers)))
+        return len(set(pids))
+
+    def shutdown(self, wait: bool = True) -> None:
+        for worker, pool in enumerate(self._pools):
+            if pool is not None:
+                pool.shutdown(wait=wait, cancel_futures=True)
+                self._pools[worker] = None
+
+
+_executor: Optional[RenderExecutor] = None
+
+
+def get_render_executor() -> RenderExecutor:
+    """Return the process-wide render executor, creating it on first use."""
+    global _executor
+    if _executor is None:
+        _executor = RenderExecutor()
+        register_stats("cv_maker_render", lambda: {"pending_jobs": _executor.pending, "workers": _executor.max_workers})
+    return _executor
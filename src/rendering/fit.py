@@ -0,0 +1,82 @@
+from dataclasses import dataclass, asdict
+from typing import Optional
+
+from reportlab.lib.pagesizes import A4
+
+from models.resume_models import ResumeData
+from rendering.document import PAGE_MARGINS, build_resume_table, make_resume_table
+
+# SimpleDocTemplate's frame keeps 6pt of padding on every side
+FRAME_PADDING = 6
+FRAME_WIDTH = A4[0] - PAGE_MARGINS['leftMargin'] - PAGE_MARGINS['rightMargin'] - 2 * FRAME_PADDING
+FRAME_HEIGHT = A4[1] - PAGE_MARGINS['topMargin'] - PAGE_MARGINS['bottomMargin'] - 2 * FRAME_PADDING
+
+DEFAULT_MIN_SCALE = 0.8
+# Scales are searched on this grid so repeated fits reuse compiled styles and line breaks
+SCALE_STEP = 0.005
+
+
+@dataclass
+class FitResult:
+    """Outcome of fitting a resume onto a single page."""
+    scale: float
+    height: float
+    available_height: float
+    measurements: int
+
+    @property
+    def fits(self) -> bool:
+        return self.height <= self.available_height
+
+    @property
+    def overflow(self) -> float:
+        """Points of content that still do not fit on the page (0 when it fits)."""
+        return max(0.0, self.height - self.available_height)
+
+    def to_dict(self) -> dict:
+        return {**asdict(self), 'fits': self.fits, 'overflow': self.overflow}
+
+    def describe(self) -> str:
+        if not self.fits:
+            return (f"The resume overflows one page by {self.overflow:.0f}pt even at {self.scale:.0%} scale; "
+                    f"shorten the content to fit.")
+        if self.scale < 1:
+            return f"The resume was scaled to {self.scale:.1%} to fit on one page."
+        return "The resume fits on one page."
+
+
+def measure_resume_height(resume_data: ResumeData, scale: float = 1.0, fragments: Optional[dict] = None) -> float:
+    """Lay out the resume table at `scale` and return its height in points, without building a PDF."""
+    rows, table_styles = build_resume_table(resume_data, scale=scale, fragments=fragments)
+    _, height = make_resume_table(rows, table_styles).wrap(FRAME_WIDTH, FRAME_HEIGHT)
+    return height
+
+
+def fit_resume(resume_data: ResumeData, min_scale: float = DEFAULT_MIN_SCALE, fragments: Optional[dict] = None) -> FitResult:
+    """
+    Find the largest scale (at most 1.0) at which the resume fits on one A4 page.
+
+    Content is never enlarged. When even `min_scale` overflows, the result carries
+    `min_scale` and the remaining overflow in points.
+    """
+    height = measure_resume_height(resume_data, fragments=fragments)
+    measurements = 1
+    if height <= FRAME_HEIGHT:
+        return FitResult(1.0, height, FRAME_HEIGHT, measurements)
+
+    low_height = measure_resume_height(resume_data, min_scale, fragments)
+    measurements += 1
+    if low_height > FRAME_HEIGHT:
+        return FitResult(min_scale, low_height, FRAME_HEIGHT, measurements)
+
+    # Binary search on the step grid: `low` always fits, `high` never does
+    low, high = round(min_scale / SCALE_STEP), round(1.0 / SCALE_STEP)
+    while high - low > 1:
+        middle = (low + high) // 2
+        middle_height = measure_resume_height(resume_data, middle * SCALE_STEP, fragments)
+        measurements += 1
+        if middle_height <= FRAME_HEIGHT:
+            low, low_height = middle, middle_height
+        else:
+            high = middle
+    return FitResult(round(low * SCALE_STEP, 3), low_height, FRAME_HEIGHT, measurements)
@@ -0,0 +1,98 @@
+from dataclasses import dataclass, field, asdict
+
+from models.resume_models import ResumeData
+from rendering.document import build_resume_table, make_resume_table
+from rendering.fit import FRAME_HEIGHT, FRAME_WIDTH
+from constants.table_style import TableStyleBuilder
+
+
+@dataclass
+class EntryMetrics:
+    """Height of one entry (an experience, education, project or skill line)."""
+    name: str
+    height: float = 0.0
+    bullets: list = field(default_factory=list)
+
+
+@dataclass
+class SectionMetrics:
+    """Height of one section, its heading and its entries."""
+    name: str
+    height: float = 0.0
+    entries: list = field(default_factory=list)
+
+
+@dataclass
+class LayoutMetrics:
+    """Layout-only measurements of a resume on A4 pages."""
+    total_height: float
+    page_height: float
+    page_count: int
+    overflow: float
+    sections: list
+
+    def to_dict(self) -> dict:
+        """Plain-dict form with heights rounded to 0.1pt, compact enough for an LLM tool result."""
+        return _round_floats(asdict(self))
+
+
+def _round_floats(value):
+    if isinstance(value, float):
+        return round(value, 1)
+    if isinstance(value, dict):
+        return {key: _round_floats(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_round_floats(item) for item in value]
+    return value
+
+
+def _count_pages(row_heights: list, page_height: float) -> int:
+    """Pack rows onto pages the way the table splits: only between rows."""
+    pages, used = 1, 0.0
+    for height in row_heights:
+        if used and used + height > page_height:
+            pages += 1
+            used = 0.0
+        used += height
+    return pages
+
+
+def measure_resume_layout(resume_data: ResumeData, scale: float = 1.0) -> LayoutMetrics:
+    """
+    Build the resume table and measure it without producing a PDF.
+
+    Returns:
+        LayoutMetrics: Estimated page count, overflow beyond the first page in points,
+        and the height contributed by every section, entry and bullet.
+    """
+    style_builder = TableStyleBuilder(padding_scale=scale)
+    rows, table_styles = build_resume_table(resume_data, style_builder=style_builder, scale=scale)
+    table = make_resume_table(rows, table_styles)
+    _, total_height = table.wrap(FRAME_WIDTH, FRAME_HEIGHT)
+    row_heights = table._rowHeights
+
+    sections: dict[str, SectionMetrics] = {}
+    entries: dict[tuple, EntryMetrics] = {}
+    for label, height in zip(style_builder.row_labels, row_heights):
+        if not label:
+            continue
+        section = sections.setdefault(label[0], SectionMetrics(label[0]))
+        section.height += height
+        if len(label) < 2 or label[1] == 'heading':
+            continue
+        entry_key = label[:3]
+        if entry_key not in entries:
+            entries[entry_key] = EntryMetrics(label[1])
+            section.entries.append(entries[entry_key])
+        entry = entries[entry_key]
+        entry.height += height
+        if len(label) > 3:
+            entry.bullets.append(height)
+
+    return LayoutMetrics(
+        total_height=total_height,
+        page_height=FRAME_HEIGHT,
+        page_count=_count_pages(row_heights, FRAME_HEIGHT),
+        overflow=max(0.0, total_height - FRAME_HEIGHT),
+        sections=list(sections.values()),
+    )
@@ -0,0 +1,83 @@
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.platypus import Paragraph
+
+DEFAULT_PARAGRAPH_CACHE_SIZE = 4096
+
+
+class BoundedMemo:
+    """A small thread-safe LRU mapping used to memoize layout work."""
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_cache_size = int(os.getenv("PARAGRAPH_CACHE_SIZE", DEFAULT_PARAGRAPH_CACHE_SIZE))
+# (text, style, bulletText) -> parsed fragments
+parsed_paragraphs = BoundedMemo(_cache_size)
+# (text, style, bulletText, wrap widths) -> line break result
+wrapped_paragraphs = BoundedMemo(_cache_size)
+
+
+class CachedParagraph(Paragraph):
+    """
+    Paragraph that reuses parsed markup and line breaks across renders.
+
+    Styles are part of the memo key by identity, so callers should pass the shared
+    styles from rendering.styles rather than building new ones per render.
+    """
+    def __init__(self, text: str, style: ParagraphStyle, bulletText: Optional[str] = None):
+        self._memo_key = (text, style, bulletText)
+        parsed = parsed_paragraphs.get(self._memo_key)
+        if parsed is None:
+            super().__init__(text, style, bulletText=bulletText)
+            parsed_paragraphs.put(self._memo_key, (self.text, self.frags, self.style, self.bulletText))
+        else:
+            self.caseSensitive = 1
+            self.encoding = 'utf8'
+            self.debug = 0
+            self.text, self.frags, self.style, self.bulletText = parsed
+
+    def breakLines(self, width):
+        key = (self._memo_key, tuple(width))
+        wrapped = wrapped_paragraphs.get(key)
+        if wrapped is None:
+            blPara = super().breakLines(width)
+            # breakLines may replace self.frags and narrow the first line for bullets
+            wrapped_paragraphs.put(key, (blPara, self.frags, list(width)))
+            return blPara
+        blPara, self.frags, widths = wrapped
+        width[:] = widths
+        return blPara
@@ -0,0 +1,135 @@
+import html
+import re
+from typing import Optional
+
+from elements.base_element import DETAIL, ENTRY, ResumeBackend, Text
+from models.resume_models import ResumeData
+from sections.registry import build_section, resume_sections
+from telemetry import timed
+
+# Resume text is ReportLab paragraph markup; previews show what the PDF would print
+_TAG = re.compile(r'<[^>]+>')
+
+PREVIEW_CSS = """
+body { font-family: 'EB Garamond', Garamond, Georgia, serif; max-width: 48em; margin: 2em auto; color: #111; }
+header { text-align: center; }
+h1 { font-size: 1.4em; margin: 0; }
+h2 { font-size: 1.1em; text-transform: uppercase; border-bottom: 1px solid #111; margin: 1em 0 0.3em; }
+.row { display: flex; justify-content: space-between; }
+.entry { margin-top: 0.4em; font-weight: 600; }
+ul { margin: 0.1em 0; padding-left: 1.2em; }
+p { margin: 0.1em 0; text-align: justify; }
+"""
+
+
+def plain_text(markup: str) -> str:
+    return html.unescape(_TAG.sub('', markup))
+
+
+def write_resume(resume_data: ResumeData, backend: ResumeBackend) -> None:
+    """Write a resume to `backend` with the same section order and adapters as the PDF, without loading its styles."""
+    backend.header(resume_data.header.name, resume_data.header.format_contact_info())
+    for section in resume_sections(resume_data):
+        build_section(resume_data, section).write(backend)
+
+
+class TextBackend:
+    """ATS plain text: one line per row, upper-case section headings, right-hand parts after a bar."""
+    def __init__(self):
+        self.lines: list[str] = []
+
+    def _text(self, text: Text) -> str:
+        content = plain_text(text.text)
+        if text.lead:
+            content = f"{plain_text(text.lead)} {content}"
+        return f"{text.bullet} {content}" if text.bullet else content
+
+    def header(self, name: str, contact: str) -> None:
+        self.lines.extend([plain_text(name), plain_text(contact)])
+
+    def section(self, heading: str) -> None:
+        self.lines.extend(['', plain_text(heading).upper()])
+
+    def entry(self, label: str, index: int) -> None:
+        if index:
+            self.lines.append('')
+
+    def row(self, left: Text, right: Optional[Text] = None, spacing: str = DETAIL, label: Optional[str] = None) -> None:
+        self.lines.append(self._text(left) + (f" | {self._text(right)}" if right is not None else ''))
+
+    def end_section(self) -> None:
+        pass
+
+    def render(self) -> str:
+        return '\n'.join(self.lines) + '\n'
+
+
+class HtmlBackend:
+    """A small standalone HTML page; bullets become lists, right-hand parts are right-aligned."""
+    def __init__(self, title: str = 'Resume preview'):
+        self.title = title
+        self.parts: list[str] = []
+        self._in_list = False
+
+    def _html(self, text: Text) -> str:
+        content = html.escape(plain_text(text.text))
+        if text.lead:
+            content = f"<strong>{html.escape(plain_text(text.lead))}</strong> {content}"
+        return content
+
+    def _close_list(self) -> None:
+        if self._in_list:
+            self.parts.append('</ul>')
+            self._in_list = False
+
+    def header(self, name: str, contact: str) -> None:
+        self.parts.append(f"<header><h1>{html.escape(plain_text(name))}</h1><p>{html.escape(plain_text(contact))}</p></header>")
+
+    def section(self, heading: str) -> None:
+        self.parts.append(f"<section><h2>{html.escape(plain_text(heading))}</h2>")
+
+    def entry(self, label: str, index: int) -> None:
+        pass
+
+    def row(self, left: Text, right: Optional[Text] = None, spacing: str = DETAIL, label: Optional[str] = None) -> None:
+        if left.bullet:
+            if not self._in_list:
+                self.parts.append('<ul>')
+                self._in_list = True
+            self.parts.append(f"<li>{self._html(left)}</li>")
+            return
+        self._close_list()
+        if right is not None:
+            css_class = 'row entry' if spacing == ENTRY else 'row'
+            self.parts.append(f'<div class="{css_class}"><span>{self._html(left)}</span><span>{self._html(right)}</span></div>')
+        elif spacing == ENTRY:
+            self.parts.append(f'<div class="row entry">{self._html(left)}</div>')
+        else:
+            self.parts.append(f"<p>{self._html(left)}</p>")
+
+    def end_section(self) -> None:
+        self._close_list()
+        self.parts.append('</section>')
+
+    def render(self) -> str:
+        body = '\n'.join(self.parts)
+        return (
+            f'<!DOCTYPE html>\n<html><head><meta charset="utf-8"><title>{html.escape(self.title)}</title>'
+            f'<style>{PREVIEW_CSS}</style></head>\n<body>\n{body}\n</body></html>\n'
+        )
+
+
+@timed("preview_text")
+def render_resume_text(resume_data: ResumeData) -> str:
+    """Render a resume as ATS plain text, without ReportLab layout."""
+    backend = TextBackend()
+    write_resume(resume_data, backend)
+    return backend.render()
+
+
+@timed("preview_html")
+def render_resume_html(resume_data: ResumeData) -> str:
+    """Render a resume as a lightweight standalone HTML page, without ReportLab layout."""
+    backend = HtmlBackend(f"Resume of {resume_data.header.name}")
+    write_resume(resume_data, backend)
+    return backend.render()
@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from models.resume_models import ResumeData
+from sections.registry import section_digest
+
+# ResumeData fields laid out as table sections below the header
+SECTION_FIELDS = ('education', 'experience', 'projects', 'skills')
+
+
+@dataclass(frozen=True)
+class ResumeDiff:
+    """Sections whose content differs between two versions of a resume."""
+    changed: tuple
+    unchanged: tuple
+
+    @property
+    def header_changed(self) -> bool:
+        return 'header' in self.changed
+
+
+def diff_resume(previous: Optional[ResumeData], current: ResumeData) -> ResumeDiff:
+    """Compare two resumes section by section; everything changed when there is no previous version."""
+    names = ('header', *SECTION_FIELDS)
+    if previous is None:
+        return ResumeDiff(changed=names, unchanged=())
+    changed = tuple(name for name in names if section_digest(previous, name) != section_digest(current, name))
+    return ResumeDiff(changed=changed, unchanged=tuple(name for name in names if name not in changed))
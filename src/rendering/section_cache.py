@@ -0,0 +1,79 @@
+import os
+import threading
+from dataclasses import dataclass
+from typing import Optional
+
+from models.resume_models import ResumeData
+from rendering.paragraphs import BoundedMemo
+from rendering.styles import ResumeStyleSheet
+from rendering.table_backend import TableBackend
+from constants.table_style import TableStyleBuilder
+from sections.fragments import SectionFragment, record_section
+from sections.registry import section_digest
+
+DEFAULT_LAYOUT_CACHE_ENTRIES = 256
+
+
+@dataclass(frozen=True)
+class SectionLayout:
+    """Table rows of one laid-out section and its row style settings at padding scale 1."""
+    rows: list
+    style: TableStyleBuilder
+
+
+# (section, digest) -> SectionFragment; scale-free, for callers that do not send fragments
+_fragments = BoundedMemo(int(os.getenv("LAYOUT_CACHE_ENTRIES", DEFAULT_LAYOUT_CACHE_ENTRIES)))
+# (section, digest, styles, thread) -> SectionLayout
+_layouts = BoundedMemo(int(os.getenv("LAYOUT_CACHE_ENTRIES", DEFAULT_LAYOUT_CACHE_ENTRIES)))
+
+
+def section_fragment(resume_data: ResumeData, section: str) -> SectionFragment:
+    """The section's fragment, recorded once per content digest."""
+    key = (section, section_digest(resume_data, section))
+    fragment = _fragments.get(key) if _fragments.max_size else None
+    if fragment is None:
+        fragment = record_section(resume_data, section)
+        if _fragments.max_size:
+            _fragments.put(key, fragment)
+    return fragment
+
+
+def layout_section(
+    resume_data: ResumeData,
+    section: str,
+    styles: ResumeStyleSheet,
+    style_builder: TableStyleBuilder,
+    fragment: Optional[SectionFragment] = None,
+) -> list:
+    """
+    Lay out one section into `style_builder` and return its table rows.
+
+    `fragment` is the section's recording when the caller already tracks which sections
+    changed (see sections.fragments.refresh_fragments); otherwise it is looked up by
+    content digest. Only the paragraphs depend on the scale, through `styles`: row style
+    settings are kept at scale 1 and scaled as they are appended. ReportLab keeps wrap
+    state on the cached flowables, so laid-out rows are also keyed by thread.
+    """
+    fragment = fragment or section_fragment(resume_data, section)
+    key = (section, fragment.digest, styles, threading.get_ident())
+    layout = _layouts.get(key) if _layouts.max_size else None
+    if layout is None:
+        style = TableStyleBuilder()
+        backend = TableBackend(styles, style)
+        fragment.replay(backend)
+        layout = SectionLayout(backend.rows, style)
+        if _layouts.max_size:
+            _layouts.put(key, layout)
+    style_builder.append(layout.style)
+    # Table may normalize its rows in place; the flowables themselves are shared
+    return [list(row) for row in layout.rows]
+
+
+def clear_layout_cache() -> None:
+    _fragments.clear()
+    _layouts.clear()
+
+
+def layout_cache_stats() -> dict:
+    """Entry count and hit/miss counters of this process's section layout cache."""
+    return {"entries": len(_layouts), "hits": _layouts.hits, "misses": _layouts.misses}
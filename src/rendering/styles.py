@@ -0,0 +1,72 @@
+from dataclasses import dataclass
+from functools import lru_cache
+
+from reportlab.lib.styles import ParagraphStyle
+
+from constants import register_fonts
+from constants import resume_constants
+
+
+@dataclass(frozen=True)
+class ResumeStyleSheet:
+    """The compiled paragraph styles used by one resume template."""
+    template: str
+    name: ParagraphStyle
+    contact: ParagraphStyle
+    section: ParagraphStyle
+    company_heading: ParagraphStyle
+    company_title: ParagraphStyle
+    company_duration: ParagraphStyle
+    company_location: ParagraphStyle
+    job_details: ParagraphStyle
+
+
+# Template name -> mapping of style sheet fields to the ParagraphStyle constants they are built from
+STYLE_TEMPLATES = {
+    'default': {
+        'name': resume_constants.NAME_PARAGRAPH_STYLE,
+        'contact': resume_constants.CONTACT_PARAGRAPH_STYLE,
+        'section': resume_constants.SECTION_PARAGRAPH_STYLE,
+        'company_heading': resume_constants.COMPANY_HEADING_PARAGRAPH_STYLE,
+        'company_title': resume_constants.COMPANY_TITLE_PARAGRAPH_STYLE,
+        'company_duration': resume_constants.COMPANY_DURATION_PARAGRAPH_STYLE,
+        'company_location': resume_constants.COMPANY_LOCATION_PARAGRAPH_STYLE,
+        'job_details': resume_constants.JOB_DETAILS_PARAGRAPH_STYLE,
+    },
+}
+
+
+# Attributes multiplied by the scale factor when a scaled sheet is compiled
+SCALED_ATTRIBUTES = ('fontSize', 'leading', 'bulletFontSize')
+
+
+def _compile_style(template: str, style: ParagraphStyle, scale: float) -> ParagraphStyle:
+    """Flatten a style's inherited attributes into a standalone, optionally scaled ParagraphStyle."""
+    name = f"{template}.{style.name}" if scale == 1 else f"{template}.{style.name}@{scale}"
+    compiled = ParagraphStyle(name)
+    compiled.__dict__.update({key: value for key, value in style.__dict__.items() if key not in ('name', 'parent')})
+    for key in ParagraphStyle.defaults:
+        setattr(compiled, key, getattr(style, key))
+    if scale != 1:
+        for key in SCALED_ATTRIBUTES:
+            setattr(compiled, key, getattr(compiled, key) * scale)
+    return compiled
+
+
+def get_style_sheet(template: str = 'default', scale: float = 1.0) -> ResumeStyleSheet:
+    """
+    Return the shared style sheet for a template, compiled once per process.
+
+    `scale` multiplies font sizes and leading; it is rounded to three decimals so
+    nearby scales share a sheet (and its paragraph memo entries).
+    """
+    return _get_style_sheet(template, round(scale, 3))
+
+
+@lru_cache(maxsize=None)
+def _get_style_sheet(template: str, scale: float) -> ResumeStyleSheet:
+    if template not in STYLE_TEMPLATES:
+        raise KeyError(f"Unknown resume template: {template}")
+    register_fonts()
+    styles = {field: _compile_style(template, style, scale) for field, style in STYLE_TEMPLATES[template].items()}
+    return ResumeStyleSheet(template=template, **styles)
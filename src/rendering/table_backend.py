@@ -0,0 +1,65 @@
+from typing import Optional
+
+from constants.resume_constants import appendSectionTableStyle
+from elements.base_element import BODY, DETAIL, ENTRY, Text
+from rendering.paragraphs import CachedParagraph
+from rendering.styles import ResumeStyleSheet
+from constants.table_style import TableStyleBuilder
+
+# Top padding of a row by its spacing
+TOP_PADDING = {ENTRY: 5, DETAIL: 1, BODY: 1}
+
+
+class TableBackend:
+    """
+    Writes a resume as rows of a two-column ReportLab table.
+
+    Row styles go to `style_builder`, labelled with the section and entry they
+    belong to so layout metrics can attribute row heights.
+    """
+    def __init__(self, styles: ResumeStyleSheet, style_builder: TableStyleBuilder):
+        self.styles = styles
+        self.style_builder = style_builder
+        self.rows: list = []
+        self._heading = ''
+
+    def _paragraph(self, text: Text) -> CachedParagraph:
+        markup = f"<font face='Garamond_Semibold'>{text.lead}</font> {text.text}" if text.lead else text.text
+        return CachedParagraph(markup, getattr(self.styles, text.role), bulletText=text.bullet)
+
+    def header(self, name: str, contact: str) -> None:
+        style_builder = self.style_builder
+        style_builder.context = ('Header',)
+        self.rows.append([CachedParagraph(name, self.styles.name), ""])
+        # Span the name row across both columns
+        style_builder.span()
+        style_builder.next_row()
+
+        self.rows.append([CachedParagraph(contact, self.styles.contact), ""])
+        # Span the contact info row across both columns
+        style_builder.span()
+        style_builder.set('BOTTOMPADDING', 1)
+        style_builder.next_row()
+        style_builder.context = ()
+
+    def section(self, heading: str) -> None:
+        self._heading = heading
+        self.rows.append([CachedParagraph(heading, self.styles.section)])
+        appendSectionTableStyle(self.style_builder)
+        self.style_builder.context = (heading,)
+        self.style_builder.next_row(label="heading")
+
+    def entry(self, label: str, index: int) -> None:
+        self.style_builder.context = (self._heading, label, index)
+
+    def row(self, left: Text, right: Optional[Text] = None, spacing: str = DETAIL, label: Optional[str] = None) -> None:
+        self.rows.append([self._paragraph(left)] + ([self._paragraph(right)] if right is not None else []))
+        self.style_builder.set('TOPPADDING', TOP_PADDING[spacing])
+        if spacing == BODY:
+            self.style_builder.set('BOTTOMPADDING', 0)
+        if right is None:
+            self.style_builder.span()
+        self.style_builder.next_row(label=label)
+
+    def end_section(self) -> None:
+        self.style_builder.context = ()
@@ -0,0 +1,65 @@
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+from elements.base_element import DETAIL, ResumeBackend, Text
+from models.resume_models import ResumeData
+from sections.registry import build_section, resume_sections, section_digest
+
+
+@dataclass(frozen=True)
+class SectionFragment:
+    """
+    The backend calls one section's adapters make, recorded without styles or scale.
+
+    Fragments are plain data: they are built from the models alone, pickle cheaply to
+    the render workers and can be replayed into any backend at any scale.
+    """
+    section: str
+    digest: str
+    calls: tuple
+
+    def replay(self, backend: ResumeBackend) -> None:
+        for method, args in self.calls:
+            getattr(backend, method)(*args)
+
+
+class RecordingBackend:
+    """Backend that records the calls made to it instead of producing output."""
+    def __init__(self):
+        self.calls: list = []
+
+    def header(self, name: str, contact: str) -> None:
+        self.calls.append(('header', (name, contact)))
+
+    def section(self, heading: str) -> None:
+        self.calls.append(('section', (heading,)))
+
+    def entry(self, label: str, index: int) -> None:
+        self.calls.append(('entry', (label, index)))
+
+    def row(self, left: Text, right: Optional[Text] = None, spacing: str = DETAIL, label: Optional[str] = None) -> None:
+        self.calls.append(('row', (left, right, spacing, label)))
+
+    def end_section(self) -> None:
+        self.calls.append(('end_section', ()))
+
+
+def record_section(resume_data: ResumeData, section: str) -> SectionFragment:
+    backend = RecordingBackend()
+    build_section(resume_data, section).write(backend)
+    return SectionFragment(section, section_digest(resume_data, section), tuple(backend.calls))
+
+
+def refresh_fragments(resume_data: ResumeData, fragments: Optional[dict], changed: Iterable[str]) -> dict:
+    """
+    Fragments of every section of `resume_data`, given the `fragments` of the previous
+    version and the sections a diff found `changed` since then.
+
+    Only changed sections, and sections the previous version did not have, are recorded again.
+    """
+    fragments = fragments or {}
+    changed = set(changed)
+    return {
+        section: fragments[section] if section in fragments and section not in changed else record_section(resume_data, section)
+        for section in resume_sections(resume_data)
+    }
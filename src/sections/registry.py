@@ -0,0 +1,52 @@
+import hashlib
+
+from models.resume_models import ResumeData
+from sections.resume_section import Section
+from elements import (
+    EducationAdapter,
+    ExperienceAdapter,
+    ProjectAdapter,
+    SkillAdapter
+)
+
+# Sections below the header, in layout order
+RESUME_ELEMENTS_ORDER = [
+    'experience',
+    'education',
+    'skills'
+]
+
+# Section name -> (heading, adapter class)
+RESUME_SECTIONS = {
+    'education': ('Education', EducationAdapter),
+    'experience': ('Work Experience', ExperienceAdapter),
+    'projects': ('Projects', ProjectAdapter),
+    'skills': ('Skills', SkillAdapter),
+}
+
+
+def resume_sections(resume_data: ResumeData) -> list:
+    """Names of the sections of a resume in layout order; the projects section is left out when there are none."""
+    return [
+        section for section in RESUME_ELEMENTS_ORDER
+        if section in RESUME_SECTIONS and (section != 'projects' or resume_data.projects)
+    ]
+
+
+def section_models(resume_data: ResumeData, section: str) -> list:
+    return getattr(resume_data, section) or []
+
+
+def section_digest(resume_data: ResumeData, section: str) -> str:
+    """Content hash of one section (or of 'header') of a resume."""
+    digest = hashlib.sha256()
+    models = [resume_data.header] if section == 'header' else section_models(resume_data, section)
+    for model in models:
+        digest.update(model.model_dump_json().encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def build_section(resume_data: ResumeData, section: str) -> Section:
+    heading, adapter = RESUME_SECTIONS[section]
+    return Section(heading, [adapter(model) for model in section_models(resume_data, section)])
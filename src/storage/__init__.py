@@ -0,0 +1,20 @@
+# This package stores generated resumes shared by chat sessions and the CLI
+from storage.output_store import (
+    OutputStore,
+    StoredResume,
+    atomic_path,
+    atomic_write,
+    get_output_store,
+    safe_name,
+    start_output_gc
+)
+
+__all__ = [
+    'OutputStore',
+    'StoredResume',
+    'atomic_path',
+    'atomic_write',
+    'get_output_store',
+    'safe_name',
+    'start_output_gc'
+]
@@ -0,0 +1,269 @@
+import asyncio
+import hashlib
+import os
+import re
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+from models.resume_models import ResumeData
+from telemetry import log_event, register_stats
+
+DEFAULT_OUTPUT_DIR = '../output'
+DEFAULT_MAX_AGE = 7 * 24 * 3600
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+DEFAULT_GC_INTERVAL = 600
+# Temp files left by an interrupted write are removed after this many seconds
+STALE_TEMP_AGE = 3600
+
+# Scoped (session or user) saves live under this subdirectory of the root; GC never looks outside it
+SCOPES_DIR = 'sessions'
+# Files the store owns; anything else under the scopes directory is left alone
+MANAGED_SUFFIXES = ('.pdf', '.json', '.tmp')
+# Saved files are readable by other users, like files written with the usual umask 022
+FILE_MODE = 0o644
+# Attempts at creating a temp file in a directory that GC may remove in the meantime
+TEMP_FILE_ATTEMPTS = 3
+_UNSAFE = re.compile(r'[^A-Za-z0-9_.-]+')
+
+
+def safe_name(name: str) -> str:
+    """Reduce a user or session supplied name to a single safe path component."""
+    return _UNSAFE.sub('_', name).strip('._') or 'resume'
+
+
+def atomic_write(path: str, data: bytes) -> None:
+    """Write `data` to `path` through a temp file in the same directory, so readers never see a partial file."""
+    with atomic_path(path) as tmp_path:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+
+
+@contextmanager
+def atomic_path(path: str) -> Iterator[str]:
+    """
+    Yield a temp path next to `path` and rename it over `path` once the block completes.
+
+    The temp file is removed if the block raises.
+    """
+    directory = os.path.dirname(path) or '.'
+    for attempt in range(TEMP_FILE_ATTEMPTS):
+        os.makedirs(directory, exist_ok=True)
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix='.tmp')
+            break
+        except FileNotFoundError:
+            # GC removed the directory while it was still empty; create it again
+            if attempt == TEMP_FILE_ATTEMPTS - 1:
+                raise
+    os.close(fd)
+    try:
+        yield tmp_path
+        # mkstemp creates the file as 0600
+        os.chmod(tmp_path, FILE_MODE)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+@dataclass
+class StoredResume:
+    """Paths of one saved resume and the content hash its name was derived from."""
+    pdf_path: str
+    json_path: str
+    digest: str
+
+
+class OutputStore:
+    """
+    Saved resumes (JSON + PDF) under `root`, safe to share between concurrent sessions.
+
+    Files are named `sessions/<scope>/<name>-<content hash>` so two sessions never
+    overwrite each other and saving the same resume twice is a no-op. Every write goes
+    through a temp file and a rename. `collect_garbage` removes scoped files older than
+    `max_age` and then the oldest ones until they fit in `max_bytes`; unscoped saves,
+    batch output and anything else under `root` are never collected.
+    """
+    def __init__(
+        self,
+        root: Optional[str] = None,
+        max_age: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+    ):
+        self.root = root if root is not None else os.getenv("OUTPUT_DIR", DEFAULT_OUTPUT_DIR)
+        self.max_age = max_age if max_age is not None else float(os.getenv("OUTPUT_MAX_AGE", DEFAULT_MAX_AGE))
+        self.max_bytes = max_bytes if max_bytes is not None else int(os.getenv("OUTPUT_MAX_BYTES", DEFAULT_MAX_BYTES))
+        self.scopes_root = os.path.join(self.root, SCOPES_DIR)
+        self._lock = threading.Lock()
+        self.writes = 0
+        self.written_bytes = 0
+        self.gc_runs = 0
+        self.removed_files = 0
+        self.removed_bytes = 0
+        self._usage = (0, 0)
+
+    def path_for(self, name: str, digest: str, scope: Optional[str] = None) -> str:
+        """Path of a stored file without its extension."""
+        directory = os.path.join(self.scopes_root, safe_name(scope)) if scope else self.root
+        return os.path.join(directory, f"{safe_name(name)}-{digest[:12]}")
+
+    def save(
+        self,
+        resume_data: ResumeData,
+        pdf_bytes: bytes,
+        scope: Optional[str] = None,
+        name: Optional[str] = None,
+    ) -> StoredResume:
+        """
+        Store a resume's JSON and PDF.
+
+        Args:
+            resume_data: The validated resume the PDF was rendered from
+            pdf_bytes: The rendered PDF
+            scope: Session or user the files belong to; each scope gets its own directory
+                and its files are garbage collected
+            name: File name stem; defaults to the resume's output filename
+
+        Returns:
+            StoredResume: Paths of the saved files
+        """
+        digest = hashlib.sha256(pdf_bytes).hexdigest()
+        stem = self.path_for(name or resume_data.get_output_filename(), digest, scope)
+        stored = StoredResume(f"{stem}.pdf", f"{stem}.json", digest)
+        json_bytes = resume_data.model_dump_json(indent=4).encode('utf-8')
+        for path, data in ((stored.json_path, json_bytes), (stored.pdf_path, pdf_bytes)):
+            atomic_write(path, data)
+        with self._lock:
+            self.writes += 1
+            self.written_bytes += len(json_bytes) + len(pdf_bytes)
+        return stored
+
+    def _managed_files(self) -> list:
+        """(mtime, size, path) of the files the store owns under the scopes directory, skipping hidden directories."""
+        files = []
+        for directory, subdirectories, names in os.walk(self.scopes_root):
+            subdirectories[:] = [d for d in subdirectories if not d.startswith('.')]
+            for filename in names:
+                if not filename.endswith(MANAGED_SUFFIXES):
+                    continue
+                path = os.path.join(directory, filename)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, path))
+        return files
+
+    def collect_garbage(self, now: Optional[float] = None) -> tuple[int, int]:
+        """
+        Remove expired scoped files, then the oldest ones while they exceed `max_bytes`.
+
+        Returns:
+            tuple[int, int]: Number of files and bytes removed
+        """
+        now = time.time() if now is None else now
+        files = sorted(self._managed_files())
+        total = sum(size for _, size, _ in files)
+        removed_files = removed_bytes = 0
+        for mtime, size, path in files:
+            age = now - mtime
+            if path.endswith('.tmp'):
+                # A recent temp file may belong to a write in progress
+                remove = age > STALE_TEMP_AGE
+            else:
+                # Files are ordered oldest first, so the size limit removes the oldest
+                remove = (self.max_age > 0 and age > self.max_age) or (self.max_bytes > 0 and total > self.max_bytes)
+            if not remove:
+                continue
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            removed_files += 1
+            removed_bytes += size
+        self._remove_empty_scopes()
+        with self._lock:
+            self.gc_runs += 1
+            self.removed_files += removed_files
+            self.removed_bytes += removed_bytes
+            self._usage = (len(files) - removed_files, total)
+        if removed_files:
+            log_event("output_gc", removed_files=removed_files, removed_bytes=removed_bytes, stored_bytes=total)
+        return removed_files, removed_bytes
+
+    def _remove_empty_scopes(self) -> None:
+        try:
+            entries = os.scandir(self.scopes_root)
+        except FileNotFoundError:
+            return
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False) and not entry.name.startswith('.'):
+                    try:
+                        os.rmdir(entry.path)
+                    except OSError:
+                        pass
+
+    async def run_gc(self, interval: float) -> None:
+        """Collect garbage every `interval` seconds until cancelled."""
+        while True:
+            try:
+                await asyncio.to_thread(self.collect_garbage)
+            except OSError as e:
+                log_event("output_gc_failed", error=str(e))
+            await asyncio.sleep(interval)
+
+    def stats(self) -> dict:
+        """Write and GC counters, and file count and size of the store as of the last GC."""
+        with self._lock:
+            files, stored_bytes = self._usage
+            return {
+                "files": files,
+                "bytes": stored_bytes,
+                "max_bytes": self.max_bytes,
+                "writes": self.writes,
+                "written_bytes": self.written_bytes,
+                "gc_runs": self.gc_runs,
+                "removed_files": self.removed_files,
+                "removed_bytes": self.removed_bytes,
+            }
+
+
+_store: Optional[OutputStore] = None
+_gc_task: Optional[asyncio.Task] = None
+
+
+def get_output_store() -> OutputStore:
+    """Return the process-wide output store, creating it on first use."""
+    global _store
+    if _store is None:
+        _store = OutputStore()
+        register_stats(
+            "cv_maker_output",
+            _store.stats,
+            counters=("writes", "written_bytes", "gc_runs", "removed_files", "removed_bytes"),
+        )
+    return _store
+
+
+def start_output_gc() -> Optional[asyncio.Task]:
+    """
+    Start the background GC of the output store on the running loop, once per process.
+
+    The interval comes from OUTPUT_GC_INTERVAL; 0 disables background collection.
+    """
+    global _gc_task
+    interval = float(os.getenv("OUTPUT_GC_INTERVAL", DEFAULT_GC_INTERVAL))
+    if interval <= 0:
+        return None
+    if _gc_task is None or _gc_task.done():
+        _gc_task = asyncio.get_running_loop().create_task(get_output_store().run_gc(interval))
+    return _gc_task
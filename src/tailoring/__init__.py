@@ -0,0 +1,23 @@
+# This package fans one base resume out to several job postings
+import importlib
+
+from tailoring.targets import TAILORING_TAG, JobTarget, TailoredResume
+
+__all__ = [
+    'TAILORING_TAG',
+    'JobTarget',
+    'TailoredResume',
+    'build_tailoring_graph',
+    'tailor_resumes'
+]
+
+# LangGraph is only loaded when a tailoring run is built
+_LAZY_EXPORTS = {
+    'build_tailoring_graph': 'tailoring.graph',
+    'tailor_resumes': 'tailoring.graph',
+}
+
+def __getattr__(name: str):
+    if name in _LAZY_EXPORTS:
+        return getattr(importlib.import_module(_LAZY_EXPORTS[name]), name)
+    raise AttributeError(f"module 'tailoring' has no attribute '{name}'")
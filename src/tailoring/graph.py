@@ -0,0 +1,117 @@
+import operator
+import os
+import textwrap
+from typing import Annotated, Awaitable, Callable, Optional, TypedDict
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import HumanMessage, SystemMessage
+from langgraph.graph import END, START, StateGraph
+from langgraph.graph.state import CompiledStateGraph
+from langgraph.types import Send
+
+from models.resume_models import ResumeData
+from rendering import render_affinity
+from tailoring.targets import TAILORING_TAG, JobTarget, TailoredResume
+from telemetry import log_event, span
+
+DEFAULT_MAX_PARALLEL = 3
+
+TAILORING_PROMPT = textwrap.dedent("""\
+    You tailor an ATS-friendly resume to one job posting.
+    Start from the base resume and return the complete tailored resume.
+
+    ### Guidelines:
+    *   Keep all the companies and employment periods; never invent employers, dates, degrees or experience.
+    *   Make the experiences and skills **ultra relevant** for the role: put the most relevant bullets and skills first and rephrase them towards the posting.
+    *   Include relevant keywords from the job description where the base resume supports them.
+    *   The resulting PDF resume should be 1 page max: drop the least relevant bullets and skills rather than adding new ones.
+""")
+
+# Renders a tailored resume and returns the PDF and a one-line fit summary
+Renderer = Callable[[ResumeData], Awaitable[tuple[bytes, str]]]
+
+
+class TailoringState(TypedDict):
+    base: ResumeData
+    targets: list[JobTarget]
+    # Each branch appends its own result
+    results: Annotated[list[TailoredResume], operator.add]
+
+
+class BranchState(TypedDict):
+    base: ResumeData
+    target: JobTarget
+    index: int
+
+
+def build_tailoring_graph(model: BaseChatModel, render: Renderer) -> CompiledStateGraph:
+    """
+    Compile the fan-out graph: one `tailor` branch per job target, each rewriting the
+    base resume with `model` and rendering it with `render`.
+
+    All branches run in the same step, so `max_concurrency` in the run config bounds
+    how many are in flight. The graph keeps no checkpoints: it runs inside a tool call
+    and its state (PDFs included) is not worth persisting.
+    """
+    structured_model = model.with_structured_output(ResumeData, method="function_calling").with_config(tags=[TAILORING_TAG])
+
+    async def tailor(state: BranchState) -> dict:
+        index, target = state["index"], state["target"]
+        result = TailoredResume(index, target)
+        # Branches render at the same time; pinning them all to the session's worker would serialize them
+        affinity = render_affinity.set(None)
+        try:
+            with span("tailor_branch", index=index):
+                result.resume_data = await structured_model.ainvoke([
+                    SystemMessage(TAILORING_PROMPT),
+                    HumanMessage(
+                        f"Job posting: {target.title}\n\n{target.description}\n\n"
+                        f"Base resume (JSON):\n{state['base'].model_dump_json()}"
+                    ),
+                ])
+                result.pdf_bytes, result.fit_summary = await render(result.resume_data)
+        except Exception as e:
+            # One failing posting does not cost the user the others
+            result.error = str(e)
+            log_event("tailor_failed", index=index, title=target.title, error=str(e))
+        finally:
+            render_affinity.reset(affinity)
+        return {"results": [result]}
+
+    def fan_out(state: TailoringState) -> list[Send]:
+        return [
+            Send("tailor", {"base": state["base"], "target": target, "index": index})
+            for index, target in enumerate(state["targets"])
+        ]
+
+    graph = StateGraph(TailoringState)
+    graph.add_node("tailor", tailor)
+    graph.add_conditional_edges(START, fan_out, ["tailor"])
+    graph.add_edge("tailor", END)
+    return graph.compile(checkpointer=False)
+
+
+async def tailor_resumes(
+    graph: CompiledStateGraph,
+    base: ResumeData,
+    targets: list[JobTarget],
+    max_parallel: Optional[int] = None,
+) -> list[TailoredResume]:
+    """
+    Run one tailoring branch per target, at most `max_parallel` at once.
+
+    Args:
+        graph: A graph from build_tailoring_graph
+        base: The shared base resume, derived once for all targets
+        targets: The job postings
+        max_parallel: Branch limit; defaults to TAILOR_MAX_PARALLEL
+
+    Returns:
+        list[TailoredResume]: One result per target, in target order
+    """
+    max_parallel = max_parallel or int(os.getenv("TAILOR_MAX_PARALLEL", DEFAULT_MAX_PARALLEL))
+    state = await graph.ainvoke(
+        {"base": base, "targets": targets, "results": []},
+        config={"max_concurrency": max_parallel},
+    )
+    return sorted(state["results"], key=lambda result: result.index)
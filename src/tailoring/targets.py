@@ -0,0 +1,30 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+from models.resume_models import ResumeData
+
+# Tag of the branch model runs, so chat UIs can keep their output out of the streamed answer
+TAILORING_TAG = "tailoring"
+
+
+class JobTarget(BaseModel):
+    """A job posting to tailor the base resume to."""
+    title: str = Field(description="Short label of the posting, e.g. 'Acme - Data Engineer'")
+    description: str = Field(description="The job description text")
+
+
+@dataclass
+class TailoredResume:
+    """Outcome of one tailoring branch: the tailored resume and its PDF, or the error that stopped it."""
+    index: int
+    target: JobTarget
+    resume_data: Optional[ResumeData] = None
+    pdf_bytes: Optional[bytes] = None
+    fit_summary: str = ""
+    error: str = ""
+
+    @property
+    def ok(self) -> bool:
+        return self.pdf_bytes is not None
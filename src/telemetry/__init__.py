@@ -0,0 +1,36 @@
+# This package contains the metrics registry and stage timing shared by the chat and the render workers
+from telemetry.metrics import (
+    REGISTRY,
+    Counter,
+    Histogram,
+    MetricsRegistry,
+    register_stats,
+    render_metrics
+)
+from telemetry.timing import (
+    bind_log_context,
+    capture_spans,
+    configure_logging,
+    log_event,
+    record_span,
+    record_spans,
+    span,
+    timed
+)
+
+__all__ = [
+    'REGISTRY',
+    'Counter',
+    'Histogram',
+    'MetricsRegistry',
+    'register_stats',
+    'render_metrics',
+    'bind_log_context',
+    'capture_spans',
+    'configure_logging',
+    'log_event',
+    'record_span',
+    'record_spans',
+    'span',
+    'timed'
+]
@@ -0,0 +1,111 @@
+import contextvars
+import functools
+import json
+import logging
+import os
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional
+
+from telemetry.metrics import REGISTRY
+
+logger = logging.getLogger("cv_maker")
+
+STAGE_SECONDS = REGISTRY.histogram("cv_maker_stage_seconds", "Wall time spent per pipeline stage.", ("stage",))
+STAGE_TOTAL = REGISTRY.counter("cv_maker_stage_total", "Pipeline stage runs by outcome.", ("stage", "outcome"))
+
+# Fields (session, turn, ...) attached to every log line of the current request
+_log_context: contextvars.ContextVar[dict] = contextvars.ContextVar("log_context", default={})
+# Spans recorded while capture_spans() is active, to be reported by another process
+_captured: contextvars.ContextVar[Optional[list]] = contextvars.ContextVar("captured_spans", default=None)
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line: timestamp, level, event name and the record's fields."""
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": round(record.created, 3),
+            "level": record.levelname.lower(),
+            "event": record.getMessage(),
+            **getattr(record, "fields", {}),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+def configure_logging() -> None:
+    """Send the "cv_maker" logger to stderr as JSON lines, at the level given by LOG_LEVEL."""
+    if logger.handlers:
+        return
+    handler = logging.StreamHandler()
+    handler.setFormatter(JsonFormatter())
+    logger.addHandler(handler)
+    logger.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+    logger.propagate = False
+
+
+def bind_log_context(**fields: Any) -> None:
+    """Attach `fields` to every log line emitted later in the current task."""
+    _log_context.set({**_log_context.get(), **fields})
+
+
+def log_event(event: str, level: int = logging.INFO, **fields: Any) -> None:
+    if logger.isEnabledFor(level):
+        logger.log(level, event, extra={"fields": {**_log_context.get(), **fields}})
+
+
+def record_span(stage: str, seconds: float, outcome: str = "ok", **fields: Any) -> None:
+    """Report a stage that was timed elsewhere."""
+    STAGE_SECONDS.observe(seconds, stage=stage)
+    STAGE_TOTAL.inc(stage=stage, outcome=outcome)
+    captured = _captured.get()
+    if captured is not None:
+        captured.append((stage, seconds, outcome, fields))
+    log_event("span", stage=stage, ms=round(seconds * 1000, 1), outcome=outcome, **fields)
+
+
+@contextmanager
+def span(stage: str, **fields: Any) -> Iterator[None]:
+    """Time the enclosed block as `stage`; exceptions count as an "error" outcome and propagate."""
+    started = time.perf_counter()
+    outcome = "ok"
+    try:
+        yield
+    except BaseException:
+        outcome = "error"
+        raise
+    finally:
+        record_span(stage, time.perf_counter() - started, outcome, **fields)
+
+
+def timed(stage: str) -> Callable:
+    """Decorator form of span() for synchronous functions."""
+    def decorator(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with span(stage):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+@contextmanager
+def capture_spans() -> Iterator[list]:
+    """
+    Collect the spans recorded in the enclosed block.
+
+    Render workers run in separate processes with their own registry, so they return
+    the captured spans with their result and the parent replays them with record_spans.
+    """
+    captured: list = []
+    token = _captured.set(captured)
+    try:
+        yield captured
+    finally:
+        _captured.reset(token)
+
+
+def record_spans(spans: list) -> None:
+    for stage, seconds, outcome, fields in spans:
+        record_span(stage, seconds, outcome, **fields)
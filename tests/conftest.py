@@ -0,0 +1,39 @@
+import copy
+import json
+import os
+import sys
+
+import pytest
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC_DIR = os.path.join(ROOT_DIR, 'src')
+EXAMPLE_RESUME = os.path.join(ROOT_DIR, 'examples', 'tarrant_hightopp_cv.json')
+
+# The modules import each other as top-level packages and load fonts from ./fonts,
+# the same way the app runs from src/
+sys.path.insert(0, SRC_DIR)
+
+
+@pytest.fixture(autouse=True)
+def run_from_src(monkeypatch):
+    monkeypatch.chdir(SRC_DIR)
+
+
+@pytest.fixture
+def resume_dict() -> dict:
+    with open(EXAMPLE_RESUME) as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def resume(resume_dict):
+    from models.resume_models import ResumeData
+    return ResumeData(**resume_dict)
+
+
+def lengthen(resume_dict: dict, companies: int) -> dict:
+    """The resume with its experience repeated up to `companies` entries."""
+    longer = copy.deepcopy(resume_dict)
+    experience = resume_dict['experience']
+    longer['experience'] = [copy.deepcopy(experience[index % len(experience)]) for index in range(companies)]
+    return longer
@@ -0,0 +1,42 @@
+import json
+
+from rendering.batch import BatchSummary, run_batch
+
+
+def test_directory_batch_renders_valid_records_and_reports_failures(resume_dict, tmp_path):
+    source = tmp_path / 'resumes'
+    source.mkdir()
+    output = tmp_path / 'output'
+    (source / 'a.json').write_text(json.dumps(resume_dict))
+    (source / 'b.json').write_text(json.dumps(resume_dict))
+    (source / 'broken.json').write_text('{"header": ')
+    (source / 'invalid.json').write_text(json.dumps({"header": {"name": "No Sections"}}))
+
+    summary = run_batch(str(source), str(output), workers=1)
+
+    name = resume_dict['header']['name'].lower().replace(' ', '_')
+    assert summary.rendered == 2
+    assert sorted(path.name for path in output.iterdir()) == [f"{name}_cv.pdf", f"{name}_cv_2.pdf"]
+    assert all(path.read_bytes().startswith(b'%PDF') for path in output.iterdir())
+    assert sorted(record.rsplit('/', 1)[-1] for record, _ in summary.failures) == ['broken.json', 'invalid.json']
+    assert len(summary.durations) == 2
+    assert "Rendered 2 documents, 2 failures" in summary.format()
+
+
+def test_jsonl_batch_names_failing_lines(resume_dict, tmp_path):
+    source = tmp_path / 'resumes.jsonl'
+    source.write_text(json.dumps(resume_dict) + '\n\nnot json\n')
+
+    summary = run_batch(str(source), str(tmp_path / 'output'), workers=1)
+
+    assert summary.rendered == 1
+    assert [record for record, _ in summary.failures] == ['resumes.jsonl:3']
+
+
+def test_percentiles_use_the_nearest_rank():
+    summary = BatchSummary(rendered=4, durations=[0.4, 0.1, 0.3, 0.2], wall_time=2.0)
+
+    assert summary.percentile(50) == 0.2
+    assert summary.percentile(95) == 0.4
+    assert summary.docs_per_second == 2.0
+    assert BatchSummary().percentile(50) == 0.0
@@ -0,0 +1,72 @@
+import asyncio
+import operator
+from typing import Annotated, TypedDict
+
+import aiosqlite
+from langgraph.graph import END, START, StateGraph
+
+from checkpointing import BoundedMemorySaver
+from checkpointing.sqlite import BoundedSqliteSaver
+
+
+class Turns(TypedDict):
+    turns: Annotated[list, operator.add]
+
+
+def build_graph(checkpointer):
+    graph = StateGraph(Turns)
+    graph.add_node("reply", lambda state: {"turns": ["reply"]})
+    graph.add_edge(START, "reply")
+    graph.add_edge("reply", END)
+    return graph.compile(checkpointer=checkpointer)
+
+
+def thread(thread_id: str) -> dict:
+    return {"configurable": {"thread_id": thread_id}}
+
+
+def test_memory_saver_evicts_the_least_recently_used_thread():
+    saver = BoundedMemorySaver(max_threads=2)
+    graph = build_graph(saver)
+
+    for thread_id in ("oldest", "middle", "newest"):
+        graph.invoke({"turns": ["hello"]}, thread(thread_id))
+    resumed = graph.invoke({"turns": ["again"]}, thread("newest"))
+
+    assert saver.get_tuple(thread("oldest")) is None
+    assert saver.get_tuple(thread("middle")) is not None
+    assert resumed["turns"] == ["hello", "reply", "again", "reply"]
+    assert saver.stats()["threads"] == 2
+    assert saver.stats()["evicted_threads"] == 1
+
+
+def test_memory_saver_keeps_only_the_newest_checkpoints():
+    saver = BoundedMemorySaver(max_checkpoints_per_thread=2)
+    graph = build_graph(saver)
+
+    for _ in range(3):
+        graph.invoke({"turns": ["hello"]}, thread("chat"))
+
+    assert len(list(saver.list(thread("chat")))) == 2
+    assert graph.get_state(thread("chat")).values["turns"] == ["hello", "reply"] * 3
+    assert saver.stats()["pruned_checkpoints"] > 0
+
+
+def test_sqlite_saver_evicts_idle_threads(tmp_path):
+    async def run():
+        async with aiosqlite.connect(str(tmp_path / 'checkpoints.sqlite')) as conn:
+            saver = BoundedSqliteSaver(conn, max_checkpoints_per_thread=2, ttl_seconds=0.5, prune_interval=0)
+            graph = build_graph(saver)
+            await graph.ainvoke({"turns": ["hello"]}, thread("oldest"))
+            await asyncio.sleep(0.6)
+            for _ in range(3):
+                await graph.ainvoke({"turns": ["hello"]}, thread("newest"))
+            checkpoints = [checkpoint async for checkpoint in saver.alist(thread("newest"))]
+            return await saver.aget_tuple(thread("oldest")), (await graph.aget_state(thread("newest"))).values, checkpoints, await saver.stats()
+
+    oldest, newest, checkpoints, stats = asyncio.run(run())
+
+    assert oldest is None
+    assert newest["turns"] == ["hello", "reply"] * 3
+    assert len(checkpoints) == 2
+    assert stats["threads"] == 1
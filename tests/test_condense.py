@@ -0,0 +1,50 @@
+from ingestion.condense import CondensedContext, group_facts
+
+
+def long_document(label: str, lines: int) -> list[str]:
+    return ["\n".join(f"{label} achievement number {index} with a few words of detail" for index in range(lines))]
+
+
+def test_facts_are_grouped_under_headings():
+    groups = group_facts(["Jane Doe", "EXPERIENCE", "Acme Corp", "Built things", "Skills:", "Python"])
+
+    assert groups == [(None, ["Jane Doe"]), ("Experience", ["Acme Corp", "Built things"]), ("Skills", ["Python"])]
+
+
+def test_duplicate_lines_are_kept_once():
+    context = CondensedContext()
+    context.add_document("a.txt", ["Python developer\nLives in Berlin"])
+    context.add_document("b.txt", ["python  developer\nSpeaks German"])
+
+    content = context.to_message_content()
+
+    assert content.lower().count("python developer") == 1
+    assert "Speaks German" in content
+
+
+def test_later_documents_get_a_fair_share_of_the_budget():
+    context = CondensedContext(token_budget=400)
+    context.add_document("first.pdf", long_document("First", 60))
+    context.add_document("second.pdf", long_document("Second", 60))
+    context.add_document("short.txt", ["Certifications", "AWS Solutions Architect"])
+
+    content = context.to_message_content()
+
+    assert context.token_count <= context.token_budget
+    assert "AWS Solutions Architect" in content
+    kept = {label: content.count(f"{label} achievement") for label in ("First", "Second")}
+    assert kept["First"] > 0 and abs(kept["First"] - kept["Second"]) <= 1
+    assert set(context.omitted) == {"first.pdf", "second.pdf"}
+    assert f"Facts from second.pdf ({context.omitted['second.pdf']} of 60 lines omitted):" in content
+    assert "left out to fit the context budget" in content
+
+
+def test_nothing_is_reported_when_everything_fits():
+    context = CondensedContext(token_budget=3000)
+    context.add_document("first.pdf", long_document("First", 5))
+
+    content = context.to_message_content()
+
+    assert context.omitted == {}
+    assert context.omitted_facts == 0
+    assert "omitted" not in content
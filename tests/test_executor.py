@@ -0,0 +1,77 @@
+import asyncio
+import os
+import time
+
+import pytest
+
+from rendering import RenderExecutor, RenderQueueFull, RenderTimeout, render_affinity
+
+
+def process_exists(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    return True
+
+
+def test_timed_out_job_does_not_block_the_next_one():
+    executor = RenderExecutor(max_workers=1, timeout=5)
+
+    async def run():
+        first = await executor.submit(os.getpid)
+        executor.timeout = 0.5
+        with pytest.raises(RenderTimeout):
+            await executor.submit(time.sleep, 60)
+        executor.timeout = 5
+        started = time.monotonic()
+        second = await executor.submit(os.getpid)
+        return first, second, time.monotonic() - started
+
+    try:
+        first, second, elapsed = asyncio.run(run())
+    finally:
+        executor.shutdown()
+
+    assert second != first
+    assert elapsed < 5
+    deadline = time.monotonic() + 5
+    while process_exists(first) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert not process_exists(first)
+
+
+def test_full_queue_is_rejected():
+    executor = RenderExecutor(max_workers=1, max_queue=0, timeout=10)
+
+    async def run():
+        running = asyncio.ensure_future(executor.submit(time.sleep, 0.5))
+        await asyncio.sleep(0)
+        with pytest.raises(RenderQueueFull):
+            await executor.submit(os.getpid)
+        await running
+
+    try:
+        asyncio.run(run())
+    finally:
+        executor.shutdown()
+
+
+def test_affinity_prefers_the_session_worker_while_it_is_idle():
+    executor = RenderExecutor(max_workers=2, timeout=30)
+
+    async def run():
+        render_affinity.set('session')
+        await executor.submit(os.getpid)
+        await executor.submit(os.getpid)
+        sequential = [pool is not None for pool in executor._pools]
+        await asyncio.gather(executor.submit(time.sleep, 0.5), executor.submit(time.sleep, 0.5))
+        return sequential, [pool is not None for pool in executor._pools]
+
+    try:
+        sequential, concurrent = asyncio.run(run())
+    finally:
+        executor.shutdown()
+
+    assert sorted(sequential) == [False, True]
+    assert concurrent == [True, True]
@@ -0,0 +1,53 @@
+import pytest
+
+from conftest import lengthen
+from models.resume_models import ResumeData
+from rendering.fit import DEFAULT_MIN_SCALE, SCALE_STEP, fit_resume, measure_resume_height
+
+
+def test_short_resume_is_not_scaled(resume):
+    fit = fit_resume(resume)
+
+    assert fit.scale == 1.0
+    assert fit.fits
+    assert fit.measurements == 1
+    assert fit.describe() == "The resume fits on one page."
+
+
+@pytest.mark.parametrize("companies", [7, 8])
+def test_long_resume_is_scaled_as_little_as_needed(resume_dict, companies):
+    resume = ResumeData(**lengthen(resume_dict, companies))
+
+    fit = fit_resume(resume)
+
+    assert DEFAULT_MIN_SCALE < fit.scale < 1.0
+    assert fit.fits
+    # The scale is on the search grid and one step larger no longer fits
+    assert round(fit.scale / SCALE_STEP) * SCALE_STEP == pytest.approx(fit.scale)
+    assert measure_resume_height(resume, fit.scale) == pytest.approx(fit.height)
+    assert measure_resume_height(resume, fit.scale + SCALE_STEP) > fit.available_height
+    assert f"{fit.scale:.1%}" in fit.describe()
+
+
+def test_resume_too_long_for_min_scale_reports_overflow(resume_dict):
+    resume = ResumeData(**lengthen(resume_dict, 12))
+
+    fit = fit_resume(resume)
+
+    assert fit.scale == DEFAULT_MIN_SCALE
+    assert not fit.fits
+    assert fit.overflow == pytest.approx(fit.height - fit.available_height)
+    assert "shorten the content" in fit.describe()
+
+
+def test_scaling_shrinks_the_layout(resume):
+    assert measure_resume_height(resume, 0.9) < measure_resume_height(resume, 1.0)
+
+
+def test_fragments_give_the_same_layout(resume_dict):
+    from sections.fragments import refresh_fragments
+
+    resume = ResumeData(**lengthen(resume_dict, 8))
+    fragments = refresh_fragments(resume, None, ())
+
+    assert fit_resume(resume, fragments=fragments) == fit_resume(resume)
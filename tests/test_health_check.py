@@ -0,0 +1,107 @@
+import re
+
+import pytest
+from fastapi.testclient import TestClient
+
+import health_check
+from rendering import RenderQueueFull, RenderTimeout
+from telemetry import record_span, register_stats
+from telemetry.metrics import REGISTRY
+
+SAMPLE = re.compile(r'^([a-zA-Z_:][a-zA-Z0-9_:]*)(\{[a-zA-Z_][a-zA-Z0-9_]*="(?:[^"\\]|\\.)*"(?:,[a-zA-Z_][a-zA-Z0-9_]*="(?:[^"\\]|\\.)*")*\})? (\S+)$')
+
+
+@pytest.fixture
+def client():
+    # Not used as a context manager, so the lifespan does not start the render pool
+    return TestClient(health_check.app)
+
+
+def parse_exposition(text: str) -> dict:
+    """Map each metric family to its type and samples, checking the line syntax on the way."""
+    families, current = {}, None
+    assert text.endswith('\n')
+    for line in text.splitlines():
+        if line.startswith('# HELP '):
+            current = line.split(' ')[2]
+            families[current] = {'type': None, 'samples': []}
+        elif line.startswith('# TYPE '):
+            _, _, name, kind = line.split(' ')
+            assert name == current and kind in ('counter', 'gauge', 'histogram')
+            families[name]['type'] = kind
+        else:
+            match = SAMPLE.match(line)
+            assert match, line
+            name, labels, value = match.groups()
+            assert name == current or name.rsplit('_', 1)[0] == current, line
+            families[current]['samples'].append((name, labels or '', float(value)))
+    return families
+
+
+def test_metrics_use_the_prometheus_text_format(client, monkeypatch):
+    monkeypatch.setattr(REGISTRY, '_collectors', dict(REGISTRY._collectors))
+    record_span('test_stage', 0.3)
+    record_span('test_stage', 20.0, outcome='error')
+    register_stats('cv_maker_test', lambda: {'entries': 3, 'hits': 5, 'name': 'ignored'}, counters=('hits',))
+
+    response = client.get('/metrics')
+
+    assert response.status_code == 200
+    assert response.headers['content-type'] == 'text/plain; version=0.0.4; charset=utf-8'
+    families = parse_exposition(response.text)
+    assert families['cv_maker_test_entries'] == {'type': 'gauge', 'samples': [('cv_maker_test_entries', '', 3.0)]}
+    assert families['cv_maker_test_hits_total'] == {'type': 'counter', 'samples': [('cv_maker_test_hits_total', '', 5.0)]}
+    assert 'cv_maker_test_name' not in families
+
+    stage = families['cv_maker_stage_seconds']
+    assert stage['type'] == 'histogram'
+    buckets = [value for name, labels, value in stage['samples'] if name.endswith('_bucket') and 'stage="test_stage"' in labels]
+    assert buckets == sorted(buckets) and buckets[-1] == 2
+    assert ('cv_maker_stage_seconds_bucket', '{stage="test_stage",le="0.5"}', 1.0) in stage['samples']
+    assert ('cv_maker_stage_seconds_bucket', '{stage="test_stage",le="+Inf"}', 2.0) in stage['samples']
+    assert ('cv_maker_stage_seconds_count', '{stage="test_stage"}', 2.0) in stage['samples']
+    assert ('cv_maker_stage_seconds_sum', '{stage="test_stage"}', 20.3) in stage['samples']
+    assert ('cv_maker_stage_total', '{stage="test_stage",outcome="error"}', 1.0) in families['cv_maker_stage_total']['samples']
+
+
+def test_full_render_queue_returns_429_with_retry_after(client, resume_dict, monkeypatch):
+    async def queue_full(resume_data):
+        raise RenderQueueFull("Render queue is full (36 jobs pending)")
+
+    monkeypatch.setattr(health_check, 'render_resume_pdf', queue_full)
+    monkeypatch.setenv('RENDER_RETRY_AFTER', '5')
+
+    response = client.post('/render', json=resume_dict)
+
+    assert response.status_code == 429
+    assert response.headers['retry-after'] == '5'
+    assert response.json() == {'detail': "Render queue is full (36 jobs pending)"}
+
+
+def test_render_timeout_returns_504(client, resume_dict, monkeypatch):
+    async def timeout(resume_data):
+        raise RenderTimeout("Render job exceeded 60.0s")
+
+    monkeypatch.setattr(health_check, 'fit_resume_pdf', timeout)
+
+    response = client.post('/render', params={'fit_one_page': 'true'}, json=resume_dict)
+
+    assert response.status_code == 504
+    assert 'retry-after' not in response.headers
+    assert response.json() == {'detail': "Render job exceeded 60.0s"}
+
+
+def test_render_streams_the_pdf(client, resume_dict, monkeypatch):
+    pdf_bytes = b'%PDF' + b'x' * (2 * health_check.STREAM_CHUNK_BYTES)
+
+    async def render(resume_data):
+        return pdf_bytes
+
+    monkeypatch.setattr(health_check, 'render_resume_pdf', render)
+
+    response = client.post('/render', json=resume_dict)
+
+    assert response.status_code == 200
+    assert response.headers['content-type'] == 'application/pdf'
+    assert response.headers['content-length'] == str(len(pdf_bytes))
+    assert response.content == pdf_bytes
@@ -0,0 +1,45 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from conftest import ROOT_DIR, SRC_DIR
+
+sys.path.insert(0, os.path.join(ROOT_DIR, 'benchmarks'))
+from import_time import IMPORT_BUDGETS  # noqa: E402
+
+
+def run_probe(code: str) -> dict:
+    """Run `code` in a fresh interpreter from src/ and return the JSON it prints last."""
+    result = subprocess.run([sys.executable, '-c', code], cwd=SRC_DIR, capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.parametrize("module", sorted(IMPORT_BUDGETS))
+def test_entry_points_do_not_import_heavy_modules(module):
+    forbidden = IMPORT_BUDGETS[module][1]
+
+    loaded = run_probe(f"import json, sys\nimport {module}\nprint(json.dumps([name for name in {forbidden!r} if name in sys.modules]))")
+
+    assert loaded == []
+
+
+def test_fonts_are_registered_on_first_render():
+    probe = run_probe(
+        "import json, cv_maker_tool\n"
+        "from reportlab.pdfbase import pdfmetrics\n"
+        "from constants import GARAMOND_FONTS\n"
+        "before = [name for name in GARAMOND_FONTS if name in pdfmetrics.getRegisteredFontNames()]\n"
+        "from rendering.document import build_resume_table\n"
+        "from models.resume_models import ResumeData\n"
+        "imported = [name for name in GARAMOND_FONTS if name in pdfmetrics.getRegisteredFontNames()]\n"
+        "build_resume_table(ResumeData.from_file('../examples/tarrant_hightopp_cv.json'))\n"
+        "after = [name for name in GARAMOND_FONTS if name in pdfmetrics.getRegisteredFontNames()]\n"
+        "print(json.dumps({'before': before, 'imported': imported, 'after': after, 'fonts': list(GARAMOND_FONTS)}))"
+    )
+
+    assert probe['before'] == []
+    assert probe['imported'] == []
+    assert probe['after'] == probe['fonts']
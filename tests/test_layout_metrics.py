@@ -0,0 +1,66 @@
+import asyncio
+import json
+
+import pytest
+
+from conftest import lengthen
+from cv_maker_tool import measure_resume
+from models.resume_models import ResumeData
+from rendering import get_render_executor
+from rendering.fit import measure_resume_height
+from rendering.layout_metrics import measure_resume_layout
+
+
+def test_metrics_attribute_every_row(resume):
+    metrics = measure_resume_layout(resume)
+
+    assert metrics.page_count == 1
+    assert metrics.overflow == 0.0
+    assert metrics.total_height == pytest.approx(measure_resume_height(resume))
+    assert sum(section.height for section in metrics.sections) == pytest.approx(metrics.total_height)
+    assert [section.name for section in metrics.sections] == ["Header", "Work Experience", "Education", "Skills"]
+
+    experience = metrics.sections[1]
+    assert [entry.name for entry in experience.entries] == [company.company for company in resume.experience]
+    assert [len(entry.bullets) for entry in experience.entries] == [len(company.description) for company in resume.experience]
+    assert all(sum(entry.bullets) < entry.height for entry in experience.entries)
+
+
+def test_long_resume_reports_pages_and_overflow(resume_dict):
+    metrics = measure_resume_layout(ResumeData(**lengthen(resume_dict, 12)))
+
+    assert metrics.page_count == 2
+    assert metrics.overflow == pytest.approx(metrics.total_height - metrics.page_height)
+
+
+def test_scaling_shrinks_every_section(resume):
+    full, scaled = measure_resume_layout(resume), measure_resume_layout(resume, 0.9)
+
+    assert all(small.height < large.height for small, large in zip(scaled.sections, full.sections))
+
+
+def test_tool_result_is_compact_json(resume):
+    result = measure_resume_layout(resume).to_dict()
+
+    assert json.loads(json.dumps(result)) == result
+    assert result['sections'][1]['entries'][0]['bullets'] == [round(height, 1) for height in result['sections'][1]['entries'][0]['bullets']]
+
+
+def test_measure_resume_runs_in_the_render_pool(resume):
+    try:
+        metrics = asyncio.run(measure_resume(resume.model_dump()))
+    finally:
+        get_render_executor().shutdown()
+
+    assert metrics == measure_resume_layout(resume)
+
+
+def test_check_resume_layout_tool(resume_dict):
+    from chatbot import check_resume_layout
+
+    try:
+        result = asyncio.run(check_resume_layout.ainvoke({"resume_data": resume_dict}))
+    finally:
+        get_render_executor().shutdown()
+
+    assert json.loads(result)['page_count'] == 1
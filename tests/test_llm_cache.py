@@ -0,0 +1,76 @@
+import contextvars
+
+from langchain_core.language_models import FakeListChatModel
+from langchain_core.messages import AIMessage, HumanMessage
+
+from llm import ResponseCache, current_cache_partition
+
+JOB_DESCRIPTION = (
+    "We are looking for a senior data engineer to design and run our streaming pipelines. "
+    "You will own ingestion from dozens of sources, model the warehouse, mentor two junior engineers "
+    "and work with analysts on the metrics layer. Experience with Kafka, Spark, dbt and Airflow is "
+    "expected, as is writing clear design documents and reviewing code carefully. The team is remote "
+    "first, meets in person twice a year and ships small changes every day behind feature flags."
+)
+
+
+class CountingChatModel(FakeListChatModel):
+    """Fake chat model that records how often it is really called."""
+    calls: int = 0
+
+    def _call(self, *args, **kwargs) -> str:
+        self.calls += 1
+        return super()._call(*args, **kwargs)
+
+
+def make_model(cache: ResponseCache) -> CountingChatModel:
+    return CountingChatModel(responses=["first answer", "second answer", "third answer"], cache=cache)
+
+
+def test_repeated_prompt_is_not_sent_to_the_model():
+    cache = ResponseCache(':memory:')
+    model = make_model(cache)
+
+    first = model.invoke([HumanMessage("Tailor my resume")])
+    second = model.invoke([HumanMessage("  Tailor   my resume ")])
+
+    assert model.calls == 1
+    assert second.content == first.content == "first answer"
+    assert cache.stats() == {"entries": 1, "hits": 1, "near_hits": 0, "misses": 1}
+
+
+def test_partitions_do_not_share_answers():
+    cache = ResponseCache(':memory:')
+    model = make_model(cache)
+
+    def ask(partition: str) -> str:
+        current_cache_partition.set(partition)
+        return model.invoke([HumanMessage("Tailor my resume")]).content
+
+    answers = [contextvars.copy_context().run(ask, partition) for partition in ("alice", "bob", "alice")]
+
+    assert answers == ["first answer", "second answer", "first answer"]
+    assert model.calls == 2
+
+
+def test_near_duplicate_hit_counts_once():
+    cache = ResponseCache(':memory:', near_duplicates=True)
+    model = make_model(cache)
+
+    model.invoke([HumanMessage(JOB_DESCRIPTION)])
+    answer = model.invoke([HumanMessage(JOB_DESCRIPTION.replace("twice a year", "twice each year"))])
+
+    assert answer.content == "first answer"
+    assert model.calls == 1
+    assert cache.stats() == {"entries": 1, "hits": 0, "near_hits": 1, "misses": 1}
+
+
+def test_different_earlier_conversation_is_not_a_near_duplicate():
+    cache = ResponseCache(':memory:', near_duplicates=True)
+    model = make_model(cache)
+
+    model.invoke([HumanMessage(JOB_DESCRIPTION)])
+    answer = model.invoke([HumanMessage("Hi"), AIMessage("Hello"), HumanMessage(JOB_DESCRIPTION)])
+
+    assert answer.content == "second answer"
+    assert model.calls == 2
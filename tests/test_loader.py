@@ -0,0 +1,69 @@
+import asyncio
+
+import pytest
+
+from ingestion.loader import DocumentIngestor, UploadTooLarge
+
+
+def write_pdf(path, pages: int) -> None:
+    import pymupdf
+
+    with pymupdf.open() as document:
+        for number in range(pages):
+            document.new_page().insert_text((72, 72), f"Page {number + 1}")
+        document.save(path)
+
+
+def test_files_over_the_size_limit_are_rejected(tmp_path):
+    path = tmp_path / 'big.txt'
+    path.write_text('x' * 2048)
+
+    with pytest.raises(UploadTooLarge):
+        DocumentIngestor(max_workers=1, max_bytes=1024).extract(str(path), 'big.txt')
+
+
+def test_only_the_first_pages_are_read(tmp_path):
+    path = tmp_path / 'long.pdf'
+    write_pdf(str(path), 5)
+
+    document = DocumentIngestor(max_workers=1, max_pages=3).extract(str(path), 'long.pdf')
+
+    assert [page.strip() for page in document.pages] == ['Page 1', 'Page 2', 'Page 3']
+    assert document.truncated
+
+
+@pytest.mark.parametrize("length, truncated", [(100, False), (101, True)])
+def test_text_is_cut_at_the_character_limit(tmp_path, length, truncated):
+    path = tmp_path / 'notes.txt'
+    path.write_text('x' * length)
+
+    document = DocumentIngestor(max_workers=1, max_chars=100).extract(str(path), 'notes.txt')
+
+    assert document.pages == ['x' * 100]
+    assert document.truncated is truncated
+
+
+def test_character_limit_spans_pdf_pages(tmp_path):
+    path = tmp_path / 'long.pdf'
+    write_pdf(str(path), 3)
+    page_length = len(DocumentIngestor(max_workers=1).extract(str(path), 'long.pdf').pages[0])
+
+    document = DocumentIngestor(max_workers=1, max_chars=page_length + 2).extract(str(path), 'long.pdf')
+
+    assert [len(page) for page in document.pages] == [page_length, 2]
+    assert document.truncated
+
+
+def test_same_content_is_served_from_the_cache(tmp_path):
+    first, second = tmp_path / 'a.txt', tmp_path / 'b.txt'
+    first.write_text('Managed the Tesseract initiative')
+    second.write_text('Managed the Tesseract initiative')
+    ingestor = DocumentIngestor(max_workers=2)
+
+    original = ingestor.extract(str(first), 'a.txt')
+    results = asyncio.run(ingestor.extract_many([(str(second), 'b.txt'), (str(tmp_path / 'missing.txt'), 'missing.txt')]))
+
+    assert not original.cached
+    assert results[0].cached and results[0].name == 'b.txt'
+    assert results[0].pages == original.pages and results[0].content_hash == original.content_hash
+    assert isinstance(results[1], FileNotFoundError)
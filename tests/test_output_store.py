@@ -0,0 +1,124 @@
+import os
+import stat
+import tempfile
+
+import pytest
+
+from storage import OutputStore, atomic_write, safe_name
+from storage.output_store import FILE_MODE, STALE_TEMP_AGE
+
+NOW = 1_000_000.0
+DAY = 24 * 3600
+
+
+def make_file(path, size: int, age: float) -> str:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(b'x' * size)
+    os.utime(path, (NOW - age, NOW - age))
+    return str(path)
+
+
+def test_save_is_content_addressed_and_scoped(resume, tmp_path):
+    store = OutputStore(root=str(tmp_path))
+
+    first = store.save(resume, b'%PDF one', scope='session/1')
+    again = store.save(resume, b'%PDF one', scope='session/1')
+    other = store.save(resume, b'%PDF two', scope='session/1')
+
+    assert first == again
+    assert other.pdf_path != first.pdf_path
+    assert os.path.dirname(first.pdf_path) == os.path.join(str(tmp_path), 'sessions', 'session_1')
+    with open(first.pdf_path, 'rb') as f:
+        assert f.read() == b'%PDF one'
+    assert stat.S_IMODE(os.stat(first.pdf_path).st_mode) == FILE_MODE == 0o644
+
+
+def test_gc_removes_expired_files(tmp_path):
+    store = OutputStore(root=str(tmp_path), max_age=7 * DAY, max_bytes=0)
+    old = make_file(tmp_path / 'sessions' / 'a' / 'old.pdf', 10, 8 * DAY)
+    new = make_file(tmp_path / 'sessions' / 'a' / 'new.pdf', 10, 1 * DAY)
+
+    assert store.collect_garbage(now=NOW) == (1, 10)
+    assert not os.path.exists(old)
+    assert os.path.exists(new)
+    assert store.stats()['files'] == 1
+
+
+def test_gc_removes_oldest_files_over_the_size_limit(tmp_path):
+    store = OutputStore(root=str(tmp_path), max_age=0, max_bytes=25)
+    paths = [make_file(tmp_path / 'sessions' / 'a' / f'{age}.pdf', 10, age) for age in (300, 200, 100)]
+
+    assert store.collect_garbage(now=NOW) == (1, 10)
+    assert [os.path.exists(path) for path in paths] == [False, True, True]
+    assert store.stats()['bytes'] == 20
+
+
+def test_gc_leaves_files_outside_the_scopes_directory(tmp_path):
+    store = OutputStore(root=str(tmp_path), max_age=1, max_bytes=0)
+    kept = [
+        make_file(tmp_path / 'checkpoints.sqlite', 10, 8 * DAY),
+        make_file(tmp_path / '.render_cache' / 'key.pdf', 10, 8 * DAY),
+        make_file(tmp_path / 'cli_resume-0123456789ab.pdf', 10, 8 * DAY),
+        make_file(tmp_path / 'batch' / 'jane_doe_cv.pdf', 10, 8 * DAY),
+        make_file(tmp_path / 'sessions' / 'a' / 'notes.txt', 10, 8 * DAY),
+    ]
+
+    assert store.collect_garbage(now=NOW) == (0, 0)
+    assert all(os.path.exists(path) for path in kept)
+
+
+@pytest.mark.parametrize("age, removed", [(STALE_TEMP_AGE + 1, True), (STALE_TEMP_AGE - 60, False)])
+def test_gc_removes_only_stale_temp_files(tmp_path, age, removed):
+    store = OutputStore(root=str(tmp_path), max_age=0, max_bytes=0)
+    temp = make_file(tmp_path / 'sessions' / 'a' / '.resume.pdf.abc.tmp', 10, age)
+
+    store.collect_garbage(now=NOW)
+
+    assert os.path.exists(temp) != removed
+
+
+def test_gc_removes_empty_scope_directories(tmp_path):
+    store = OutputStore(root=str(tmp_path), max_age=DAY, max_bytes=0)
+    make_file(tmp_path / 'sessions' / 'session' / 'old.json', 10, 2 * DAY)
+    os.makedirs(tmp_path / 'batch')
+
+    store.collect_garbage(now=NOW)
+
+    assert not os.path.exists(tmp_path / 'sessions' / 'session')
+    assert os.path.isdir(tmp_path / 'batch')
+
+
+def test_save_recreates_a_scope_directory_removed_by_gc(resume, tmp_path, monkeypatch):
+    store = OutputStore(root=str(tmp_path))
+    mkstemp = tempfile.mkstemp
+    removed = []
+
+    def remove_directory_first(dir, **kwargs):
+        # GC runs between the directory being created and the temp file being opened
+        if not removed:
+            removed.append(dir)
+            os.rmdir(dir)
+        return mkstemp(dir=dir, **kwargs)
+
+    monkeypatch.setattr(tempfile, 'mkstemp', remove_directory_first)
+    saved = store.save(resume, b'%PDF one', scope='session')
+
+    assert removed
+    assert os.path.isfile(saved.pdf_path) and os.path.isfile(saved.json_path)
+
+
+def test_atomic_write_leaves_no_temp_file_on_failure(tmp_path, monkeypatch):
+    def fail(source, destination):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, 'replace', fail)
+    with pytest.raises(OSError):
+        atomic_write(str(tmp_path / 'resume.pdf'), b'%PDF')
+
+    assert os.listdir(tmp_path) == []
+
+
+@pytest.mark.parametrize("name, expected", [("../../etc/passwd", "etc_passwd"), ("Jane Doe CV", "Jane_Doe_CV"), ("..", "resume")])
+def test_safe_name(name, expected):
+    assert safe_name(name) == expected
@@ -0,0 +1,51 @@
+import re
+
+import pytest
+
+from elements.base_element import ModelAdapter
+from rendering.document import render_resume_bytes
+from rendering.layout_metrics import measure_resume_layout
+from rendering.preview import render_resume_html, render_resume_text
+
+
+def normalize(text: str) -> str:
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+def pdf_text(pdf_bytes: bytes) -> str:
+    import pymupdf
+
+    with pymupdf.open(stream=pdf_bytes, filetype='pdf') as document:
+        return normalize(' '.join(page.get_text() for page in document))
+
+
+def test_text_preview_has_the_pdf_content(resume):
+    printed = pdf_text(render_resume_bytes(resume))
+    lines = [line for line in render_resume_text(resume).splitlines() if line]
+
+    for line in lines:
+        for part in line.split(' | '):
+            part = normalize(re.sub(r'^[•\-–·]\s*', '', part))
+            assert part.lower() in printed.lower(), part
+
+
+def test_previews_have_the_pdf_sections_and_entries(resume):
+    metrics = measure_resume_layout(resume)
+    sections = [section.name for section in metrics.sections[1:]]
+    text = render_resume_text(resume)
+    page = render_resume_html(resume)
+
+    assert [line.title() for line in text.splitlines() if line.isupper() and len(line) > 1] == [name.title() for name in sections]
+    assert re.findall(r'<h2>(.*?)</h2>', page) == sections
+    for section, block in zip(metrics.sections[1:], page.split('<section>')[1:]):
+        assert all(entry.name in block and entry.name in text for entry in section.entries)
+        if any(entry.bullets for entry in section.entries):
+            assert block.count('<li>') == sum(len(entry.bullets) for entry in section.entries)
+
+
+def test_adapters_must_implement_write(resume):
+    class Incomplete(ModelAdapter):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete(resume.header)
@@ -0,0 +1,69 @@
+import asyncio
+import os
+import stat
+
+import constants.resume_constants
+from models.resume_models import ResumeData
+from rendering.cache import RenderCache, resume_cache_key
+from storage.output_store import FILE_MODE
+
+
+class CountingRenderer:
+    def __init__(self, pdf_bytes: bytes = b"%PDF-1.4 test"):
+        self.pdf_bytes = pdf_bytes
+        self.calls = 0
+
+    async def __call__(self) -> bytes:
+        self.calls += 1
+        return self.pdf_bytes
+
+
+def test_key_is_canonical(resume_dict):
+    reordered = dict(reversed(list(resume_dict.items())))
+
+    assert resume_cache_key(ResumeData(**resume_dict)) == resume_cache_key(ResumeData(**reordered))
+
+
+def test_key_changes_with_content_and_variant(resume, resume_dict):
+    resume_dict['header']['name'] = "Someone Else"
+
+    assert resume_cache_key(ResumeData(**resume_dict)) != resume_cache_key(resume)
+    assert resume_cache_key(resume, "scale=0.9") != resume_cache_key(resume)
+
+
+def test_key_changes_with_layout_version(resume, monkeypatch):
+    before = resume_cache_key(resume)
+    monkeypatch.setattr(constants.resume_constants, 'LAYOUT_VERSION', constants.resume_constants.LAYOUT_VERSION + 1)
+
+    assert resume_cache_key(resume) != before
+
+
+def test_layout_version_bump_skips_disk_entries(resume, tmp_path, monkeypatch):
+    renderer = CountingRenderer()
+    asyncio.run(RenderCache(cache_dir=str(tmp_path)).render(resume, renderer))
+    # A fresh process with the same layout reads the disk tier
+    asyncio.run(RenderCache(cache_dir=str(tmp_path)).render(resume, renderer))
+    assert renderer.calls == 1
+
+    monkeypatch.setattr(constants.resume_constants, 'LAYOUT_VERSION', constants.resume_constants.LAYOUT_VERSION + 1)
+    asyncio.run(RenderCache(cache_dir=str(tmp_path)).render(resume, renderer))
+    assert renderer.calls == 2
+
+
+def test_concurrent_requests_share_one_render(resume, tmp_path):
+    renderer = CountingRenderer()
+    cache = RenderCache(cache_dir=str(tmp_path))
+
+    async def render_twice():
+        return await asyncio.gather(cache.render(resume, renderer), cache.render(resume, renderer))
+
+    assert asyncio.run(render_twice()) == [renderer.pdf_bytes] * 2
+    assert renderer.calls == 1
+    assert cache.stats() == {"entries": 1, "hits": 1, "misses": 1}
+
+
+def test_disk_entries_are_readable_by_other_users(resume, tmp_path):
+    asyncio.run(RenderCache(cache_dir=str(tmp_path)).render(resume, CountingRenderer()))
+
+    [entry] = os.listdir(tmp_path)
+    assert stat.S_IMODE(os.stat(tmp_path / entry).st_mode) == FILE_MODE
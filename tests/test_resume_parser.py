@@ -0,0 +1,47 @@
+import pytest
+
+from conftest import lengthen
+from ingestion.resume_parser import parse_resume_pdf
+from models.resume_models import ResumeData
+from rendering.document import render_resume, render_resume_bytes
+
+
+def without_projects(resume: ResumeData) -> dict:
+    # Projects are not part of the rendered layout
+    return resume.model_copy(update={'projects': []}).model_dump()
+
+
+def test_round_trip(resume, tmp_path):
+    path = render_resume(resume, str(tmp_path / 'resume.pdf'))
+
+    parsed = parse_resume_pdf(path)
+
+    assert parsed.confidence == 1.0
+    assert parsed.issues == []
+    assert parsed.resume.model_dump() == without_projects(resume)
+
+
+@pytest.mark.parametrize("scale", [0.9, 0.8])
+def test_round_trip_of_scaled_resume(resume_dict, tmp_path, scale):
+    resume = ResumeData(**lengthen(resume_dict, 5))
+    path = tmp_path / 'resume.pdf'
+    path.write_bytes(render_resume_bytes(resume, scale))
+
+    parsed = parse_resume_pdf(str(path))
+
+    assert parsed.confidence == 1.0
+    assert parsed.resume.model_dump() == without_projects(resume)
+
+
+def test_other_pdfs_are_rejected(tmp_path):
+    import pymupdf
+
+    path = str(tmp_path / 'other.pdf')
+    with pymupdf.open() as document:
+        document.new_page().insert_text((72, 72), "Jane Doe\nSoftware Engineer")
+        document.save(path)
+
+    parsed = parse_resume_pdf(path)
+
+    assert parsed.resume is None
+    assert parsed.confidence == 0.0
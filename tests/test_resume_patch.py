@@ -0,0 +1,73 @@
+import pytest
+
+from models.resume_patch import PatchOperation, ResumePatchError, apply_resume_patch
+
+
+def patch(*operations: dict) -> list[PatchOperation]:
+    return [PatchOperation.model_validate(operation) for operation in operations]
+
+
+def test_replace_add_and_remove(resume):
+    patched = apply_resume_patch(resume, patch(
+        {"op": "replace", "path": "/experience/0/description/0", "value": "Rewritten bullet"},
+        {"op": "add", "path": "/skills/0/elements/-", "value": "Juggling"},
+        {"op": "remove", "path": "/education/0"},
+    ))
+
+    assert patched.experience[0].description[0] == "Rewritten bullet"
+    assert patched.skills[0].elements[-1] == "Juggling"
+    assert len(patched.education) == len(resume.education) - 1
+
+
+def test_move_uses_the_from_alias(resume):
+    last = len(resume.experience) - 1
+
+    patched = apply_resume_patch(resume, patch({"op": "move", "from": f"/experience/{last}", "path": "/experience/0"}))
+
+    assert patched.experience[0] == resume.experience[last]
+
+
+def test_original_resume_is_unchanged(resume):
+    before = resume.model_dump()
+
+    apply_resume_patch(resume, patch({"op": "replace", "path": "/header/name", "value": "New Name"}))
+
+    assert resume.model_dump() == before
+
+
+def test_failed_operation_applies_nothing(resume):
+    with pytest.raises(ResumePatchError):
+        apply_resume_patch(resume, patch(
+            {"op": "replace", "path": "/header/name", "value": "New Name"},
+            {"op": "remove", "path": "/experience/99"},
+        ))
+
+    assert resume.header.name != "New Name"
+
+
+@pytest.mark.parametrize("operation, message", [
+    ({"op": "remove", "path": "/experience/99"}, "Operation 0 (remove /experience/99) does not apply"),
+    ({"op": "replace", "path": "/nonexistent/field", "value": 1}, "Operation 0 (replace /nonexistent/field) does not apply"),
+    ({"op": "move", "from": "/experience/99", "path": "/experience/0"}, "Operation 0 (move /experience/99 -> /experience/0) does not apply"),
+])
+def test_errors_name_the_operation_without_quoting_the_resume(resume, operation, message):
+    with pytest.raises(ResumePatchError) as error:
+        apply_resume_patch(resume, patch(operation))
+
+    assert str(error.value).startswith(message)
+    assert resume.header.name not in str(error.value)
+    assert len(str(error.value)) < 200
+
+
+def test_invalid_result_lists_the_failing_fields(resume):
+    with pytest.raises(ResumePatchError) as error:
+        apply_resume_patch(resume, patch(
+            {"op": "replace", "path": "/header/email", "value": 42},
+            {"op": "remove", "path": "/experience/0/company"},
+        ))
+
+    message = str(error.value)
+    assert message.startswith("Patched resume is invalid: ")
+    assert "/header/email" in message
+    assert "/experience/0/company" in message
+    assert resume.header.name not in message
@@ -0,0 +1,86 @@
+import asyncio
+import random
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from llm.scheduler import AdmissionScheduler
+
+
+class ServiceError(Exception):
+    def __init__(self, status_code: int, retry_after: str = None):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.response = SimpleNamespace(headers={"retry-after": retry_after} if retry_after else {})
+
+
+@pytest.fixture
+def upper_jitter(monkeypatch):
+    """Make the full jitter always pick its upper bound."""
+    monkeypatch.setattr(random, 'uniform', lambda low, high: high)
+
+
+@pytest.mark.parametrize("attempt, expected", [(0, 1.0), (1, 2.0), (3, 8.0), (5, 30.0), (10, 30.0)])
+def test_backoff_grows_exponentially_up_to_the_cap(upper_jitter, attempt, expected):
+    scheduler = AdmissionScheduler(backoff_base=1.0, backoff_cap=30.0)
+
+    assert scheduler.backoff_delay(attempt) == expected
+
+
+def test_backoff_is_jittered_below_the_bound():
+    scheduler = AdmissionScheduler(backoff_base=1.0, backoff_cap=30.0)
+
+    delays = [scheduler.backoff_delay(3) for _ in range(200)]
+
+    assert all(0 <= delay <= 8.0 for delay in delays)
+    assert len(set(delays)) > 1
+
+
+def test_backoff_honours_retry_after(upper_jitter):
+    scheduler = AdmissionScheduler(backoff_base=1.0, backoff_cap=30.0)
+
+    assert scheduler.backoff_delay(0, retry_after=12.0) == 12.0
+    assert scheduler.backoff_delay(4, retry_after=1.0) == 16.0
+
+
+@pytest.mark.parametrize("status, attempt, retry", [(429, 0, True), (503, 1, True), (500, 3, True), (429, 4, False), (400, 0, False)])
+def test_should_retry(status, attempt, retry):
+    scheduler = AdmissionScheduler(max_retries=4)
+
+    assert scheduler.should_retry(ServiceError(status), attempt) == retry
+
+
+def test_rate_limit_pauses_every_admission():
+    scheduler = AdmissionScheduler(backoff_base=0.01, backoff_cap=0.01)
+
+    async def run() -> float:
+        backoff = asyncio.create_task(scheduler.backoff(0, ServiceError(429, retry_after="0.2")))
+        await asyncio.sleep(0)
+        started = time.monotonic()
+        ticket = await scheduler.acquire(10, client="other-session")
+        waited = time.monotonic() - started
+        scheduler.release(ticket)
+        await backoff
+        return waited
+
+    assert asyncio.run(run()) >= 0.15
+    assert scheduler.stats()["rate_limited"] == 1
+    assert scheduler.stats()["retries"] == 1
+
+
+def test_server_error_backoff_does_not_pause_others():
+    scheduler = AdmissionScheduler(backoff_base=0.5, backoff_cap=0.5)
+
+    async def run() -> float:
+        backoff = asyncio.create_task(scheduler.backoff(0, ServiceError(503)))
+        await asyncio.sleep(0)
+        started = time.monotonic()
+        ticket = await scheduler.acquire(10, client="other-session")
+        waited = time.monotonic() - started
+        scheduler.release(ticket)
+        backoff.cancel()
+        return waited
+
+    assert asyncio.run(run()) < 0.1
+    assert scheduler.stats()["rate_limited"] == 0
@@ -0,0 +1,106 @@
+import asyncio
+
+from models.resume_models import ResumeData
+from rendering import render_affinity
+from tailoring import JobTarget, build_tailoring_graph, tailor_resumes
+
+
+class FakeStructuredModel:
+    """Stands in for model.with_structured_output(ResumeData): renames the resume after the posting."""
+    def __init__(self, base: ResumeData):
+        self.base = base
+
+    def with_structured_output(self, schema, **kwargs):
+        return self
+
+    def with_config(self, **kwargs):
+        return self
+
+    async def ainvoke(self, messages):
+        title = messages[1].content.split("\n", 1)[0].removeprefix("Job posting: ")
+        if title == "model fails":
+            raise RuntimeError("model unavailable")
+        return self.base.model_copy(update={'header': self.base.header.model_copy(update={'name': title})})
+
+
+class FakeRenderer:
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, resume_data: ResumeData) -> tuple[bytes, str]:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            if resume_data.header.name == "render fails":
+                raise ValueError("render failed")
+            return f"%PDF {resume_data.header.name}".encode(), "The resume fits on one page."
+        finally:
+            self.in_flight -= 1
+
+
+def run_tailoring(resume, titles, max_parallel=None, renderer=None):
+    renderer = renderer or FakeRenderer()
+    graph = build_tailoring_graph(FakeStructuredModel(resume), renderer)
+    targets = [JobTarget(title=title, description=f"Description of {title}") for title in titles]
+    return asyncio.run(tailor_resumes(graph, resume, targets, max_parallel))
+
+
+def test_every_target_gets_its_own_result_in_order(resume):
+    titles = ["Data Engineer", "Backend Engineer", "Analyst"]
+
+    results = run_tailoring(resume, titles)
+
+    assert [result.index for result in results] == [0, 1, 2]
+    assert [result.target.title for result in results] == titles
+    assert [result.resume_data.header.name for result in results] == titles
+    assert [result.pdf_bytes for result in results] == [f"%PDF {title}".encode() for title in titles]
+    assert all(result.ok and not result.error for result in results)
+
+
+def test_failing_branches_do_not_affect_the_others(resume):
+    results = run_tailoring(resume, ["Data Engineer", "model fails", "render fails", "Analyst"])
+
+    assert [result.ok for result in results] == [True, False, False, True]
+    assert results[1].error == "model unavailable"
+    assert results[1].resume_data is None
+    assert results[2].error == "render failed"
+    assert results[2].pdf_bytes is None
+    assert results[3].pdf_bytes == b"%PDF Analyst"
+
+
+def test_base_resume_is_shared_but_not_modified(resume):
+    before = resume.model_dump()
+
+    results = run_tailoring(resume, ["Data Engineer", "Analyst"])
+
+    assert resume.model_dump() == before
+    assert results[0].resume_data is not results[1].resume_data
+
+
+def test_max_parallel_bounds_branches_in_flight(resume):
+    renderer = FakeRenderer()
+
+    results = run_tailoring(resume, [f"Role {index}" for index in range(6)], max_parallel=2, renderer=renderer)
+
+    assert len(results) == 6
+    assert renderer.max_in_flight == 2
+
+
+def test_branches_render_without_session_affinity(resume):
+    affinities = []
+
+    async def render(resume_data: ResumeData) -> tuple[bytes, str]:
+        affinities.append(render_affinity.get())
+        return b"%PDF", "The resume fits on one page."
+
+    async def run():
+        render_affinity.set("session")
+        graph = build_tailoring_graph(FakeStructuredModel(resume), render)
+        targets = [JobTarget(title=title, description=title) for title in ("Data Engineer", "Analyst")]
+        await tailor_resumes(graph, resume, targets)
+        return render_affinity.get()
+
+    assert asyncio.run(run()) == "session"
+    assert affinities == [None, None]